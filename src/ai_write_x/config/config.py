@@ -210,6 +210,101 @@ class Config:
             "auto_publish": False,
             "article_format": "html",
             "format_publish": True,
+            # 批量生成配置
+            "batch": {
+                "max_workers": 3,  # 并发生成的文章数上限
+                "default_provider_limit": 2,  # 未单独配置的LLM提供商并发上限
+                "provider_limits": {},  # 按提供商配置并发上限，如 {"OpenRouter": 1}
+                "top_k": 5,  # 热搜模式下选取的话题数
+            },
+            # Web任务队列配置
+            "job_queue": {
+                "worker_count": 2,  # 同时执行的任务数
+                "poll_interval": 1.0,  # 空闲时轮询队列的间隔（秒）
+                "schedule_interval": 30.0,  # 检查定时任务的间隔（秒）
+            },
+            # 常驻工作进程池配置
+            "worker_pool": {
+                "enabled": True,  # 关闭后每个任务单独启动子进程
+                "size": 2,  # 常驻进程数
+                "max_jobs_per_worker": 20,  # 单个进程执行多少任务后重启，0 表示不重启
+            },
+            # LLM结果缓存配置（相同工作流、提示词和模型时复用结果）
+            "llm_cache": {
+                "enabled": False,
+                "ttl": 86400,  # 缓存有效期（秒），0 表示不过期
+                "max_size_mb": 200,  # 缓存目录大小上限，超出后淘汰最久未使用的条目
+            },
+            # 阶段检查点配置（失败后可从未完成的阶段恢复）
+            "checkpoint": {
+                "enabled": True,
+                "keep_completed": False,  # 成功完成后是否保留检查点
+                "keep_days": 7,  # 检查点保留天数
+            },
+            # 进程级LLM实例池（各阶段、各次执行共享客户端与连接）
+            "llm_pool": {
+                "idle_timeout": 1800,  # 闲置超过该秒数的实例被释放，0 表示不释放
+            },
+            # 流式输出配置（生成过程中逐段推送正文到Web端）
+            "streaming": {
+                "enabled": False,
+                "agents": ["writer", "designer"],  # 需要流式输出的智能体
+            },
+            # 多平台模式：基础内容只生成一次，再并发适配到各个平台
+            "multi_platform": {
+                "platforms": [],  # 为空时只面向 publish_platform 执行单平台流程
+                "max_workers": 4,  # 并发适配的平台数上限
+            },
+            # 热搜快照缓存（后台定时刷新全部平台，话题选择直接读取快照）
+            "hotnews": {
+                "cache_enabled": True,
+                "refresh_interval": 600,  # 后台刷新间隔（秒）
+                "max_age": 1800,  # 快照超过该时长视为过期，使用时同步刷新
+                "snapshot_size": 30,  # 每个平台保存的话题数
+                "keep_snapshots": 24,  # 磁盘上保留的快照数
+                "race_sources": True,  # 并发请求各热搜来源，采用最先返回的有效结果
+                "topic_index": True,  # 合并各平台热榜去重打分后选题，关闭则随机选平台再选题
+                "dedup_threshold": 0.5,  # 标题字符2-gram相似度超过该值视为同一话题
+            },
+            # 话题历史（选题时跳过或降权近期已写过的话题）
+            "topic_history": {
+                "enabled": True,
+                "window_days": 7,  # 只比较最近若干天写过的话题，0 表示不限
+                "threshold": 0.6,  # 与已写话题的相似度超过该值视为已写过
+                "penalty": 0.0,  # 已写话题的权重系数，0 表示直接跳过
+                "keep_days": 90,  # 写入新话题时清理超过该天数的记录，0 表示不清理
+            },
+            # 无头浏览器池（参考链接动态页面兜底）
+            "browser_pool": {
+                "max_tabs": 4,  # 同时打开的标签页上限
+                "ready_timeout": 15,  # 等待正文出现的最长秒数
+                # 出现任一正文容器即视为页面就绪
+                "ready_selector": "article, #js_content, .article-content, main p, .content p",
+            },
+            # 网页缓存（参考链接解析结果与搜索结果）
+            "web_cache": {
+                "enabled": True,
+                "page_ttl": 86400,  # 页面缓存有效期（秒），过期后带 ETag/Last-Modified 校验
+                "search_ttl": 1800,  # 搜索结果缓存有效期（秒），0 表示不过期
+                "max_size_mb": 100,  # 缓存目录大小上限，超出后淘汰最久未使用的条目
+            },
+            # 搜索预取（话题确定后即在后台开始搜索或提取参考链接）
+            "search_prefetch": {
+                "enabled": True,
+            },
+            # 搜索上下文（提供给写作 Agent 的搜索/参考文章结果）
+            "search_context": {
+                "max_tokens": 3000,  # 上下文 token 预算
+                "relevance_weight": 0.6,  # 排序时相关性所占权重，其余为时效性
+                "recency_half_life_days": 7,  # 时效性得分减半所需天数
+                "dedup_threshold": 0.8,  # 正文相似度超过该值视为重复结果
+                "encoding": "cl100k_base",  # tiktoken 编码，用于估算 token 数
+            },
+            # 模板索引（模板及压缩结果常驻内存）
+            "template_index": {
+                "check_interval": 10,  # 按修改时间校验模板文件的最小间隔（秒）
+                "svg_precision": 1,  # 瘦身时 SVG 路径数值保留的小数位数
+            },
             # 维度化创意配置
             "dimensional_creative": {
                 "enabled": True,
@@ -1435,6 +1530,7 @@ class Config:
         self.reference_ratio = 0.0  # 文章借鉴比例[0-1]
         self.custom_template_category = ""  # 自定义话题时，模板分类
         self.custom_template = ""  # 自定义话题时，模板
+        self.publish_platforms = []  # 本次任务需适配的平台，覆盖 multi_platform.platforms
         self.current_preview_cover = ""  # 当前设置的封面
 
     @classmethod
@@ -1618,6 +1714,90 @@ class Config:
                 raise ValueError("配置未加载")
             return self.config["publish_platform"]
 
+    def _get_section_config(self, section: str) -> Dict[str, Any]:
+        """获取分段配置，缺失字段使用默认值补齐"""
+        with self._lock:
+            if not self.config:
+                raise ValueError("配置未加载")
+            section_config = deepcopy(self.default_config.get(section, {}))
+            section_config.update(self.config.get(section) or {})
+            return section_config
+
+    @property
+    def batch_config(self):
+        """批量生成配置"""
+        return self._get_section_config("batch")
+
+    @property
+    def job_queue_config(self):
+        """Web任务队列配置"""
+        return self._get_section_config("job_queue")
+
+    @property
+    def worker_pool_config(self):
+        """常驻工作进程池配置"""
+        return self._get_section_config("worker_pool")
+
+    @property
+    def llm_cache_config(self):
+        """LLM结果缓存配置"""
+        return self._get_section_config("llm_cache")
+
+    @property
+    def checkpoint_config(self):
+        """阶段检查点配置"""
+        return self._get_section_config("checkpoint")
+
+    @property
+    def llm_pool_config(self):
+        """LLM实例池配置"""
+        return self._get_section_config("llm_pool")
+
+    @property
+    def streaming_config(self):
+        """流式输出配置"""
+        return self._get_section_config("streaming")
+
+    @property
+    def multi_platform_config(self):
+        """多平台模式配置"""
+        return self._get_section_config("multi_platform")
+
+    @property
+    def hotnews_config(self):
+        """热搜快照缓存配置"""
+        return self._get_section_config("hotnews")
+
+    @property
+    def topic_history_config(self):
+        """话题历史配置"""
+        return self._get_section_config("topic_history")
+
+    @property
+    def browser_pool_config(self):
+        """无头浏览器池配置"""
+        return self._get_section_config("browser_pool")
+
+    @property
+    def web_cache_config(self):
+        """网页缓存配置"""
+        return self._get_section_config("web_cache")
+
+    @property
+    def search_prefetch_config(self):
+        """搜索预取配置"""
+        return self._get_section_config("search_prefetch")
+
+    @property
+    def search_context_config(self):
+        """搜索上下文配置"""
+        return self._get_section_config("search_context")
+
+    @property
+    def template_index_config(self):
+        """模板索引配置"""
+        return self._get_section_config("template_index")
+
     @property
     def creative_config(self):
         """获取维度化创意配置"""
@@ -4,6 +4,8 @@ from crewai import Agent, LLM
 from src.ai_write_x.core.base_framework import AgentConfig
 from src.ai_write_x.config.config import Config
 from src.ai_write_x.core.tool_registry import GlobalToolRegistry
+from src.ai_write_x.core.llm_pool import LLMPool
+from src.ai_write_x.core.streaming import StreamRelay
 from src.ai_write_x.utils import log
 
 
@@ -14,7 +16,8 @@ class AgentFactory:
         self._agent_templates: Dict[str, Type] = {}
         # 使用全局工具注册表
         self._tool_registry = GlobalToolRegistry.get_instance()
-        self._llm_cache: Dict[str, LLM] = {}
+        # LLM实例由进程级实例池管理，跨引擎、跨执行复用
+        self._llm_pool = LLMPool.get_instance()
 
     def register_agent_template(self, name: str, template_class: Type):
         """注册智能体模板"""
@@ -24,39 +27,42 @@ class AgentFactory:
         """注册工具类"""
         self._tool_registry.register_tool(name, tool_class)
 
-    def _get_llm(self, llm_config: Dict[str, Any] | None = None) -> Optional[LLM]:
-        """获取LLM实例，支持缓存"""
+    def _get_llm(
+        self, llm_config: Dict[str, Any] | None = None, stream: bool = False
+    ) -> Optional[LLM]:
+        """获取LLM实例，从进程级实例池复用；stream 为 True 时获取流式输出的实例"""
         config = Config.get_instance()
 
         # 如果没有指定特殊配置，使用全局配置
         if not llm_config:
-            cache_key = f"{config.api_type}_{config.api_model}_{config.api_apibase}"
-            if cache_key not in self._llm_cache:
-                if config.api_key:
-                    self._llm_cache[cache_key] = LLM(
-                        model=config.api_model,
-                        api_key=config.api_key,
-                        max_tokens=8192,
-                        base_url=config.api_apibase,
-                        timeout=config.api_timeout,
-                    )
-                else:
-                    return None
-            return self._llm_cache.get(cache_key)
+            if not config.api_key:
+                return None
+            llm_kwargs = {
+                "model": config.api_model,
+                "api_key": config.api_key,
+                "max_tokens": 8192,
+                "base_url": config.api_apibase,
+                "timeout": config.api_timeout,
+            }
+            if stream:
+                llm_kwargs["stream"] = True
+            return self._llm_pool.get(llm_kwargs, StreamRelay.llm_class() if stream else LLM)
 
         # 使用自定义LLM配置
         normalized_config = dict(llm_config)
         if "base_url" not in normalized_config and normalized_config.get("api_base"):
             normalized_config.setdefault("base_url", normalized_config["api_base"])
         normalized_config.setdefault("timeout", config.api_timeout)
-        cache_key = (
-            f"{normalized_config.get('model', 'default')}"
-            f"_{normalized_config.get('api_key', 'default')}"
-            f"_{normalized_config.get('base_url', '')}"
-        )
-        if cache_key not in self._llm_cache:
-            self._llm_cache[cache_key] = LLM(**normalized_config)
-        return self._llm_cache[cache_key]
+        if stream:
+            normalized_config["stream"] = True
+        return self._llm_pool.get(normalized_config, StreamRelay.llm_class() if stream else LLM)
+
+    def _should_stream(self, agent_name: str) -> bool:
+        """是否为该智能体开启流式输出"""
+        streaming_config = Config.get_instance().streaming_config
+        if not streaming_config["enabled"] or agent_name not in streaming_config["agents"]:
+            return False
+        return StreamRelay.install()
 
     def create_agent(self, config: AgentConfig, custom_llm: LLM | None = None) -> Agent:
         """创建智能体实例"""
@@ -89,7 +95,7 @@ class AgentFactory:
             agent_kwargs["response_template"] = config.response_template
 
         # LLM优先级：自定义LLM > 配置中的LLM > 全局LLM
-        llm = custom_llm or self._get_llm(config.llm_config)
+        llm = custom_llm or self._get_llm(config.llm_config, self._should_stream(config.name))
         if llm:
             agent_kwargs["llm"] = llm
 
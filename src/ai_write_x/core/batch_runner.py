@@ -0,0 +1,122 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Any, Optional
+
+from src.ai_write_x.config.config import Config
+from src.ai_write_x.core.monitoring import WorkflowMonitor
+from src.ai_write_x.core.system_init import setup_aiwritex
+from src.ai_write_x.utils import log
+
+
+@dataclass
+class BatchTask:
+    """批量生成中的单个话题任务"""
+
+    topic: str
+    platform: str = ""
+    urls: List[str] = field(default_factory=list)
+    reference_ratio: float = 0.0
+
+
+@dataclass
+class BatchResult:
+    """单个话题任务的执行结果"""
+
+    topic: str
+    success: bool
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    duration: float = 0.0
+
+
+class BatchContentRunner:
+    """
+    多话题并发生成器：所有话题在同一事件循环中异步执行（等待LLM时不占用线程）。
+    工作流使用当前配置的LLM提供商，并发数同时受总上限和该提供商的上限约束
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        provider_limits: Dict[str, int] | None = None,
+        default_provider_limit: int | None = None,
+    ):
+        batch_config = Config.get_instance().batch_config
+        self.max_workers = max(1, max_workers or batch_config["max_workers"])
+        self.provider_limits = dict(batch_config["provider_limits"])
+        self.provider_limits.update(provider_limits or {})
+        self.default_provider_limit = max(
+            1, default_provider_limit or batch_config["default_provider_limit"]
+        )
+        self.monitor = WorkflowMonitor.get_instance()
+
+    def get_concurrency(self, task_count: int) -> int:
+        """实际并发数：不超过总上限、当前LLM提供商的上限和话题数"""
+        provider = Config.get_instance().api_type
+        provider_limit = int(self.provider_limits.get(provider, self.default_provider_limit))
+        return max(1, min(self.max_workers, provider_limit, task_count))
+
+    async def _run_task(self, task: BatchTask) -> BatchResult:
+        """执行单个话题，每个任务使用独立的工作流实例，避免共享状态"""
+        start_time = time.time()
+        log.print_log(f"[批量] 开始生成：{task.topic}")
+        try:
+            workflow = setup_aiwritex()
+            result = await workflow.execute_async(
+                topic=task.topic,
+                platform=task.platform,
+                urls=task.urls,
+                reference_ratio=task.reference_ratio,
+            )
+            return BatchResult(
+                topic=task.topic,
+                success=True,
+                result=result,
+                duration=time.time() - start_time,
+            )
+        except Exception as e:
+            log.print_log(f"[批量] 《{task.topic}》生成失败：{str(e)}", "error")
+            return BatchResult(
+                topic=task.topic,
+                success=False,
+                error=str(e),
+                duration=time.time() - start_time,
+            )
+
+    def run(self, tasks: List[BatchTask]) -> List[BatchResult]:
+        """并发执行所有话题，结果按输入顺序返回"""
+        if not tasks:
+            return []
+        return asyncio.run(self.run_async(tasks))
+
+    async def run_async(self, tasks: List[BatchTask]) -> List[BatchResult]:
+        """在当前事件循环中并发执行所有话题，结果按输入顺序返回"""
+        if not tasks:
+            return []
+
+        start_time = time.time()
+        workers = self.get_concurrency(len(tasks))
+        log.print_log(f"[批量] 共 {len(tasks)} 个话题，并发数 {workers}")
+
+        limiter = asyncio.Semaphore(workers)
+
+        async def run_limited(task: BatchTask) -> BatchResult:
+            async with limiter:
+                return await self._run_task(task)
+
+        results = await asyncio.gather(*(run_limited(task) for task in tasks))
+
+        success_count = sum(1 for r in results if r and r.success)
+        duration = time.time() - start_time
+        self.monitor.track_execution(
+            "batch_workflow",
+            duration,
+            success_count == len(tasks),
+            {"topics": [task.topic for task in tasks]},
+        )
+        log.print_log(
+            f"[批量] 完成 {success_count}/{len(tasks)} 篇，总耗时 {duration:.1f} 秒", "status"
+        )
+
+        return list(results)
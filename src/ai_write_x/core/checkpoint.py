@@ -0,0 +1,163 @@
+import json
+import os
+import shutil
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+from src.ai_write_x.core.base_framework import ContentResult, ContentType
+from src.ai_write_x.utils.path_manager import PathManager
+
+
+# 统一执行流程的阶段，按执行顺序排列
+STAGES = ["base_content", "final_content", "transform_content", "save_result", "publish_result"]
+
+
+def content_result_to_dict(result: ContentResult) -> Dict[str, Any]:
+    return {
+        "title": result.title,
+        "content": result.content,
+        "summary": result.summary,
+        "content_format": result.content_format,
+        "metadata": result.metadata,
+        "created_at": result.created_at.isoformat(),
+        "content_type": result.content_type.value,
+    }
+
+
+def content_result_from_dict(data: Dict[str, Any]) -> ContentResult:
+    return ContentResult(
+        title=data["title"],
+        content=data["content"],
+        summary=data.get("summary", ""),
+        content_format=data.get("content_format", "markdown"),
+        metadata=data.get("metadata", {}),
+        created_at=datetime.fromisoformat(data["created_at"]),
+        content_type=ContentType(data.get("content_type", ContentType.ARTICLE.value)),
+    )
+
+
+class RunCheckpoint:
+    """单次执行的阶段检查点，保存在 data/checkpoints/<run_id>/ 下"""
+
+    def __init__(self, run_id: str, base_dir: Path | None = None):
+        self.run_id = run_id
+        self.run_dir = (base_dir or self.get_base_dir()) / run_id
+
+    @staticmethod
+    def get_base_dir() -> Path:
+        base_dir = PathManager.get_data_dir() / "checkpoints"
+        base_dir.mkdir(parents=True, exist_ok=True)
+        return base_dir
+
+    @classmethod
+    def create(cls, topic: str, params: Dict[str, Any]) -> "RunCheckpoint":
+        """新建检查点并记录执行参数，便于之后恢复"""
+        checkpoint = cls(f"{datetime.now():%Y%m%d%H%M%S}_{uuid.uuid4().hex[:8]}")
+        checkpoint.run_dir.mkdir(parents=True, exist_ok=True)
+        checkpoint._write_json(
+            "meta",
+            {
+                "run_id": checkpoint.run_id,
+                "topic": topic,
+                "params": params,
+                "status": "running",
+                "created_at": time.time(),
+                "updated_at": time.time(),
+            },
+        )
+        return checkpoint
+
+    @classmethod
+    def load(cls, run_id: str) -> "RunCheckpoint":
+        checkpoint = cls(run_id)
+        if not (checkpoint.run_dir / "meta.json").exists():
+            raise ValueError(f"检查点不存在: {run_id}")
+        return checkpoint
+
+    def _write_json(self, name: str, data: Any):
+        path = self.run_dir / f"{name}.json"
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+        os.replace(tmp_path, path)
+
+    def _read_json(self, name: str) -> Any:
+        with open(self.run_dir / f"{name}.json", "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    @property
+    def meta(self) -> Dict[str, Any]:
+        return self._read_json("meta")
+
+    def update_status(self, status: str, error: str | None = None):
+        meta = self.meta
+        meta.update({"status": status, "error": error, "updated_at": time.time()})
+        self._write_json("meta", meta)
+
+    def task_config(self) -> Dict[str, Any]:
+        """恢复执行时应用的任务配置：话题、参考链接和模板沿用首次执行时的设置"""
+        meta = self.meta
+        params = meta.get("params", {})
+        kwargs = params.get("kwargs", {})
+        return {
+            "custom_topic": meta.get("topic", ""),
+            "urls": kwargs.get("urls", []),
+            "reference_ratio": kwargs.get("reference_ratio", 0.0),
+            "custom_template_category": params.get("template_category", ""),
+            "custom_template": params.get("template", ""),
+        }
+
+    def has(self, stage: str) -> bool:
+        return (self.run_dir / f"{stage}.json").exists()
+
+    def save(self, stage: str, value: Any):
+        """保存阶段结果，ContentResult 与普通字典均可"""
+        if isinstance(value, ContentResult):
+            data = {"kind": "content_result", "value": content_result_to_dict(value)}
+        else:
+            data = {"kind": "raw", "value": value}
+        self._write_json(stage, data)
+
+    def get(self, stage: str) -> Any:
+        data = self._read_json(stage)
+        if data.get("kind") == "content_result":
+            return content_result_from_dict(data["value"])
+        return data.get("value")
+
+    def first_incomplete_stage(self) -> Optional[str]:
+        return next((stage for stage in STAGES if not self.has(stage)), None)
+
+    def remove(self):
+        shutil.rmtree(self.run_dir, ignore_errors=True)
+
+    @classmethod
+    def list_runs(cls, status: str | None = None) -> List[Dict[str, Any]]:
+        """列出检查点，按更新时间倒序"""
+        runs = []
+        for meta_path in cls.get_base_dir().glob("*/meta.json"):
+            try:
+                checkpoint = cls(meta_path.parent.name)
+                meta = checkpoint.meta
+            except (OSError, ValueError):
+                continue
+            if status and meta.get("status") != status:
+                continue
+            meta["next_stage"] = checkpoint.first_incomplete_stage()
+            runs.append(meta)
+        return sorted(runs, key=lambda m: m.get("updated_at", 0), reverse=True)
+
+    @classmethod
+    def prune(cls, keep_days: float):
+        """清理超过保留天数的检查点"""
+        if keep_days <= 0:
+            return
+        expire_before = time.time() - keep_days * 86400
+        for run_dir in cls.get_base_dir().iterdir():
+            try:
+                if run_dir.is_dir() and run_dir.stat().st_mtime < expire_before:
+                    shutil.rmtree(run_dir, ignore_errors=True)
+            except OSError:
+                continue
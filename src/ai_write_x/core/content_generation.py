@@ -1,16 +1,23 @@
+import asyncio
+import contextvars
 import time
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from crewai import Crew, Process, Task, Agent
 from src.ai_write_x.core.base_framework import (
     BaseWorkflowFramework,
     WorkflowConfig,
+    TaskConfig,
     ContentResult,
     WorkflowType,
 )
 from src.ai_write_x.core.agent_factory import AgentFactory
 from src.ai_write_x.core.monitoring import WorkflowMonitor
+from src.ai_write_x.core.llm_cache import LLMResponseCache
+from src.ai_write_x.core.streaming import StreamRelay
 from src.ai_write_x.utils.content_parser import ContentParser
 from src.ai_write_x.utils import utils
+from src.ai_write_x.utils import log
 
 
 class ContentGenerationEngine(BaseWorkflowFramework):
@@ -19,6 +26,7 @@ class ContentGenerationEngine(BaseWorkflowFramework):
     def __init__(self, config: WorkflowConfig):
         super().__init__(config)
         self.agent_factory = AgentFactory()
+        self.task_levels: List[List[Task]] = []
         # 添加监控器
         self.monitor = WorkflowMonitor.get_instance()
 
@@ -31,23 +39,61 @@ class ContentGenerationEngine(BaseWorkflowFramework):
         return agents
 
     def setup_tasks(self) -> Dict[str, Task]:
-        """设置任务"""
+        """设置任务；并行工作流按 context 依赖分层（同层任务由 _kickoff_levels 并发执行）"""
+        parallel = self.config.workflow_type == WorkflowType.PARALLEL
+        levels = self._plan_task_levels(self.config.tasks) if parallel else [self.config.tasks]
+
         tasks = {}
-        for task_config in self.config.tasks:
-            # 动态创建任务
-            task = Task(
-                description=task_config.description,
-                expected_output=task_config.expected_output,
-                agent=self.agents[task_config.agent_name],
-            )
+        for level in levels:
+            level_agents = set()
+            for task_config in level:
+                agent = self.agents[task_config.agent_name]
+                if parallel and task_config.agent_name in level_agents:
+                    # 同层任务并发执行，共用的智能体复制一份，避免执行器状态互相覆盖
+                    agent = agent.copy()
+                level_agents.add(task_config.agent_name)
+
+                # 动态创建任务
+                task = Task(
+                    description=task_config.description,
+                    expected_output=task_config.expected_output,
+                    agent=agent,
+                    async_execution=task_config.async_execution and not parallel,
+                )
 
-            # 设置上下文依赖
-            if task_config.context:
-                task.context = [tasks[ctx] for ctx in task_config.context if ctx in tasks]
+                # 设置上下文依赖
+                if task_config.context:
+                    task.context = [tasks[ctx] for ctx in task_config.context if ctx in tasks]
+                elif parallel:
+                    # 并行工作流中无依赖的任务不接收前序任务的输出
+                    task.context = []
 
-            tasks[task_config.name] = task
+                tasks[task_config.name] = task
+
+        self.task_levels = [[tasks[t.name] for t in level] for level in levels]
         return tasks
 
+    @staticmethod
+    def _plan_task_levels(task_configs: List[TaskConfig]) -> List[List[TaskConfig]]:
+        """按 context 依赖对任务做拓扑分层，同层任务互不依赖；未定义的依赖名忽略"""
+        names = {task_config.name for task_config in task_configs}
+        pending = {
+            task_config.name: {ctx for ctx in task_config.context if ctx in names}
+            for task_config in task_configs
+        }
+
+        levels = []
+        done = set()
+        while pending:
+            level = [t for t in task_configs if t.name in pending and pending[t.name] <= done]
+            if not level:
+                raise ValueError(f"任务依赖存在循环: {sorted(pending)}")
+            for task_config in level:
+                del pending[task_config.name]
+                done.add(task_config.name)
+            levels.append(level)
+        return levels
+
     def execute_workflow(self, input_data: Dict[str, Any]) -> ContentResult:
         """执行工作流并记录监控数据"""
         start_time = time.time()
@@ -55,51 +101,14 @@ class ContentGenerationEngine(BaseWorkflowFramework):
 
         try:
             self.validate_config()
-            self.agents = self.setup_agents()
-            self.tasks = self.setup_tasks()
-
-            # 根据工作流类型选择执行策略
-            process_map = {
-                WorkflowType.SEQUENTIAL: Process.sequential,
-                WorkflowType.HIERARCHICAL: Process.hierarchical,
-                WorkflowType.PARALLEL: Process.sequential,  # CrewAI暂不支持真正的并行
-                WorkflowType.CUSTOM: Process.sequential,
-            }
-
-            process = process_map.get(self.config.workflow_type, Process.sequential)
-
-            crew = Crew(
-                agents=list(self.agents.values()),
-                tasks=list(self.tasks.values()),
-                process=process,
-                verbose=True,
-            )
-
-            result = crew.kickoff(inputs=input_data)
-            result = utils.remove_code_blocks(str(result))
-            if input_data.get("parse_result", True):
-                parsed_result = self._parse_result(result, input_data)
-                if not parsed_result.title or parsed_result.title.lower() == "untitled":
-                    parsed_result.title = input_data.get("title", None) or input_data.get(
-                        "topic", "无标题"
-                    )
 
-            else:
-                parsed_result = ContentResult(
-                    title=input_data.get("title", None) or input_data.get("topic", "无标题"),
-                    content=result,
-                    summary="",
-                    content_type=self.config.content_type,
-                    content_format=input_data.get("content_format", "html"),
-                    metadata={
-                        "workflow_name": self.config.name,
-                        "input_data": input_data,
-                        "agent_count": len(self.agents),
-                        "task_count": len(self.tasks),
-                        "parsing_confidence": 1.0,
-                    },
-                )
+            cache, cache_key, result = self._lookup_cache(input_data)
+            if result is None:
+                result = self._kickoff(input_data)
+                if cache:
+                    cache.set(cache_key, result, self.config.name)
 
+            parsed_result = self._to_content_result(result, input_data)
             success = True
             return parsed_result
         except Exception as e:
@@ -110,6 +119,156 @@ class ContentGenerationEngine(BaseWorkflowFramework):
             duration = time.time() - start_time
             self.monitor.track_execution(self.config.name, duration, success)
 
+    async def execute_workflow_async(self, input_data: Dict[str, Any]) -> ContentResult:
+        """execute_workflow 的异步版本，等待LLM期间不占用事件循环"""
+        start_time = time.time()
+        success = False
+
+        try:
+            self.validate_config()
+
+            # 计算缓存键可能需要等待预取的搜索结果，放到线程中避免阻塞事件循环
+            cache, cache_key, result = await asyncio.to_thread(self._lookup_cache, input_data)
+            if result is None:
+                result = await self._kickoff_async(input_data)
+                if cache:
+                    cache.set(cache_key, result, self.config.name)
+
+            parsed_result = self._to_content_result(result, input_data)
+            success = True
+            return parsed_result
+        except Exception as e:
+            self.monitor.log_error(self.config.name, str(e), input_data)
+            raise
+        finally:
+            duration = time.time() - start_time
+            self.monitor.track_execution(self.config.name, duration, success)
+
+    def _lookup_cache(self, input_data: Dict[str, Any]) -> Tuple[Any, str, Optional[str]]:
+        """
+        相同的工作流、提示词、输入、模型和工具输入直接复用缓存结果，返回 (缓存, 缓存键, 结果)；
+        结果依赖无法预知的工具输入时不使用缓存
+        """
+        if not LLMResponseCache.is_enabled():
+            return None, "", None
+        cache_key = LLMResponseCache.make_key(self.config, input_data)
+        if cache_key is None:
+            return None, "", None
+
+        cache = LLMResponseCache.get_instance()
+        result = cache.get(cache_key)
+        if result is not None:
+            log.print_log(f"工作流 {self.config.name} 命中缓存，跳过LLM调用")
+        return cache, cache_key, result
+
+    def _to_content_result(self, result: str, input_data: Dict[str, Any]) -> ContentResult:
+        """将Crew输出转换为 ContentResult"""
+        if input_data.get("parse_result", True):
+            parsed_result = self._parse_result(result, input_data)
+            if not parsed_result.title or parsed_result.title.lower() == "untitled":
+                parsed_result.title = input_data.get("title", None) or input_data.get(
+                    "topic", "无标题"
+                )
+            return parsed_result
+
+        return ContentResult(
+            title=input_data.get("title", None) or input_data.get("topic", "无标题"),
+            content=result,
+            summary="",
+            content_type=self.config.content_type,
+            content_format=input_data.get("content_format", "html"),
+            metadata={
+                "workflow_name": self.config.name,
+                "input_data": input_data,
+                "agent_count": len(self.config.agents),
+                "task_count": len(self.config.tasks),
+                "parsing_confidence": 1.0,
+            },
+        )
+
+    def _build_crew(self) -> Crew:
+        """创建智能体和任务并组装Crew"""
+        self.agents = self.setup_agents()
+        self.tasks = self.setup_tasks()
+
+        # 根据工作流类型选择执行策略
+        process_map = {
+            WorkflowType.SEQUENTIAL: Process.sequential,
+            WorkflowType.HIERARCHICAL: Process.hierarchical,
+            WorkflowType.PARALLEL: Process.sequential,  # 并行工作流由 _kickoff_levels 按层执行
+            WorkflowType.CUSTOM: Process.sequential,
+        }
+
+        process = process_map.get(self.config.workflow_type, Process.sequential)
+
+        return Crew(
+            agents=list(self.agents.values()),
+            tasks=list(self.tasks.values()),
+            process=process,
+            verbose=True,
+        )
+
+    def _build_level_crews(self) -> List[List[Crew]]:
+        """并行工作流：每个任务组成单任务 Crew，按依赖层分组"""
+        self.agents = self.setup_agents()
+        self.tasks = self.setup_tasks()
+        return [
+            [
+                Crew(agents=[task.agent], tasks=[task], process=Process.sequential, verbose=True)
+                for task in level
+            ]
+            for level in self.task_levels
+        ]
+
+    def _kickoff_levels(self, input_data: Dict[str, Any]) -> Any:
+        """
+        逐层执行并行工作流，同层的单任务 Crew 在线程中并发执行；下一层任务通过 context
+        读取上一层任务的输出。CrewAI 的顺序执行在同步任务前会等待全部异步任务，
+        无法让同层任务真正重叠，因此不使用 async_execution
+        """
+        result = None
+        for level in self._build_level_crews():
+            if len(level) == 1:
+                result = level[0].kickoff(inputs=input_data)
+                continue
+            with ThreadPoolExecutor(max_workers=len(level)) as executor:
+                # 每个线程复制一份上下文，流式片段仍标记为当前阶段
+                futures = [
+                    executor.submit(contextvars.copy_context().run, crew.kickoff, input_data)
+                    for crew in level
+                ]
+                result = [future.result() for future in futures][-1]
+        return result
+
+    async def _kickoff_levels_async(self, input_data: Dict[str, Any]) -> Any:
+        """_kickoff_levels 的异步版本"""
+        result = None
+        for level in self._build_level_crews():
+            outputs = await asyncio.gather(
+                *(crew.kickoff_async(inputs=input_data) for crew in level)
+            )
+            result = outputs[-1]
+        return result
+
+    def _kickoff(self, input_data: Dict[str, Any]) -> str:
+        """执行Crew，返回去除代码块标记的结果"""
+        # 流式片段以工作流名称标记阶段，便于前端分段渲染
+        with StreamRelay.stage(self.config.name):
+            if self.config.workflow_type == WorkflowType.PARALLEL:
+                result = self._kickoff_levels(input_data)
+            else:
+                result = self._build_crew().kickoff(inputs=input_data)
+        return utils.remove_code_blocks(str(result))
+
+    async def _kickoff_async(self, input_data: Dict[str, Any]) -> str:
+        """异步执行Crew，返回去除代码块标记的结果"""
+        with StreamRelay.stage(self.config.name):
+            if self.config.workflow_type == WorkflowType.PARALLEL:
+                result = await self._kickoff_levels_async(input_data)
+            else:
+                result = await self._build_crew().kickoff_async(inputs=input_data)
+        return utils.remove_code_blocks(str(result))
+
     def _parse_result(self, raw_result: str, input_data: Dict[str, Any]) -> ContentResult:
         parser = ContentParser()
         parsed_content = parser.parse(raw_result)
@@ -123,8 +282,8 @@ class ContentGenerationEngine(BaseWorkflowFramework):
             metadata={
                 "workflow_name": self.config.name,
                 "input_data": input_data,
-                "agent_count": len(self.agents),
-                "task_count": len(self.tasks),
+                "agent_count": len(self.config.agents),
+                "task_count": len(self.config.tasks),
                 "parsing_confidence": parsed_content.confidence,
             },
         )
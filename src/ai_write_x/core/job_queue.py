@@ -0,0 +1,449 @@
+import json
+import queue
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+
+from peewee import (
+    BooleanField,
+    CharField,
+    DoubleField,
+    IntegerField,
+    Model,
+    SqliteDatabase,
+    TextField,
+)
+
+from src.ai_write_x.config.config import Config
+from src.ai_write_x.crew_main import (
+    ai_write_x_main,
+    ai_write_x_batch_main,
+    ai_write_x_resume,
+    build_task_config,
+)
+from src.ai_write_x.utils import log
+from src.ai_write_x.utils.cron import CronExpression
+from src.ai_write_x.utils.path_manager import PathManager
+
+
+# 延迟初始化，数据库路径在 JobQueue 创建时确定
+_db = SqliteDatabase(None)
+
+
+class JobStatus:
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    ACTIVE = (PENDING, RUNNING)
+
+
+class JobKind:
+    SINGLE = "single"
+    BATCH = "batch"
+    RESUME = "resume"
+
+
+class BaseModel(Model):
+    class Meta:
+        database = _db
+
+
+class Job(BaseModel):
+    job_id = CharField(unique=True)
+    kind = CharField(default=JobKind.SINGLE)
+    payload = TextField(default="{}")
+    priority = IntegerField(default=0, index=True)
+    status = CharField(default=JobStatus.PENDING, index=True)
+    result = TextField(null=True)
+    error = TextField(null=True)
+    schedule_id = CharField(null=True)
+    created_at = DoubleField(default=time.time)
+    started_at = DoubleField(null=True)
+    finished_at = DoubleField(null=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "payload": json.loads(self.payload or "{}"),
+            "priority": self.priority,
+            "status": self.status,
+            "result": json.loads(self.result) if self.result else None,
+            "error": self.error,
+            "schedule_id": self.schedule_id,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class Schedule(BaseModel):
+    schedule_id = CharField(unique=True)
+    cron = CharField()
+    kind = CharField(default=JobKind.SINGLE)
+    payload = TextField(default="{}")
+    priority = IntegerField(default=0)
+    enabled = BooleanField(default=True)
+    last_run_at = DoubleField(null=True)
+    next_run_at = DoubleField(null=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "schedule_id": self.schedule_id,
+            "cron": self.cron,
+            "kind": self.kind,
+            "payload": json.loads(self.payload or "{}"),
+            "priority": self.priority,
+            "enabled": self.enabled,
+            "last_run_at": self.last_run_at,
+            "next_run_at": self.next_run_at,
+        }
+
+
+def _summarize_result(result) -> Any:
+    """将工作流结果压缩为可JSON序列化的摘要"""
+    if isinstance(result, list):
+        return [
+            {
+                "topic": item.topic,
+                "success": item.success,
+                "error": item.error,
+                "duration": item.duration,
+                "save_result": (item.result or {}).get("save_result"),
+            }
+            for item in result
+        ]
+    if isinstance(result, dict):
+        base_content = result.get("base_content")
+        summary = {
+            "title": getattr(base_content, "title", ""),
+            "save_result": result.get("save_result"),
+            "publish_result": result.get("publish_result"),
+            "success": result.get("success", False),
+        }
+        if "platforms" in result:
+            summary["platforms"] = {
+                platform: {k: v for k, v in item.items() if k != "formatted_content"}
+                for platform, item in result["platforms"].items()
+            }
+        return summary
+    return result
+
+
+class JobQueue:
+    """基于SQLite的持久化任务队列：优先级调度、多工作线程、cron定时任务"""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, db_path: str | None = None):
+        queue_config = Config.get_instance().job_queue_config
+        self.worker_count = max(1, int(queue_config["worker_count"]))
+        self.poll_interval = float(queue_config["poll_interval"])
+        self.schedule_interval = float(queue_config["schedule_interval"])
+
+        _db.init(
+            db_path or str(PathManager.get_data_dir() / "jobs.db"),
+            pragmas={"journal_mode": "wal", "busy_timeout": 5000},
+            check_same_thread=False,
+        )
+        _db.create_tables([Job, Schedule], safe=True)
+
+        # 上次异常退出时仍处于运行状态的任务重新排队
+        Job.update(status=JobStatus.PENDING, started_at=None).where(
+            Job.status == JobStatus.RUNNING
+        ).execute()
+
+        # 子进程日志统一汇总到此队列，由Web层广播
+        self.log_messages: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+
+        self._claim_lock = threading.Lock()
+        # 启动任务会修改当前进程的 Config 单例，需串行化
+        self._launch_lock = threading.Lock()
+        self._processes: Dict[str, Any] = {}
+        self._stop_event = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    # ==================== 任务管理 ====================
+
+    def submit(
+        self,
+        payload: Dict[str, Any],
+        kind: str = JobKind.SINGLE,
+        priority: int = 0,
+        schedule_id: str | None = None,
+    ) -> str:
+        """提交任务，返回任务ID；priority 越大越先执行"""
+        job_id = uuid.uuid4().hex
+        Job.create(
+            job_id=job_id,
+            kind=kind,
+            payload=json.dumps(payload, ensure_ascii=False),
+            priority=priority,
+            schedule_id=schedule_id,
+        )
+        return job_id
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = Job.get_or_none(Job.job_id == job_id)
+        return job.to_dict() if job else None
+
+    def list_jobs(self, status: str | None = None, limit: int = 50) -> List[Dict[str, Any]]:
+        query = Job.select().order_by(Job.created_at.desc()).limit(limit)
+        if status:
+            query = query.where(Job.status == status)
+        return [job.to_dict() for job in query]
+
+    def get_stats(self) -> Dict[str, int]:
+        stats = {status: 0 for status in ("pending", "running", "succeeded", "failed", "cancelled")}
+        for job in Job.select(Job.status):
+            stats[job.status] = stats.get(job.status, 0) + 1
+        return stats
+
+    def has_active_jobs(self) -> bool:
+        return Job.select().where(Job.status.in_(JobStatus.ACTIVE)).exists()
+
+    def cancel(self, job_id: str) -> bool:
+        """取消任务：排队中的直接标记，运行中的终止子进程"""
+        job = Job.get_or_none(Job.job_id == job_id)
+        if not job or job.status not in JobStatus.ACTIVE:
+            return False
+
+        self._finish(job_id, JobStatus.CANCELLED, error="任务已取消")
+        process = self._processes.pop(job_id, None)
+        if process is not None:
+            self._terminate_process(process)
+        return True
+
+    def cancel_all(self) -> int:
+        """取消所有排队中和运行中的任务"""
+        job_ids = [
+            job.job_id
+            for job in Job.select(Job.job_id).where(Job.status.in_(JobStatus.ACTIVE))
+        ]
+        return sum(1 for job_id in job_ids if self.cancel(job_id))
+
+    def _finish(self, job_id: str, status: str, result: Any = None, error: str | None = None):
+        if result is not None:
+            result = json.dumps(result, ensure_ascii=False, default=str)
+        Job.update(
+            status=status,
+            result=result,
+            error=error,
+            finished_at=time.time(),
+        ).where(Job.job_id == job_id, Job.status.in_(JobStatus.ACTIVE)).execute()
+
+    def _claim_next(self) -> Optional[Job]:
+        with self._claim_lock:
+            job = (
+                Job.select()
+                .where(Job.status == JobStatus.PENDING)
+                .order_by(Job.priority.desc(), Job.created_at)
+                .first()
+            )
+            if job is None:
+                return None
+            Job.update(status=JobStatus.RUNNING, started_at=time.time()).where(
+                Job.job_id == job.job_id
+            ).execute()
+            return job
+
+    # ==================== 定时任务 ====================
+
+    def add_schedule(
+        self,
+        cron: str,
+        payload: Dict[str, Any],
+        kind: str = JobKind.SINGLE,
+        priority: int = 0,
+    ) -> str:
+        """添加cron定时任务，返回定时任务ID"""
+        expression = CronExpression(cron)
+        schedule_id = uuid.uuid4().hex
+        Schedule.create(
+            schedule_id=schedule_id,
+            cron=expression.expression,
+            kind=kind,
+            payload=json.dumps(payload, ensure_ascii=False),
+            priority=priority,
+            next_run_at=expression.next_after(datetime.now()).timestamp(),
+        )
+        return schedule_id
+
+    def list_schedules(self) -> List[Dict[str, Any]]:
+        return [schedule.to_dict() for schedule in Schedule.select()]
+
+    def set_schedule_enabled(self, schedule_id: str, enabled: bool) -> bool:
+        schedule = Schedule.get_or_none(Schedule.schedule_id == schedule_id)
+        if not schedule:
+            return False
+        schedule.enabled = enabled
+        if enabled:
+            schedule.next_run_at = (
+                CronExpression(schedule.cron).next_after(datetime.now()).timestamp()
+            )
+        schedule.save()
+        return True
+
+    def remove_schedule(self, schedule_id: str) -> bool:
+        return Schedule.delete().where(Schedule.schedule_id == schedule_id).execute() > 0
+
+    def _fire_due_schedules(self):
+        now = time.time()
+        due = Schedule.select().where(
+            Schedule.enabled == True, Schedule.next_run_at <= now  # noqa: E712
+        )
+        for schedule in due:
+            self.submit(
+                json.loads(schedule.payload or "{}"),
+                kind=schedule.kind,
+                priority=schedule.priority,
+                schedule_id=schedule.schedule_id,
+            )
+            schedule.last_run_at = now
+            schedule.next_run_at = (
+                CronExpression(schedule.cron).next_after(datetime.now()).timestamp()
+            )
+            schedule.save()
+            log.print_log(f"定时任务 {schedule.cron} 已触发", "info")
+
+    # ==================== 工作线程 ====================
+
+    def start(self):
+        """启动工作线程和定时调度线程（重复调用无副作用）"""
+        if self._threads:
+            return
+        self._stop_event.clear()
+        for i in range(self.worker_count):
+            thread = threading.Thread(
+                target=self._worker_loop, name=f"aiwritex-job-worker-{i}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+        scheduler = threading.Thread(
+            target=self._scheduler_loop, name="aiwritex-job-scheduler", daemon=True
+        )
+        scheduler.start()
+        self._threads.append(scheduler)
+
+    def stop(self):
+        """停止调度，终止运行中的子进程（任务保持 running，下次启动时重新排队）"""
+        self._stop_event.set()
+        for process in list(self._processes.values()):
+            self._terminate_process(process)
+        self._processes.clear()
+        self._threads = []
+
+    def _scheduler_loop(self):
+        while not self._stop_event.is_set():
+            try:
+                self._fire_due_schedules()
+            except Exception as e:
+                log.print_log(f"定时任务调度出错: {str(e)}", "error")
+            self._stop_event.wait(self.schedule_interval)
+
+    def _worker_loop(self):
+        while not self._stop_event.is_set():
+            job = self._claim_next()
+            if job is None:
+                self._stop_event.wait(self.poll_interval)
+                continue
+
+            try:
+                self._run_job(job)
+            except Exception as e:
+                log.print_log(f"任务 {job.job_id} 执行出错: {str(e)}", "error")
+                self._finish(job.job_id, JobStatus.FAILED, error=str(e))
+            finally:
+                self._processes.pop(job.job_id, None)
+
+    def _start_process(self, job: Job):
+        payload = json.loads(job.payload or "{}")
+        # 入口函数以 config_data 非空判断是否在子进程中执行，此处始终带上自定义话题参数，
+        # 既保证任务不会在队列线程中同步执行，也避免沿用上一个任务写入 Config 的参数
+        config_data = build_task_config(payload.get("config_data"))
+
+        with self._launch_lock:
+            if job.kind == JobKind.BATCH:
+                process, log_queue = ai_write_x_batch_main(
+                    payload.get("topics") or [], payload.get("top_k", 0), config_data
+                )
+            elif job.kind == JobKind.RESUME:
+                process, log_queue = ai_write_x_resume(payload["run_id"], config_data)
+            else:
+                process, log_queue = ai_write_x_main(config_data)
+
+            if not process or not log_queue or not hasattr(process, "start"):
+                raise RuntimeError("任务启动失败")
+            # 启动前登记，等待空闲工作进程期间也能被取消
+            self._processes[job.job_id] = process
+
+        # 进程池繁忙时 start() 会阻塞，放在锁外避免阻塞其他任务的启动、取消和状态查询
+        process.start()
+        if job.job_id not in self._processes:
+            # 等待启动期间任务已被取消或队列已停止
+            self._terminate_process(process)
+        return process, log_queue
+
+    def _run_job(self, job: Job):
+        process, log_queue = self._start_process(job)
+        self._publish(job.job_id, {"type": "status", "message": f"任务 {job.job_id} 开始执行"})
+
+        result = None
+        error = None
+        completed = False
+        while True:
+            try:
+                msg = log_queue.get(timeout=self.poll_interval)
+            except queue.Empty:
+                if not process.is_alive():
+                    break
+                continue
+
+            msg_type = msg.get("type", "info")
+            if msg_type == "internal" and "任务执行完成" in msg.get("message", ""):
+                completed = True
+                result = msg.get("result")
+                self._publish(job.job_id, {"type": "internal", "message": msg["message"]})
+                continue
+            if msg_type == "error":
+                error = msg.get("message", "")
+            self._publish(job.job_id, msg)
+
+        process.join(timeout=5.0)
+
+        if completed:
+            self._finish(job.job_id, JobStatus.SUCCEEDED, result=_summarize_result(result))
+        else:
+            self._finish(job.job_id, JobStatus.FAILED, error=error or "任务进程异常退出")
+
+    def _publish(self, job_id: str, msg: Dict[str, Any]):
+        msg = dict(msg)
+        msg["job_id"] = job_id
+        msg.setdefault("timestamp", time.time())
+        self.log_messages.put(msg)
+
+    @staticmethod
+    def _terminate_process(process):
+        try:
+            if process.is_alive():
+                process.terminate()
+                process.join(timeout=5.0)
+                if process.is_alive():
+                    process.kill()
+        except Exception:
+            pass
@@ -0,0 +1,131 @@
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from src.ai_write_x.config.config import Config
+from src.ai_write_x.core.base_framework import WorkflowConfig
+from src.ai_write_x.core.tool_registry import GlobalToolRegistry
+from src.ai_write_x.utils.disk_cache import DiskCache
+from src.ai_write_x.utils.path_manager import PathManager
+
+
+def render_template_text(text: str, inputs: Dict[str, Any]) -> str:
+    """按 CrewAI 的方式将 {key} 占位符替换为输入值"""
+    if not text:
+        return ""
+    for key, value in inputs.items():
+        text = text.replace(f"{{{key}}}", str(value))
+    return text
+
+
+class LLMResponseCache(DiskCache):
+    """内容寻址的LLM结果磁盘缓存：支持TTL、按总大小淘汰以及命中统计"""
+
+    name = "LLM缓存"
+    suffix = ".json"
+
+    def __init__(self, cache_dir: str | None = None):
+        super().__init__(
+            Path(cache_dir) if cache_dir else PathManager.get_data_dir() / "llm_cache"
+        )
+
+    def settings(self) -> Dict[str, Any]:
+        return Config.get_instance().llm_cache_config
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return bool(Config.get_instance().llm_cache_config["enabled"])
+
+    @staticmethod
+    def tool_inputs(workflow_config: WorkflowConfig) -> Optional[Dict[str, str]]:
+        """
+        工具读取的外部输入（如搜索结果、模板内容）的摘要，由工具类的 input_digest 提供；
+        有工具无法预知其输入时返回 None，此时结果不可缓存
+        """
+        registry = GlobalToolRegistry.get_instance()
+        digests = {}
+        for name in sorted({tool for agent in workflow_config.agents for tool in agent.tools}):
+            input_digest = getattr(registry.get_tool(name), "input_digest", None)
+            if input_digest is None:
+                continue
+            digest = input_digest()
+            if digest is None:
+                return None
+            digests[name] = digest
+        return digests
+
+    @staticmethod
+    def make_key(workflow_config: WorkflowConfig, input_data: Dict[str, Any]) -> Optional[str]:
+        """
+        根据工作流名称、渲染后的任务提示词、输入、模型、温度以及工具输入的摘要计算缓存键；
+        不同提供商或接口地址下的同名模型可能并非同一个模型，二者也计入缓存键。
+        结果依赖无法预知的工具输入时返回 None
+        """
+        tool_inputs = LLMResponseCache.tool_inputs(workflow_config)
+        if tool_inputs is None:
+            return None
+
+        config = Config.get_instance()
+        agents = {agent.name: agent for agent in workflow_config.agents}
+
+        prompts = []
+        for task in workflow_config.tasks:
+            agent = agents.get(task.agent_name)
+            llm_config = agent.llm_config if agent else {}
+            prompts.append(
+                {
+                    "description": render_template_text(task.description, input_data),
+                    "expected_output": render_template_text(task.expected_output, input_data),
+                    "role": agent.role if agent else "",
+                    "goal": agent.goal if agent else "",
+                    "backstory": agent.backstory if agent else "",
+                    "system_template": (agent.system_template if agent else None) or "",
+                    "model": llm_config.get("model") or config.api_model,
+                    "base_url": (
+                        llm_config.get("base_url")
+                        or llm_config.get("api_base")
+                        or config.api_apibase
+                    ),
+                    "temperature": llm_config.get("temperature"),
+                }
+            )
+
+        material = json.dumps(
+            {
+                "workflow": workflow_config.name,
+                "api_type": config.api_type,
+                "prompts": prompts,
+                "inputs": input_data,
+                "tool_inputs": tool_inputs,
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """获取缓存结果，不存在或已过期返回 None"""
+        ttl = self.settings()["ttl"]
+        with self._io_lock:
+            entry = self._read(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+
+            if ttl and time.time() - entry.get("created_at", 0) > ttl:
+                self._remove(key)
+                self.stats["misses"] += 1
+                return None
+
+            self._touch(key)
+            self.stats["hits"] += 1
+            return entry.get("result")
+
+    def set(self, key: str, result: str, workflow_name: str = ""):
+        """写入缓存并按总大小淘汰最久未使用的条目"""
+        entry = {"created_at": time.time(), "workflow": workflow_name, "result": result}
+        with self._io_lock:
+            self._write(key, entry)
@@ -0,0 +1,74 @@
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple
+
+from src.ai_write_x.config.config import Config
+
+
+class LLMPool:
+    """
+    进程级LLM实例池，按 (model, base_url, api_key) 复用 crewai.LLM，
+    使各阶段、各次执行共享同一客户端与HTTP连接，闲置超时的实例会被释放
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        self._pool_lock = threading.RLock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def make_key(llm_kwargs: Dict[str, Any]) -> Tuple[str, ...]:
+        """(model, base_url, api_key) 之外的参数（如温度）不同也需区分实例"""
+        extra = {
+            k: v for k, v in llm_kwargs.items() if k not in ("model", "base_url", "api_key")
+        }
+        return (
+            str(llm_kwargs.get("model", "")),
+            str(llm_kwargs.get("base_url", "")),
+            str(llm_kwargs.get("api_key", "")),
+            json.dumps(extra, sort_keys=True, default=str),
+        )
+
+    def get(self, llm_kwargs: Dict[str, Any], factory: Callable[..., Any]) -> Any:
+        """获取LLM实例，池中不存在时使用 factory(**llm_kwargs) 创建"""
+        key = self.make_key(llm_kwargs)
+        with self._pool_lock:
+            self._evict_idle()
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                entry = {"llm": factory(**llm_kwargs), "last_used": time.time()}
+                self._entries[key] = entry
+            else:
+                self.stats["hits"] += 1
+                entry["last_used"] = time.time()
+            return entry["llm"]
+
+    def _evict_idle(self):
+        idle_timeout = Config.get_instance().llm_pool_config["idle_timeout"]
+        if not idle_timeout:
+            return
+        expire_before = time.time() - idle_timeout
+        for key in [k for k, e in self._entries.items() if e["last_used"] < expire_before]:
+            del self._entries[key]
+            self.stats["evictions"] += 1
+
+    def clear(self):
+        with self._pool_lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._pool_lock:
+            return {**self.stats, "size": len(self._entries)}
@@ -0,0 +1,138 @@
+import functools
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Union
+
+import litellm
+from crewai import LLM
+
+from src.ai_write_x.utils import log
+
+# CrewAI 在不同版本中调整过事件模块的位置；旧版本（如 0.102）没有流式事件，由 StreamingLLM 转发片段
+try:
+    from crewai.utilities.events import crewai_event_bus, LLMStreamChunkEvent
+except ImportError:
+    try:
+        from crewai.events import crewai_event_bus, LLMStreamChunkEvent
+    except ImportError:
+        crewai_event_bus = None
+        LLMStreamChunkEvent = None
+
+
+# 当前所属阶段，使用 ContextVar 以便在 asyncio.to_thread 等场景中随上下文传递
+_current_stage: ContextVar[str] = ContextVar("aiwritex_stream_stage", default="")
+# StreamingLLM.call 执行期间置位，litellm.completion 的包装据此改为流式请求
+_stream_call: ContextVar[bool] = ContextVar("aiwritex_stream_call", default=False)
+
+
+def _collect_stream(response, messages) -> Any:
+    """边接收边转发片段，结束后由片段重建完整响应（含 usage），交还 CrewAI 按非流式响应处理"""
+    stage = _current_stage.get()
+    chunks = []
+    for chunk in response:
+        chunks.append(chunk)
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if delta:
+            log.print_stream(delta, stage)
+    return litellm.stream_chunk_builder(chunks, messages=messages)
+
+
+class StreamingLLM(LLM):
+    """
+    旧版 CrewAI 的 LLM 固定以非流式调用 litellm，也不产生流式事件。
+    调用流程仍由 LLM.call 完成，只把其中的 litellm.completion 换成流式请求，
+    错误处理和 token 统计保持原样；带工具的调用不做改动
+    """
+
+    _hook_lock = threading.Lock()
+
+    def __init__(self, *args, stream: bool = True, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stream = stream
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+    ) -> Union[str, Any]:
+        if not self.stream or tools or available_functions:
+            return super().call(messages, tools, callbacks, available_functions)
+
+        self._install_completion_hook()
+        token = _stream_call.set(True)
+        try:
+            return super().call(messages, tools, callbacks, available_functions)
+        finally:
+            _stream_call.reset(token)
+
+    @classmethod
+    def _install_completion_hook(cls):
+        """包装 litellm.completion（进程内一次），只对 StreamingLLM.call 发起的请求生效"""
+        with cls._hook_lock:
+            completion = litellm.completion
+            if getattr(completion, "_aiwritex_stream_hook", False):
+                return
+
+            @functools.wraps(completion)
+            def streaming_completion(*args, **kwargs):
+                if not _stream_call.get() or kwargs.get("stream"):
+                    return completion(*args, **kwargs)
+                # litellm 内部的重试、降级等嵌套调用不再改写
+                token = _stream_call.set(False)
+                try:
+                    response = completion(*args, **{**kwargs, "stream": True})
+                    return _collect_stream(response, kwargs.get("messages"))
+                finally:
+                    _stream_call.reset(token)
+
+            streaming_completion._aiwritex_stream_hook = True
+            litellm.completion = streaming_completion
+
+
+class StreamRelay:
+    """
+    将 LLM 流式输出转发到日志队列（stream 消息类型），并按执行上下文标记所属阶段。
+    CrewAI 支持流式事件时订阅事件，否则由 StreamingLLM 直接转发
+    """
+
+    _installed = False
+    _lock = threading.Lock()
+
+    @classmethod
+    def has_stream_events(cls) -> bool:
+        return crewai_event_bus is not None
+
+    @classmethod
+    def llm_class(cls):
+        """流式输出所用的 LLM 类"""
+        return LLM if cls.has_stream_events() else StreamingLLM
+
+    @classmethod
+    def install(cls) -> bool:
+        """注册事件处理器，进程内只注册一次；没有流式事件时无需注册"""
+        if not cls.has_stream_events():
+            return True
+        with cls._lock:
+            if not cls._installed:
+                crewai_event_bus.on(LLMStreamChunkEvent)(cls._on_chunk)
+                cls._installed = True
+        return True
+
+    @classmethod
+    def _on_chunk(cls, source, event):
+        # 只有开启了 stream 的LLM会产生片段，此处再校验一次避免混入其他输出
+        if event.chunk and getattr(source, "stream", True):
+            log.print_stream(event.chunk, _current_stage.get())
+
+    @classmethod
+    @contextmanager
+    def stage(cls, name: str):
+        """在该上下文中产生的流式片段标记为 name 阶段"""
+        token = _current_stage.set(name)
+        try:
+            yield
+        finally:
+            _current_stage.reset(token)
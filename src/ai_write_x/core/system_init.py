@@ -1,6 +1,7 @@
 from src.ai_write_x.core.tool_registry import GlobalToolRegistry
 from src.ai_write_x.tools.custom_tool import AIForgeSearchTool
 from src.ai_write_x.tools.custom_tool import ReadTemplateTool
+from src.ai_write_x.tools.template_index import TemplateIndex
 from src.ai_write_x.core.unified_workflow import UnifiedContentWorkflow
 
 from src.ai_write_x.adapters.platform_adapters import (
@@ -23,6 +24,9 @@ def initialize_global_tools():
     registry.register_tool("AIForgeSearchTool", AIForgeSearchTool)
     registry.register_tool("ReadTemplateTool", ReadTemplateTool)
 
+    # 预加载模板索引，首次读取模板时无需扫描和压缩
+    TemplateIndex.get_instance()
+
     return registry
 
 
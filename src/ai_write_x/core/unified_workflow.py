@@ -1,6 +1,9 @@
+import asyncio
 import os
 import time
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Dict, Any, List, Optional, Tuple
 from src.ai_write_x.core.base_framework import (
     WorkflowConfig,
     AgentConfig,
@@ -21,7 +24,14 @@ from src.ai_write_x.adapters.platform_adapters import (
 from src.ai_write_x.core.monitoring import WorkflowMonitor
 from src.ai_write_x.config.config import Config
 from src.ai_write_x.core.content_generation import ContentGenerationEngine
+from src.ai_write_x.core.llm_cache import LLMResponseCache
+from src.ai_write_x.tools.custom_tool import SearchPrefetcher
+from src.ai_write_x.tools.web_cache import WebContentCache
+from src.ai_write_x.tools.template_index import TemplateIndex
+from src.ai_write_x.core.llm_pool import LLMPool
+from src.ai_write_x.core.checkpoint import RunCheckpoint
 from src.ai_write_x.utils.path_manager import PathManager
+from src.ai_write_x.utils.topic_history import TopicHistory
 from src.ai_write_x.utils import utils
 from src.ai_write_x.adapters.platform_adapters import PlatformType
 from src.ai_write_x.utils import log
@@ -111,14 +121,11 @@ class UnifiedContentWorkflow:
             tasks=tasks,
         )
 
-    def _generate_base_content(self, topic: str, **kwargs) -> ContentResult:
-        """生成基础内容"""
+    def _prepare_base_content(self, topic: str, **kwargs) -> Tuple[ContentGenerationEngine, Dict]:
+        """创建基础内容生成引擎并准备输入数据"""
         # 动态获取配置
         base_config = self.get_base_content_config(**kwargs)
 
-        # 创建内容生成引擎
-        self.content_engine = ContentGenerationEngine(base_config)
-
         # 准备输入数据
         input_data = {
             "topic": topic,
@@ -127,14 +134,85 @@ class UnifiedContentWorkflow:
             "reference_ratio": kwargs.get("reference_ratio", 0.0),
         }
 
-        return self.content_engine.execute_workflow(input_data)
+        return ContentGenerationEngine(base_config), input_data
 
-    def execute(self, topic: str, **kwargs) -> Dict[str, Any]:
-        """统一执行流程：输入 -> 内容生成 -> 格式处理 -> 保存 -> 发布"""
-        start_time = time.time()
-        success = False
+    def _search_prefetch(self, engine: ContentGenerationEngine, input_data: Dict):
+        """工作流用到搜索工具时，在后台提前开始搜索，与 Agent 创建和 LLM 调用重叠"""
+        enabled = Config.get_instance().search_prefetch_config["enabled"] and any(
+            "AIForgeSearchTool" in agent.tools for agent in engine.config.agents
+        )
+        if not enabled:
+            return nullcontext()
+        return SearchPrefetcher.get_instance().run(input_data["topic"], input_data["urls"])
+
+    def _generate_base_content(self, topic: str, **kwargs) -> ContentResult:
+        """生成基础内容"""
+        self.content_engine, input_data = self._prepare_base_content(topic, **kwargs)
+        with self._search_prefetch(self.content_engine, input_data):
+            return self.content_engine.execute_workflow(input_data)
+
+    async def _generate_base_content_async(self, topic: str, **kwargs) -> ContentResult:
+        """异步生成基础内容（引擎为局部变量，同一实例可并发执行多个话题）"""
+        engine, input_data = self._prepare_base_content(topic, **kwargs)
+        # 并发的话题各自运行在独立的 Task 上下文中，预取互不混用
+        with self._search_prefetch(engine, input_data):
+            return await engine.execute_workflow_async(input_data)
+
+    def _open_checkpoint(
+        self, topic: str, run_id: str | None, kwargs: Dict[str, Any]
+    ) -> Tuple[Optional[RunCheckpoint], str]:
+        """加载或新建检查点，返回 (检查点, 发布平台)；恢复时沿用首次执行的发布平台"""
         config = Config.get_instance()
         publish_platform = config.publish_platform
+
+        checkpoint = None
+        if run_id:
+            checkpoint = RunCheckpoint.load(run_id)
+            publish_platform = checkpoint.meta["params"].get("publish_platform", publish_platform)
+            log.print_log(f"从检查点 {run_id} 恢复执行，起始阶段：{checkpoint.first_incomplete_stage()}")
+        elif config.checkpoint_config["enabled"]:
+            RunCheckpoint.prune(config.checkpoint_config["keep_days"])
+            # 记录本次使用的模板设置，恢复时沿用
+            if config.custom_topic:
+                template_category = config.custom_template_category
+                template = config.custom_template
+            else:
+                template_category, template = config.template_category, config.template
+            checkpoint = RunCheckpoint.create(
+                topic,
+                {
+                    "publish_platform": publish_platform,
+                    "kwargs": kwargs,
+                    "template_category": template_category,
+                    "template": template,
+                },
+            )
+        return checkpoint, publish_platform
+
+    def _close_checkpoint(self, checkpoint: RunCheckpoint | None, publish_result):
+        """写入发布结果并更新检查点状态，发布失败不写检查点，恢复时重新发布"""
+        if not checkpoint:
+            return
+        if publish_result is None or publish_result.get("success"):
+            checkpoint.save("publish_result", publish_result)
+
+        if checkpoint.first_incomplete_stage() is not None:
+            checkpoint.update_status("failed", publish_result.get("message"))
+            log.print_log(f"发布未成功，可使用检查点 {checkpoint.run_id} 重试发布")
+        elif Config.get_instance().checkpoint_config["keep_completed"]:
+            checkpoint.update_status("completed")
+        else:
+            checkpoint.remove()
+
+    def execute(self, topic: str, run_id: str | None = None, **kwargs) -> Dict[str, Any]:
+        """
+        统一执行流程：输入 -> 内容生成 -> 格式处理 -> 保存 -> 发布
+        每个阶段的结果都会写入检查点；传入 run_id 时从第一个未完成的阶段继续执行
+        """
+        start_time = time.time()
+        success = False
+        checkpoint, publish_platform = self._open_checkpoint(topic, run_id, kwargs)
+
         # 构建标题：platform|topic 格式
         platform = kwargs.get("platform", "")
 
@@ -145,52 +223,333 @@ class UnifiedContentWorkflow:
 
         try:
             # 1. 生成基础内容（统一Markdown格式）
-            base_content = self._generate_base_content(
-                topic, publish_platform=publish_platform, **kwargs
+            base_content = self._run_stage(
+                checkpoint,
+                "base_content",
+                lambda: self._generate_base_content(
+                    topic, publish_platform=publish_platform, **kwargs
+                ),
             )
 
             # 2. 维度化创意变换
-            final_content = self._apply_dimensional_creative_transformation(base_content, **kwargs)
+            final_content = self._run_stage(
+                checkpoint,
+                "final_content",
+                lambda: self._apply_dimensional_creative_transformation(base_content, **kwargs),
+            )
 
             # 3. 转换处理（template或design）
-            transform_content = self._transform_content(final_content, publish_platform, **kwargs)
+            transform_content = self._run_stage(
+                checkpoint,
+                "transform_content",
+                lambda: self._transform_content(final_content, publish_platform, **kwargs),
+            )
 
-            # 4. 保存（非AI参与）
-            save_result = self._save_content(transform_content, title)
-            if save_result.get("success", False):
+            # 4. 保存（非AI参与）；恢复时已保存过的文章，话题也已在之前的执行中记录
+            save_pending = not (checkpoint and checkpoint.has("save_result"))
+            save_result = self._run_stage(
+                checkpoint, "save_result", lambda: self._save_content(transform_content, title)
+            )
+            if save_pending and save_result.get("success", False):
                 log.print_log(f"文章《{title}》保存成功！")
+                self._record_topic(topic, platform)
 
             # 5. 可选发布（非AI参与，开关控制）
             publish_result = None
-            if self._should_publish():
+            if checkpoint and checkpoint.has("publish_result"):
+                publish_result = checkpoint.get("publish_result")
+            elif self._should_publish():
                 publish_result = self._publish_content(
                     transform_content, publish_platform, **kwargs
                 )
                 log.print_log(f"发布完成，总结：{publish_result.get('message')}")
 
-            results = {
+            self._close_checkpoint(checkpoint, publish_result)
+
+            success = True
+            return {
                 "base_content": base_content,
                 "final_content": final_content,
                 "formatted_content": transform_content.content,
                 "save_result": save_result,
                 "publish_result": publish_result,
+                "run_id": checkpoint.run_id if checkpoint else None,
                 "success": True,
             }
 
+        except Exception as e:
+            self.monitor.log_error("unified_workflow", str(e), {"topic": topic})
+            if checkpoint:
+                checkpoint.update_status("failed", str(e))
+                log.print_log(f"执行中断，可使用检查点 {checkpoint.run_id} 恢复", "warning")
+            raise
+        finally:
+            duration = time.time() - start_time
+            self.monitor.track_execution("unified_workflow", duration, success, {"topic": topic})
+
+    async def execute_async(
+        self, topic: str, run_id: str | None = None, **kwargs
+    ) -> Dict[str, Any]:
+        """
+        execute 的异步版本：LLM阶段在事件循环中等待，文件保存与发布放到线程中执行，
+        可在同一事件循环中并发驱动多个生成任务；检查点的写入与恢复与 execute 一致
+        """
+        start_time = time.time()
+        success = False
+        checkpoint, publish_platform = await asyncio.to_thread(
+            self._open_checkpoint, topic, run_id, kwargs
+        )
+
+        platform = kwargs.get("platform", "")
+        title = f"{platform}|{topic}" if platform else topic
+
+        try:
+            base_content = await self._run_stage_async(
+                checkpoint,
+                "base_content",
+                lambda: self._generate_base_content_async(
+                    topic, publish_platform=publish_platform, **kwargs
+                ),
+            )
+            final_content = await self._run_stage_async(
+                checkpoint,
+                "final_content",
+                lambda: asyncio.to_thread(
+                    self._apply_dimensional_creative_transformation, base_content, **kwargs
+                ),
+            )
+            transform_content = await self._run_stage_async(
+                checkpoint,
+                "transform_content",
+                lambda: self._transform_content_async(final_content, publish_platform, **kwargs),
+            )
+
+            save_pending = not (checkpoint and checkpoint.has("save_result"))
+            save_result = await self._run_stage_async(
+                checkpoint,
+                "save_result",
+                lambda: asyncio.to_thread(self._save_content, transform_content, title),
+            )
+            if save_pending and save_result.get("success", False):
+                log.print_log(f"文章《{title}》保存成功！")
+                await asyncio.to_thread(self._record_topic, topic, platform)
+
+            publish_result = None
+            if checkpoint and checkpoint.has("publish_result"):
+                publish_result = checkpoint.get("publish_result")
+            elif self._should_publish():
+                publish_result = await asyncio.to_thread(
+                    self._publish_content, transform_content, publish_platform, **kwargs
+                )
+                log.print_log(f"发布完成，总结：{publish_result.get('message')}")
+
+            await asyncio.to_thread(self._close_checkpoint, checkpoint, publish_result)
+
             success = True
-            return results
+            return {
+                "base_content": base_content,
+                "final_content": final_content,
+                "formatted_content": transform_content.content,
+                "save_result": save_result,
+                "publish_result": publish_result,
+                "run_id": checkpoint.run_id if checkpoint else None,
+                "success": True,
+            }
 
         except Exception as e:
             self.monitor.log_error("unified_workflow", str(e), {"topic": topic})
+            if checkpoint:
+                checkpoint.update_status("failed", str(e))
+                log.print_log(f"执行中断，可使用检查点 {checkpoint.run_id} 恢复", "warning")
             raise
         finally:
             duration = time.time() - start_time
             self.monitor.track_execution("unified_workflow", duration, success, {"topic": topic})
 
+    def execute_multi_platform(self, topic: str, platforms: List[str], **kwargs) -> Dict[str, Any]:
+        """
+        多平台执行：基础内容和维度化变换只执行一次，
+        再并发完成各平台的格式转换、适配、保存和发布，返回 平台 -> 结果 的映射
+        """
+        start_time = time.time()
+        success = False
+        config = Config.get_instance()
+
+        platforms = list(dict.fromkeys(platforms))
+        unsupported = [p for p in platforms if p not in self.platform_adapters]
+        if unsupported:
+            raise ValueError(f"不支持的平台: {', '.join(unsupported)}")
+
+        platform = kwargs.get("platform", "")
+        title = f"{platform}|{topic}" if platform else topic
+
+        try:
+            base_content = self._generate_base_content(
+                topic, publish_platform=platforms[0], **kwargs
+            )
+            final_content = self._apply_dimensional_creative_transformation(base_content, **kwargs)
+
+            max_workers = min(len(platforms), max(1, config.multi_platform_config["max_workers"]))
+            should_publish = self._should_publish()
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="aiwritex-platform"
+            ) as pool:
+                futures = {
+                    p: pool.submit(
+                        self._format_for_platform, final_content, p, title, should_publish, **kwargs
+                    )
+                    for p in platforms
+                }
+                platform_results = {p: future.result() for p, future in futures.items()}
+
+            success = any(r["success"] for r in platform_results.values())
+            if success:
+                self._record_topic(topic, platform)
+            return {
+                "base_content": base_content,
+                "final_content": final_content,
+                "platforms": platform_results,
+                "success": success,
+            }
+
+        except Exception as e:
+            self.monitor.log_error("multi_platform_workflow", str(e), {"topic": topic})
+            raise
+        finally:
+            duration = time.time() - start_time
+            self.monitor.track_execution(
+                "multi_platform_workflow",
+                duration,
+                success,
+                {"topic": topic, "platforms": platforms},
+            )
+
+    def _format_for_platform(
+        self,
+        content: ContentResult,
+        publish_platform: str,
+        title: str,
+        should_publish: bool,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """单个平台的转换、适配、保存与发布，异常只影响该平台"""
+        try:
+            adapter = self.platform_adapters[publish_platform]
+            transform_content = self._transform_content(content, publish_platform, **kwargs)
+            formatted = adapter.format_content(transform_content, **kwargs)
+
+            # 保存和发布都使用适配器格式化后的内容；支持HTML的平台改写过内容即已转为HTML，
+            # 标记为 html 以免发布时再次格式化
+            content_format = transform_content.content_format
+            if adapter.supports_html() and formatted != transform_content.content:
+                content_format = "html"
+            platform_content = ContentResult(
+                title=transform_content.title,
+                content=formatted,
+                summary=transform_content.summary,
+                content_format=content_format,
+                metadata=transform_content.metadata,
+            )
+            # 各平台文件名带平台后缀，避免互相覆盖
+            save_result = self._save_content(
+                platform_content,
+                f"{title}_{publish_platform}",
+                "html" if content_format == "html" else "markdown",
+            )
+
+            publish_result = None
+            if should_publish:
+                publish_result = self._publish_content(
+                    platform_content, publish_platform, **kwargs
+                )
+                log.print_log(f"[{publish_platform}] 发布完成，总结：{publish_result.get('message')}")
+
+            log.print_log(f"[{publish_platform}] 文章《{title}》适配完成")
+            return {
+                "success": True,
+                "formatted_content": formatted,
+                "save_result": save_result,
+                "publish_result": publish_result,
+                "error": None,
+            }
+        except Exception as e:
+            log.print_log(f"[{publish_platform}] 适配失败: {str(e)}", "error")
+            return {
+                "success": False,
+                "formatted_content": None,
+                "save_result": None,
+                "publish_result": None,
+                "error": str(e),
+            }
+
+    def _record_topic(self, topic: str, platform: str = ""):
+        """记录已写话题，供之后选题去重；失败不影响本次执行"""
+        history_config = Config.get_instance().topic_history_config
+        if not history_config["enabled"]:
+            return
+        try:
+            history = TopicHistory.get_instance()
+            history.record(topic, platform)
+            # 清理过期记录，保留期不短于选题比较的窗口期
+            keep_days = history_config["keep_days"]
+            if keep_days > 0:
+                history.prune(max(keep_days, history_config["window_days"]))
+        except Exception as e:
+            log.print_log(f"记录话题历史失败: {str(e)}", "warning")
+
+    def resume(self, run_id: str) -> Dict[str, Any]:
+        """从检查点恢复执行，跳过已完成的阶段"""
+        meta = RunCheckpoint.load(run_id).meta
+        return self.execute(meta["topic"], run_id=run_id, **meta["params"].get("kwargs", {}))
+
+    def _run_stage(self, checkpoint: RunCheckpoint | None, stage: str, func) -> Any:
+        """执行单个阶段，检查点中已有结果时直接复用"""
+        if checkpoint and checkpoint.has(stage):
+            log.print_log(f"阶段 {stage} 已完成，使用检查点结果")
+            return checkpoint.get(stage)
+
+        value = func()
+        if checkpoint:
+            checkpoint.save(stage, value)
+        return value
+
+    async def _run_stage_async(self, checkpoint: RunCheckpoint | None, stage: str, func) -> Any:
+        """_run_stage 的异步版本，func 返回待等待的协程"""
+        if checkpoint and checkpoint.has(stage):
+            log.print_log(f"阶段 {stage} 已完成，使用检查点结果")
+            return checkpoint.get(stage)
+
+        value = await func()
+        if checkpoint:
+            await asyncio.to_thread(checkpoint.save, stage, value)
+        return value
+
     def _transform_content(
         self, content: ContentResult, publish_platform: str, **kwargs
     ) -> ContentResult:
         """内容转换：template或design路径的AI处理"""
+        prepared = self._prepare_transform(content, publish_platform, **kwargs)
+        if prepared is None:
+            return content
+
+        engine, input_data = prepared
+        return engine.execute_workflow(input_data)
+
+    async def _transform_content_async(
+        self, content: ContentResult, publish_platform: str, **kwargs
+    ) -> ContentResult:
+        """内容转换的异步版本"""
+        prepared = self._prepare_transform(content, publish_platform, **kwargs)
+        if prepared is None:
+            return content
+
+        engine, input_data = prepared
+        return await engine.execute_workflow_async(input_data)
+
+    def _prepare_transform(
+        self, content: ContentResult, publish_platform: str, **kwargs
+    ) -> Optional[Tuple[ContentGenerationEngine, Dict]]:
+        """选择template或design路径并准备引擎与输入，无需AI转换时返回 None"""
         config = Config.get_instance()
         adapter = self.platform_adapters.get(publish_platform)
 
@@ -200,17 +559,18 @@ class UnifiedContentWorkflow:
         # AI驱动的内容转换
         if adapter.supports_html() and config.article_format.upper() == "HTML":
             if config.use_template and adapter.supports_template():
-                return self._apply_template_formatting(content, **kwargs)
+                return self._prepare_template_formatting(content, publish_platform, **kwargs)
             else:
-                return self._apply_design_formatting(content, publish_platform, **kwargs)
+                return self._prepare_design_formatting(content, publish_platform, **kwargs)
         else:
-            return content
+            return None
 
-    def _apply_template_formatting(self, content: ContentResult, **kwargs) -> ContentResult:
+    def _prepare_template_formatting(
+        self, content: ContentResult, publish_platform: str, **kwargs
+    ) -> Tuple[ContentGenerationEngine, Dict]:
         """Template路径：使用AI填充本地模板"""
-        # 创建专门的模板处理工作流
-        template_config = self._get_template_workflow_config(**kwargs)
-        engine = ContentGenerationEngine(template_config)
+        # 创建专门的模板处理工作流，模板要求随平台不同
+        template_config = self._get_template_workflow_config(publish_platform, **kwargs)
 
         input_data = {
             "content": content.content,
@@ -220,15 +580,14 @@ class UnifiedContentWorkflow:
             **kwargs,
         }
 
-        return engine.execute_workflow(input_data)
+        return ContentGenerationEngine(template_config), input_data
 
-    def _apply_design_formatting(
+    def _prepare_design_formatting(
         self, content: ContentResult, publish_platform: str, **kwargs
-    ) -> ContentResult:
+    ) -> Tuple[ContentGenerationEngine, Dict]:
         """Design路径：使用AI生成HTML设计"""
         # 创建专门的设计工作流
         design_config = self._get_design_workflow_config(publish_platform, **kwargs)
-        engine = ContentGenerationEngine(design_config)
 
         input_data = {
             "content": content.content,
@@ -239,7 +598,7 @@ class UnifiedContentWorkflow:
             **kwargs,
         }
 
-        return engine.execute_workflow(input_data)
+        return ContentGenerationEngine(design_config), input_data
 
     def _apply_dimensional_creative_transformation(
         self, base_content: ContentResult, **kwargs
@@ -453,18 +812,21 @@ class UnifiedContentWorkflow:
             tasks=tasks,
         )
 
-    def _save_content(self, content: ContentResult, title: str) -> Dict[str, Any]:
-        """保存内容（非AI参与）"""
+    def _save_content(
+        self, content: ContentResult, title: str, article_format: str | None = None
+    ) -> Dict[str, Any]:
+        """保存内容（非AI参与），article_format 为空时使用配置的文章格式"""
         config = Config.get_instance()
+        article_format = article_format or config.article_format
         # 确定文件格式和路径
-        file_extension = utils.get_file_extension(config.article_format)
+        file_extension = utils.get_file_extension(article_format)
         save_path = self._get_save_path(title, file_extension)
 
         # 保存文件
         with open(save_path, "w", encoding="utf-8") as f:
             f.write(content.content)
 
-        return {"success": True, "path": save_path, "title": title, "format": config.article_format}
+        return {"success": True, "path": save_path, "title": title, "format": article_format}
 
     def _get_save_path(self, title: str, file_extension: str) -> str:
         """获取保存路径"""
@@ -525,6 +887,11 @@ class UnifiedContentWorkflow:
         return {
             "workflow_metrics": self.monitor.get_metrics(),
             "recent_executions": self.monitor.get_recent_logs(limit=20),
+            "llm_cache": LLMResponseCache.get_instance().get_stats(),
+            "web_cache": WebContentCache.get_instance().get_stats(),
+            "search_prefetch": SearchPrefetcher.get_instance().get_stats(),
+            "template_index": TemplateIndex.get_instance().get_stats(),
+            "llm_pool": LLMPool.get_instance().get_stats(),
             "system_status": "healthy" if self._check_system_health() else "degraded",
         }
 
@@ -0,0 +1,217 @@
+import multiprocessing
+import queue
+import threading
+from typing import Any, Callable, List, Optional
+
+
+# 工作进程完成一个任务后写入日志队列的结束标记类型
+JOB_DONE_TYPE = "_job_done"
+
+
+def job_done_message(recycle: bool = False) -> dict:
+    """工作进程完成任务的标记，recycle 表示该进程随后将退出，不可再派发任务"""
+    return {"type": JOB_DONE_TYPE, "recycle": recycle}
+
+
+class _PoolWorker:
+    """常驻工作进程及其专属的任务/日志队列"""
+
+    def __init__(self, ctx, target: Callable, max_jobs: int):
+        self.job_queue = ctx.Queue()
+        self.log_queue = ctx.Queue()
+        self.reserved = False  # 仅在父进程中使用
+        self.process = ctx.Process(
+            target=target,
+            args=(self.job_queue, self.log_queue, max_jobs),
+            daemon=True,
+        )
+        self.process.start()
+
+    def is_available(self) -> bool:
+        return not self.reserved and self.process.is_alive()
+
+    def kill(self):
+        try:
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join(timeout=2.0)
+                if self.process.is_alive():
+                    self.process.kill()
+                    self.process.join(timeout=1.0)
+        except Exception:
+            pass
+
+
+class PooledProcess:
+    """
+    与 multiprocessing.Process 接口兼容的任务句柄：start/is_alive/join/terminate/kill/pid/exitcode
+    任务在常驻工作进程中执行，任务完成后 is_alive() 返回 False，工作进程归还进程池
+    """
+
+    def __init__(self, pool: "WarmWorkerPool", job: Any):
+        self._pool = pool
+        self._job = job
+        self._worker: Optional[_PoolWorker] = None
+        self._terminated = False
+        self._finished = False
+        # 保护 _worker/_terminated：等待空闲进程期间可能被其他线程取消
+        self._state_lock = threading.Lock()
+        # 句柄创建时就要交出日志队列，而工作进程在 start() 时才分配，因此由转发线程中转
+        self.log_queue: "queue.Queue[Any]" = queue.Queue()
+        self._forward_thread: Optional[threading.Thread] = None
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._worker.process.pid if self._worker else None
+
+    @property
+    def exitcode(self) -> Optional[int]:
+        if self._terminated:
+            return -15
+        return 0 if self._finished else None
+
+    def start(self):
+        """分配空闲工作进程并派发任务，所有工作进程繁忙时阻塞等待（等待期间可被取消）"""
+        worker = self._pool._acquire(lambda: self._terminated)
+        if worker is None:
+            return
+        with self._state_lock:
+            if self._terminated:
+                self._pool._release(worker)
+                return
+            self._worker = worker
+            worker.job_queue.put(self._job)
+        self._forward_thread = threading.Thread(target=self._forward_logs, daemon=True)
+        self._forward_thread.start()
+
+    def _forward_logs(self):
+        worker = self._worker
+        while worker is not None and not self._terminated:
+            try:
+                msg = worker.log_queue.get(timeout=0.2)
+            except queue.Empty:
+                if not worker.process.is_alive():
+                    # 工作进程异常退出
+                    self._finished = True
+                    self._pool._discard(worker)
+                    return
+                continue
+            except Exception:
+                return
+
+            if isinstance(msg, dict) and msg.get("type") == JOB_DONE_TYPE:
+                self._finished = True
+                if msg.get("recycle"):
+                    self._pool._discard(worker)
+                else:
+                    self._pool._release(worker)
+                return
+            self.log_queue.put(msg)
+
+    def is_alive(self) -> bool:
+        if self._worker is None or self._terminated:
+            return False
+        return self._forward_thread is not None and self._forward_thread.is_alive()
+
+    def join(self, timeout: Optional[float] = None):
+        if self._forward_thread is not None:
+            self._forward_thread.join(timeout)
+
+    def terminate(self):
+        """CrewAI 无法中途取消，只能终止工作进程，由进程池补充新进程"""
+        with self._state_lock:
+            if self._terminated or self._finished:
+                return
+            self._terminated = True
+            worker = self._worker
+        if worker is None:
+            # 尚未分配工作进程，唤醒 start() 中的等待即可
+            self._pool._notify()
+            return
+        self._pool._discard(worker)
+
+    def kill(self):
+        self.terminate()
+
+
+class WarmWorkerPool:
+    """预先启动的常驻工作进程池，复用已加载的依赖、配置和LLM客户端"""
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, target: Callable, size: int = 2, max_jobs_per_worker: int = 0):
+        self._target = target
+        self.size = max(1, size)
+        # 每个进程执行指定数量的任务后自动退出并被替换，0 表示不回收
+        self.max_jobs_per_worker = max(0, max_jobs_per_worker)
+        self._ctx = multiprocessing.get_context("spawn")
+        self._workers: List[_PoolWorker] = []
+        self._condition = threading.Condition()
+        self._closed = False
+
+    @classmethod
+    def get_instance(cls, target: Callable, size: int = 2, max_jobs_per_worker: int = 0):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls(target, size, max_jobs_per_worker)
+        return cls._instance
+
+    def start(self):
+        """预先启动全部工作进程"""
+        with self._condition:
+            self._closed = False
+            self._replenish()
+
+    def _replenish(self):
+        self._workers = [w for w in self._workers if w.reserved or w.process.is_alive()]
+        while len(self._workers) < self.size:
+            self._workers.append(_PoolWorker(self._ctx, self._target, self.max_jobs_per_worker))
+
+    def _acquire(self, cancelled: Optional[Callable[[], bool]] = None) -> Optional[_PoolWorker]:
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("进程池已关闭")
+                if cancelled is not None and cancelled():
+                    return None
+                # 补充已退出（达到任务上限或异常）的进程
+                self._replenish()
+                for worker in self._workers:
+                    if worker.is_available():
+                        worker.reserved = True
+                        return worker
+                self._condition.wait(timeout=0.5)
+
+    def _release(self, worker: _PoolWorker):
+        with self._condition:
+            worker.reserved = False
+            self._condition.notify_all()
+
+    def _notify(self):
+        with self._condition:
+            self._condition.notify_all()
+
+    def _discard(self, worker: _PoolWorker):
+        worker.kill()
+        with self._condition:
+            if worker in self._workers:
+                self._workers.remove(worker)
+            self._condition.notify_all()
+
+    def create_process(self, job: Any) -> PooledProcess:
+        """创建任务句柄，调用 start() 后才会真正派发"""
+        return PooledProcess(self, job)
+
+    def shutdown(self):
+        """关闭进程池：空闲进程正常退出，繁忙进程直接终止"""
+        with self._condition:
+            self._closed = True
+            for worker in self._workers:
+                if worker.reserved:
+                    worker.kill()
+                else:
+                    worker.job_queue.put(None)
+            self._workers = []
+            self._condition.notify_all()
@@ -1,10 +1,12 @@
 #!/usr/bin/env python
 import os
+import argparse
 import warnings
 import multiprocessing
 import signal
 import time
 import json
+import uuid
 
 from src.ai_write_x.utils.path_manager import PathManager
 from src.ai_write_x.tools import hotnews
@@ -12,6 +14,9 @@ from src.ai_write_x.utils import utils
 from src.ai_write_x.utils import log
 from src.ai_write_x.config.config import Config
 from src.ai_write_x.core.system_init import setup_aiwritex
+from src.ai_write_x.core.batch_runner import BatchContentRunner, BatchTask
+from src.ai_write_x.core.checkpoint import RunCheckpoint
+from src.ai_write_x.core.worker_pool import WarmWorkerPool, job_done_message
 
 
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pysbd")
@@ -21,6 +26,26 @@ warnings.filterwarnings("ignore", category=UserWarning, module="pydantic.*")
 os.environ["OTEL_SDK_DISABLED"] = "true"
 os.environ["CREWAI_DISABLE_TELEMETRY"] = "true"
 
+# 常驻工作进程在每个任务前重置的自定义话题参数
+_CUSTOM_TASK_DEFAULTS = {
+    "custom_topic": "",
+    "urls": [],
+    "reference_ratio": 0.0,
+    "custom_template_category": "",
+    "custom_template": "",
+    "publish_platforms": [],
+}
+
+
+def build_task_config(config_data=None):
+    """任务配置：以自定义话题参数的默认值为基础，任务未指定的参数不沿用上一个任务的设置"""
+    task_config = {
+        key: list(value) if isinstance(value, list) else value
+        for key, value in _CUSTOM_TASK_DEFAULTS.items()
+    }
+    task_config.update(config_data or {})
+    return task_config
+
 
 def run_crew_in_process(inputs, log_queue, config_data=None):
     """在独立进程中运行 CrewAI 工作流"""
@@ -74,8 +99,8 @@ def run_crew_in_process(inputs, log_queue, config_data=None):
         # 添加调试信息
         log.print_log(f"任务参数：API类型={config.api_type}，模型={config.api_model} ", "status")
 
-        # 执行任务
-        result = run(inputs)
+        # 执行任务（列表输入为批量模式）
+        result = run_batch(inputs) if isinstance(inputs, list) else run(inputs)
 
         # 发送成功消息
         log_queue.put(
@@ -101,6 +126,67 @@ def run_crew_in_process(inputs, log_queue, config_data=None):
         os._exit(0)
 
 
+def _get_mtime(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def run_crew_in_worker(job_queue, log_queue, max_jobs=0):
+    """常驻工作进程：只导入依赖、加载配置一次，循环执行进程池派发的任务"""
+    # 设置进程专用日志系统
+    log.setup_process_logging(log_queue)
+    # 设置进程间日志队列
+    log.set_process_queue(log_queue)
+
+    config = Config.get_instance()
+    config.load_config()
+    config_mtime = _get_mtime(config.config_path)
+    jobs_done = 0
+
+    while True:
+        job = job_queue.get()
+        if job is None:
+            break
+
+        inputs, config_data, parent_env = job
+        jobs_done += 1
+        recycle = max_jobs > 0 and jobs_done >= max_jobs
+        try:
+            # 同步主进程的环境变量和配置数据
+            os.environ.update(parent_env)
+            for key, value in build_task_config(config_data).items():
+                setattr(config, key, value)
+
+            # 配置文件有变更时才重新加载
+            mtime = _get_mtime(config.config_path)
+            if mtime != config_mtime:
+                config.load_config()
+                config_mtime = mtime
+
+            log.print_log(f"任务参数：API类型={config.api_type}，模型={config.api_model} ", "status")
+
+            # 执行任务（列表输入为批量模式）
+            result = run_batch(inputs) if isinstance(inputs, list) else run(inputs)
+
+            log_queue.put(
+                {
+                    "type": "internal",
+                    "message": "任务执行完成",
+                    "result": result,
+                    "timestamp": time.time(),
+                }
+            )
+        except Exception as e:
+            log_queue.put({"type": "error", "message": str(e), "timestamp": time.time()})
+        finally:
+            log_queue.put(job_done_message(recycle))
+
+        if recycle:
+            break
+
+
 def run(inputs):
     """
     Run the crew.
@@ -108,6 +194,10 @@ def run(inputs):
     try:
         workflow = setup_aiwritex()
 
+        # 从检查点恢复
+        if inputs.get("run_id"):
+            return workflow.resume(inputs["run_id"])
+
         # 提取参数
         topic = inputs.get("topic", "")
 
@@ -118,6 +208,12 @@ def run(inputs):
             "reference_ratio": inputs.get("reference_ratio", 0.0),
         }
 
+        # 多平台模式：基础内容生成一次，再并发适配到各平台
+        if inputs.get("publish_platforms"):
+            return workflow.execute_multi_platform(
+                topic=topic, platforms=inputs["publish_platforms"], **kwargs
+            )
+
         return workflow.execute(topic=topic, **kwargs)
 
     except Exception as e:
@@ -125,14 +221,76 @@ def run(inputs):
         raise Exception(f"An error occurred while running the crew: {e}")
 
 
+def run_batch(inputs_list):
+    """
+    Run the crew for multiple topics concurrently.
+    """
+    tasks = [
+        BatchTask(
+            topic=inputs.get("topic", ""),
+            platform=inputs.get("platform", ""),
+            urls=inputs.get("urls", []),
+            reference_ratio=inputs.get("reference_ratio", 0.0),
+        )
+        for inputs in inputs_list
+    ]
+    return BatchContentRunner().run(tasks)
+
+
+def start_worker_pool():
+    """预先启动常驻工作进程池（未启用时不做任何事）"""
+    pool_config = Config.get_instance().worker_pool_config
+    if not pool_config["enabled"]:
+        return None
+
+    pool = WarmWorkerPool.get_instance(
+        run_crew_in_worker, pool_config["size"], pool_config["max_jobs_per_worker"]
+    )
+    pool.start()
+    return pool
+
+
+def shutdown_worker_pool():
+    """关闭常驻工作进程池"""
+    if WarmWorkerPool._instance is not None:
+        WarmWorkerPool._instance.shutdown()
+
+
+def _create_task_process(inputs, config_data):
+    """创建任务进程：启用常驻进程池时派发到池中执行，否则新建子进程"""
+    pool_config = Config.get_instance().worker_pool_config
+    if pool_config["enabled"]:
+        pool = WarmWorkerPool.get_instance(
+            run_crew_in_worker, pool_config["size"], pool_config["max_jobs_per_worker"]
+        )
+        # 环境变量随任务直接发送，无需经由临时文件
+        process = pool.create_process((inputs, config_data, dict(os.environ)))
+        return process, process.log_queue
+
+    # 创建进程间通信队列
+    log_queue = multiprocessing.Queue()
+    process = multiprocessing.Process(
+        target=run_crew_in_process,
+        args=(inputs, log_queue, config_data),
+        daemon=False,
+    )
+    return process, log_queue
+
+
 def ai_write_x_run(config_data=None):
     """执行 AI 写作任务"""
     config = Config.get_instance()
     # 准备输入参数
     log.print_log("正在初始化任务参数，请耐心等待...")
     if not config.custom_topic:
-        platform = utils.get_random_platform(config.platforms)
-        topic = hotnews.select_platform_topic(platform, 5)  # 前五个热门话题根据一定权重选一个
+        if config.hotnews_config["topic_index"]:
+            # 合并启用平台的热榜，去重后按跨平台热度选题
+            enabled_platforms = [p for p in config.platforms if p.get("enabled", True)]
+            selected = hotnews.select_indexed_topic(enabled_platforms or config.platforms, 5)
+            platform, topic = selected["platform"], selected["topic"]
+        else:
+            platform = utils.get_random_platform(config.platforms)
+            topic = hotnews.select_platform_topic(platform, 5)  # 前五个热门话题根据一定权重选一个
         urls = []
         reference_ratio = 0
     else:
@@ -146,18 +304,12 @@ def ai_write_x_run(config_data=None):
         "topic": topic,
         "urls": urls,
         "reference_ratio": reference_ratio,
+        "publish_platforms": config.publish_platforms or config.multi_platform_config["platforms"],
     }
 
     if config_data:
         try:
-            # 创建进程间通信队列
-            log_queue = multiprocessing.Queue()
-            process = multiprocessing.Process(
-                target=run_crew_in_process,
-                args=(inputs, log_queue, config_data),
-                daemon=False,
-            )
-            return process, log_queue
+            return _create_task_process(inputs, config_data)
         except Exception as e:
             log.print_log(str(e), "error")
             return None, None
@@ -172,14 +324,14 @@ def ai_write_x_run(config_data=None):
             return False, None
 
 
-def ai_write_x_main(config_data=None):
-    """主入口函数"""
+def _prepare_environment(config_data=None):
+    """加载、应用并验证配置，设置LLM环境变量；失败返回 False"""
     config = Config.get_instance()
 
     # 统一的配置加载和验证
     if not config.load_config():
         log.print_log("加载配置失败，请检查是否有配置！", "error")
-        return None, None
+        return False
 
     # 如果是 UI 启动会传递配置数据，应用到当前进程
     if config_data:
@@ -188,21 +340,17 @@ def ai_write_x_main(config_data=None):
     # 非UI启动，不传递config_data，需要验证配置
     elif not config.validate_config():
         log.print_log(f"配置填写有错误：{config.error_message}", "error")
-        return None, None
-
-    task_model = "自定义" if config.custom_topic else "热搜随机"
-    log.print_log(f"开始执行任务，话题模式：{task_model}")
+        return False
 
-    # 保存环境变量到临时文件
-    if config_data:
-        env_file = PathManager.get_temp_dir() / f"env_{os.getpid()}.json"
+    # 保存环境变量到临时文件（常驻进程池随任务直接发送环境变量）
+    if config_data and not config.worker_pool_config["enabled"]:
+        # 队列中可能同时启动多个任务，文件名需唯一，避免子进程互相删除
+        env_file = PathManager.get_temp_dir() / f"env_{os.getpid()}_{uuid.uuid4().hex[:8]}.json"
         try:
             with open(env_file, "w", encoding="utf-8") as f:
                 json.dump(dict(os.environ), f, ensure_ascii=False, indent=2)
 
             # 将环境文件路径添加到config_data
-            if config_data is None:
-                config_data = {}
             config_data["env_file_path"] = str(env_file)
 
         except Exception:
@@ -214,10 +362,117 @@ def ai_write_x_main(config_data=None):
     os.environ["OPENAI_API_BASE"] = config.api_apibase
     os.environ["OPENAI_BASE_URL"] = config.api_apibase
 
+    return True
+
+
+def ai_write_x_main(config_data=None):
+    """主入口函数"""
+    if not _prepare_environment(config_data):
+        return None, None
+
+    config = Config.get_instance()
+    task_model = "自定义" if config.custom_topic else "热搜随机"
+    log.print_log(f"开始执行任务，话题模式：{task_model}")
+
     # 直接启动内容生成，不处理发布
     return ai_write_x_run(config_data=config_data)
 
 
+def ai_write_x_batch_run(topics=None, top_k=0, config_data=None):
+    """执行批量写作任务：指定话题列表，或从所有启用平台的热搜中选取前 top_k 个"""
+    config = Config.get_instance()
+    log.print_log("正在初始化批量任务参数，请耐心等待...")
+
+    if topics:
+        inputs_list = [
+            {
+                "platform": "",
+                "topic": topic,
+                "urls": config.urls,
+                "reference_ratio": config.reference_ratio,
+            }
+            for topic in topics
+            if topic
+        ]
+    else:
+        top_k = top_k or config.batch_config["top_k"]
+        enabled_platforms = [p["name"] for p in config.platforms if p.get("enabled", True)]
+        selected = hotnews.select_top_topics(enabled_platforms, top_k)
+        inputs_list = [
+            {"platform": item["platform"], "topic": item["topic"], "urls": [], "reference_ratio": 0}
+            for item in selected
+        ]
+
+    if not inputs_list:
+        log.print_log("没有可执行的话题", "error")
+        return (None, None) if config_data else (False, None)
+
+    if config_data:
+        try:
+            return _create_task_process(inputs_list, config_data)
+        except Exception as e:
+            log.print_log(str(e), "error")
+            return None, None
+    else:
+        try:
+            results = run_batch(inputs_list)
+            return all(r.success for r in results), results
+        except Exception as e:
+            log.print_log(f"执行出错：{str(e)}", "error")
+            return False, None
+
+
+def ai_write_x_batch_main(topics=None, top_k=0, config_data=None):
+    """批量任务入口函数"""
+    if not _prepare_environment(config_data):
+        return None, None
+
+    log.print_log(f"开始执行批量任务，话题模式：{'自定义' if topics else '热搜前K'}")
+    return ai_write_x_batch_run(topics=topics, top_k=top_k, config_data=config_data)
+
+
+def ai_write_x_resume(run_id, config_data=None):
+    """从检查点恢复写作任务，跳过已完成的阶段"""
+    if not _prepare_environment(config_data):
+        return None, None
+
+    log.print_log(f"开始恢复任务，检查点：{run_id}")
+    inputs = {"run_id": run_id}
+
+    if not config_data:
+        # 命令行恢复：沿用检查点中首次执行时的话题、参考链接和模板
+        try:
+            task_config = RunCheckpoint.load(run_id).task_config()
+        except ValueError as e:
+            log.print_log(str(e), "error")
+            return False, None
+        config = Config.get_instance()
+        for key, value in task_config.items():
+            setattr(config, key, value)
+
+    if config_data:
+        try:
+            return _create_task_process(inputs, config_data)
+        except Exception as e:
+            log.print_log(str(e), "error")
+            return None, None
+    else:
+        try:
+            result = run(inputs)
+            log.print_log("任务完成！")
+            return True, result
+        except Exception as e:
+            log.print_log(f"执行出错：{str(e)}", "error")
+            return False, None
+
+
 if __name__ == "__main__":
     if not utils.get_is_release_ver():
-        ai_write_x_main()
+        parser = argparse.ArgumentParser(description="AIWriteX CLI")
+        parser.add_argument("--resume", metavar="RUN_ID", help="从指定检查点恢复执行")
+        args = parser.parse_args()
+
+        if args.resume:
+            ai_write_x_resume(args.resume)
+        else:
+            ai_write_x_main()
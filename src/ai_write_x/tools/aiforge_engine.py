@@ -0,0 +1,106 @@
+import hashlib
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.ai_write_x.config.config import Config
+from src.ai_write_x.utils import log
+
+from aiforge import AIForgeEngine
+
+
+class AIForgeEngineManager:
+    """
+    进程级 AIForgeEngine 管理：按 aiforge.toml 的内容指纹复用引擎实例，
+    配置文件内容变化时才重新创建，避免每次搜索都重新解析配置、初始化 provider。
+    引擎不保证线程安全，以小型引擎池的方式复用：每次调用独占一个空闲引擎，不同调用可并发执行
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self._fingerprint = ""
+        # 当前指纹下的空闲引擎，配置变化时整体丢弃
+        self._idle: List[AIForgeEngine] = []
+        self._in_use = 0
+        # 配置文件的 (路径, mtime, 大小) 及其内容指纹，文件未变化时无需重新读取
+        self._file_state: Optional[Tuple[str, int, int]] = None
+        self._file_fingerprint = ""
+        # 只保护指纹计算、引擎创建和空闲列表，不在执行期间持有
+        self._engine_lock = threading.Lock()
+        self.stats = {"builds": 0, "reuses": 0}
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def _current_fingerprint(self, config_path: str) -> str:
+        try:
+            stat = os.stat(config_path)
+        except OSError:
+            self._file_state = None
+            return f"{config_path}:missing"
+
+        file_state = (config_path, stat.st_mtime_ns, stat.st_size)
+        if file_state != self._file_state:
+            with open(config_path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            self._file_state = file_state
+            self._file_fingerprint = f"{config_path}:{digest}"
+        return self._file_fingerprint
+
+    def _checkout(self) -> Tuple[AIForgeEngine, str]:
+        """取出一个空闲引擎，没有则创建；配置内容与上次不同时丢弃旧引擎"""
+        config_path = Config.get_instance().config_aiforge_path
+        with self._engine_lock:
+            fingerprint = self._current_fingerprint(config_path)
+            if fingerprint != self._fingerprint:
+                if self._fingerprint:
+                    log.print_log("AIForge 配置已变化，重新创建引擎")
+                self._idle = []
+                self._fingerprint = fingerprint
+
+            self._in_use += 1
+            if self._idle:
+                self.stats["reuses"] += 1
+                return self._idle.pop(), fingerprint
+
+            try:
+                engine = AIForgeEngine(config_file=config_path)
+            except Exception:
+                self._in_use -= 1
+                raise
+            self.stats["builds"] += 1
+            return engine, fingerprint
+
+    def _checkin(self, engine: AIForgeEngine, fingerprint: str):
+        with self._engine_lock:
+            self._in_use -= 1
+            # 使用期间配置已变化的引擎不再放回
+            if fingerprint == self._fingerprint:
+                self._idle.append(engine)
+
+    def run(self, instruction: str) -> Any:
+        """独占一个引擎执行指令，同一引擎不会被并发使用"""
+        engine, fingerprint = self._checkout()
+        try:
+            return engine(instruction)
+        finally:
+            self._checkin(engine, fingerprint)
+
+    def reset(self):
+        """丢弃空闲引擎，下次使用时重新创建"""
+        with self._engine_lock:
+            self._idle = []
+            self._fingerprint = ""
+            self._file_state = None
+            self._file_fingerprint = ""
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._engine_lock:
+            return {**self.stats, "idle": len(self._idle), "in_use": self._in_use}
@@ -0,0 +1,230 @@
+import atexit
+import threading
+import time
+from typing import List, Optional
+
+from src.ai_write_x.config.config import Config
+from src.ai_write_x.utils import log
+
+
+# 空闲标签页停留的页面，新导航提交前文档仍是该页面
+_BLANK_URL = "about:blank"
+
+# 页面就绪状态：当前文档地址，以及 DOM 解析完成且出现正文容器
+_READY_SCRIPT = """
+return [document.URL,
+        document.readyState !== 'loading' && !!document.querySelector(arguments[0])];
+"""
+
+
+class BrowserPool:
+    """
+    进程级无头浏览器服务：常驻一个 Chrome 实例，以标签页为单位复用并限制并发数。
+    页面以 pageLoadStrategy=none 加载，轮询正文选择器出现即视为就绪，不再固定等待
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, max_tabs: int = 4, ready_timeout: float = 15, ready_selector: str = "p"):
+        self.max_tabs = max(1, max_tabs)
+        self.ready_timeout = ready_timeout
+        self.ready_selector = ready_selector
+        self._driver = None
+        # WebDriver 同一时刻只能操作一个标签页，切换与命令需串行
+        self._driver_lock = threading.RLock()
+        self._tab_slots = threading.Semaphore(self.max_tabs)
+        self._idle_tabs: List[str] = []
+        self.stats = {"launches": 0, "pages": 0, "timeouts": 0, "redirects": 0, "errors": 0}
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    config = Config.get_instance().browser_pool_config
+                    cls._instance = cls(
+                        max_tabs=config["max_tabs"],
+                        ready_timeout=config["ready_timeout"],
+                        ready_selector=config["ready_selector"],
+                    )
+                    atexit.register(cls._instance.close)
+        return cls._instance
+
+    def _create_driver(self):
+        from selenium import webdriver
+
+        options = webdriver.ChromeOptions()
+        for argument in ("--headless=new", "--no-sandbox", "--disable-dev-shm-usage"):
+            options.add_argument(argument)
+        # 不等待页面完全加载，由就绪条件决定何时读取内容
+        options.page_load_strategy = "none"
+        driver = webdriver.Chrome(options=options)
+        self.stats["launches"] += 1
+        return driver
+
+    def _ensure_driver(self):
+        if self._driver is None:
+            self._driver = self._create_driver()
+            # 启动时自带的空白页作为第一个可复用标签页
+            self._idle_tabs = [self._driver.current_window_handle]
+        return self._driver
+
+    def _acquire_tab(self) -> str:
+        with self._driver_lock:
+            driver = self._ensure_driver()
+            if self._idle_tabs:
+                return self._idle_tabs.pop()
+            driver.switch_to.new_window("tab")
+            return driver.current_window_handle
+
+    def _release_tab(self, handle: str):
+        """
+        标签页导航到空白页后放回空闲列表，停止仍在加载的页面，
+        也保证下次导航提交前读到的是空白页而不是上一个页面；未能回到空白页的标签页直接关闭
+        """
+        with self._driver_lock:
+            if self._driver is None:
+                return
+            try:
+                self._driver.switch_to.window(handle)
+                self._driver.get(_BLANK_URL)
+            except Exception:
+                self._discard_tab(handle)
+                return
+
+        deadline = time.monotonic() + 2
+        while True:
+            with self._driver_lock:
+                if self._driver is None:
+                    return
+                try:
+                    self._driver.switch_to.window(handle)
+                    if self._driver.execute_script("return document.URL;") == _BLANK_URL:
+                        self._idle_tabs.append(handle)
+                        return
+                except Exception:
+                    pass
+                if time.monotonic() >= deadline:
+                    self._discard_tab(handle)
+                    return
+            time.sleep(0.05)
+
+    def _is_alive(self) -> bool:
+        try:
+            self._driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def _discard_tab(self, handle: str):
+        """关闭出错的标签页，不影响其他标签页；浏览器本身已失效时才重启"""
+        with self._driver_lock:
+            if self._driver is None:
+                return
+            if not self._is_alive():
+                log.print_log("浏览器已失效，将在下次使用时重新启动", "warning")
+                self.close()
+                return
+            try:
+                self._driver.switch_to.window(handle)
+                if len(self._driver.window_handles) > 1:
+                    self._driver.close()
+                    return
+                # 关闭最后一个标签页会结束浏览器：停止加载并回到空白页后放回空闲列表，
+                # 下次使用时 _wait_ready 只接受新请求的地址，不会读到残留内容
+                self._driver.execute_script("window.stop();")
+                self._driver.get(_BLANK_URL)
+            except Exception:
+                log.print_log("无法重置浏览器标签页，将在下次使用时重新启动", "warning")
+                self.close()
+                return
+            if handle not in self._idle_tabs:
+                self._idle_tabs.append(handle)
+
+    @staticmethod
+    def _same_page(current: str, requested: str) -> bool:
+        return current.split("#")[0].rstrip("/") == requested.split("#")[0].rstrip("/")
+
+    def _wait_ready(self, handle: str, url: str, ready_selector: str, timeout: float) -> bool:
+        """
+        等待新页面就绪：文档地址须为请求的 url，或在离开空白页后重定向到的地址，
+        避免在导航提交前读到标签页上一个页面的内容
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._driver_lock:
+                self._driver.switch_to.window(handle)
+                current, ready = self._driver.execute_script(_READY_SCRIPT, ready_selector)
+            # 浏览器启动时自带的标签页停留在 data:, 页面
+            if current not in (_BLANK_URL, "data:,") and ready:
+                if not self._same_page(current, url):
+                    self.stats["redirects"] += 1
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.2)
+
+    def fetch_html(
+        self,
+        url: str,
+        css_element: str = "body",
+        ready_selector: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """
+        在空闲标签页中打开 url，等待 ready_selector 出现（最多 timeout 秒），
+        返回 css_element 对应元素的 HTML；超时仍返回当前已加载的内容
+        """
+        from selenium.webdriver.common.by import By
+
+        ready_selector = ready_selector or self.ready_selector
+        timeout = self.ready_timeout if timeout is None else timeout
+
+        with self._tab_slots:
+            handle = None
+            try:
+                handle = self._acquire_tab()
+                with self._driver_lock:
+                    self._driver.switch_to.window(handle)
+                    self._driver.get(url)
+
+                if not self._wait_ready(handle, url, ready_selector, timeout):
+                    self.stats["timeouts"] += 1
+
+                with self._driver_lock:
+                    self._driver.switch_to.window(handle)
+                    elements = self._driver.find_elements(By.CSS_SELECTOR, css_element)
+                    html = "\n".join(e.get_attribute("outerHTML") for e in elements)
+                self.stats["pages"] += 1
+                return html
+            except Exception as e:
+                self.stats["errors"] += 1
+                log.print_log(f"浏览器加载页面失败: {url}, {str(e)}", "warning")
+                # 只丢弃出错的标签页，其他标签页中进行中的请求不受影响
+                if handle is not None:
+                    self._discard_tab(handle)
+                    handle = None
+                raise
+            finally:
+                if handle is not None:
+                    self._release_tab(handle)
+
+    def get_stats(self):
+        with self._driver_lock:
+            return {
+                **self.stats,
+                "running": self._driver is not None,
+                "idle_tabs": len(self._idle_tabs),
+                "max_tabs": self.max_tabs,
+            }
+
+    def close(self):
+        with self._driver_lock:
+            if self._driver is not None:
+                try:
+                    self._driver.quit()
+                except Exception:
+                    pass
+            self._driver = None
+            self._idle_tabs = []
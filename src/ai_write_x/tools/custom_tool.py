@@ -1,17 +1,23 @@
-import os
-import glob
-import random
+import hashlib
+import json
 import sys
-from typing import List, Type
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Set, Tuple, Type
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
-from src.ai_write_x.utils import utils
 from src.ai_write_x.config.config import Config
 from src.ai_write_x.utils import log
 from src.ai_write_x.tools import search_template
-from src.ai_write_x.utils.path_manager import PathManager
+from src.ai_write_x.tools.aiforge_engine import AIForgeEngineManager
+from src.ai_write_x.tools.search_context import SearchContextBuilder
+from src.ai_write_x.tools.template_index import TemplateIndex
+from src.ai_write_x.tools.web_cache import WebContentCache
 
 from aiforge import AIForgeEngine
 
@@ -28,61 +34,66 @@ class ReadTemplateTool(BaseTool):
     )
     args_schema: Type[BaseModel] = ReadTemplateToolInput
 
+    @staticmethod
+    def _template_setting() -> Tuple[str, str]:
+        """返回 (模板分类, 模板)，根据custom_topic是否为空选择配置源"""
+        config = Config.get_instance()
+        if config.custom_topic:
+            # 使用自定义话题的模板配置
+            return config.custom_template_category, config.custom_template
+        # 使用应用配置
+        return config.template_category, config.template
+
+    @classmethod
+    def input_digest(cls) -> str:
+        """可能选用的模板内容摘要，模板修改后LLM结果缓存随之失效"""
+        config = Config.get_instance()
+        template_index = TemplateIndex.get_instance()
+        template_category, template = cls._template_setting()
+
+        selected_template = None
+        if template and template_category:
+            selected_template = template_index.get(template_category, template)
+        candidates = (
+            [selected_template]
+            if selected_template
+            else template_index.templates(template_category or "")
+        )
+
+        digest = hashlib.sha256(f"compress={config.use_compress}".encode("utf-8"))
+        for entry in candidates:
+            digest.update(entry.key.encode("utf-8"))
+            digest.update(entry.content.encode("utf-8"))
+        return digest.hexdigest()
+
     def _run(self) -> str:
         config = Config.get_instance()
 
-        # 获取模板文件的绝对路径
-        template_dir_abs = PathManager.get_template_dir()
+        # 模板及其瘦身结果由索引常驻内存，选择模板无需读取磁盘
+        template_index = TemplateIndex.get_instance()
+        template_category, template = self._template_setting()
 
-        # 根据custom_topic是否为空选择配置源
-        if config.custom_topic:
-            # 使用自定义话题的模板配置
-            template_category = config.custom_template_category
-            template = config.custom_template
-        else:
-            # 使用应用配置
-            template_category = config.template_category
-            template = config.template
-
-        random_template = True
-        selected_template_file: str = ""
-
-        # 如果指定了具体模板且存在，则不随机
-        if template and template != "":  # 随机模板的条件是""
-            template_filename = template if template.endswith(".html") else f"{template}.html"
-
-            # 如果指定了分类，在分类目录下查找
-            if template_category and template_category != "":  # 实际上选则了模板，也一定选择了分类
-                category_dir = os.path.join(template_dir_abs, template_category)
-                selected_template_file = os.path.join(category_dir, template_filename)
-
-            if os.path.exists(path=selected_template_file):
-                random_template = False
-
-        # 需要随机选择模板
-        if random_template:
-            # 如果指定了分类且不是随机分类
-            if template_category and template_category != "":
-                category_dir = os.path.join(template_dir_abs, template_category)
-                template_files_abs = glob.glob(os.path.join(category_dir, "*.html"))
-            else:
-                # 随机分类或未指定分类，从所有分类的模板中选择
-                template_files_abs = glob.glob(os.path.join(template_dir_abs, "*", "*.html"))
-
-            if not template_files_abs:
-                log.print_log(
-                    f"在目录 '{template_dir_abs}' 中未找到任何模板文件。如果没有模板请将config.yaml中的use_template设置为false"
-                )
-                sys.exit(1)
+        selected_template = None
+
+        # 如果指定了具体模板且存在，则不随机（随机模板的条件是""）
+        # 实际上选择了模板，也一定选择了分类
+        if template and template_category:
+            selected_template = template_index.get(template_category, template)
 
-            selected_template_file = random.choice(template_files_abs)
+        # 需要随机选择模板：指定了分类时在分类中选择，随机分类或未指定分类时从所有模板中选择
+        if selected_template is None:
+            selected_template = template_index.choose(template_category or "")
 
-        with open(selected_template_file, "r", encoding="utf-8") as file:
-            selected_template_content = file.read()
+        if selected_template is None:
+            log.print_log(
+                f"在目录 '{template_index.template_dir}' 中未找到任何模板文件。"
+                "如果没有模板请将config.yaml中的use_template设置为false"
+            )
+            sys.exit(1)
 
-        template_content = utils.compress_html(
-            selected_template_content,
-            config.use_compress,
+        # 压缩模板时使用压缩并瘦身后的版本
+        template_content = (
+            selected_template.slim if config.use_compress else selected_template.content
         )
 
         log.print_log("模板填充适配处理比较耗时，请耐心等待...")
@@ -115,6 +126,145 @@ class ReadTemplateTool(BaseTool):
 
 
 # 2. AIForge Search Tool
+def fetch_search_results(topic: str, urls: List[str]) -> Tuple[Optional[List[Dict]], str]:
+    """无参考链接时搜索话题，否则提取参考链接内容，返回 (结果, 来源类型)"""
+    results = None
+    config = Config.get_instance()
+
+    if len(urls) == 0:
+        log.print_log("开始执行搜索，请耐心等待...")
+        results = AIForgeSearchTool._excute_search(
+            topic,
+            config.aiforge_search_max_results,
+            config.aiforge_search_min_results,
+            config.aiforge_api_key,
+        )
+
+        source_type = "搜索"
+    else:
+        log.print_log("开始提取参考链接中的文章信息，请耐心等待...")
+        extract_results = search_template.extract_urls_content(urls, topic)
+        # 这里只要参考文章获取到一条有效结果，就认为通过， 当然也可以len(urls)条结果
+        if search_template.validate_search_result(
+            extract_results, min_results=1, search_type="reference_article"
+        ):
+            results = extract_results.get("results")
+
+        source_type = "参考文章"
+
+    return results, source_type
+
+
+# 当前工作流执行对应的预取标识，随上下文传递到 Crew 执行搜索工具的线程中
+_current_prefetch: ContextVar[str] = ContextVar("aiwritex_search_prefetch", default="")
+
+
+class SearchPrefetcher:
+    """
+    搜索结果预取：话题确定后即在后台开始搜索（或提取参考链接），
+    与 Crew 和 Agent 的创建并行；搜索工具被调用时直接取用或等待进行中的结果。
+    预取按工作流的每次执行区分，不依赖 Agent 传入的话题措辞
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="aiwritex-prefetch")
+        self._pending: Dict[str, Future] = {}
+        # 丢弃时已在执行、无法取消的搜索，完成后移除
+        self._abandoned: Set[Future] = set()
+        self._pending_lock = threading.Lock()
+        self.stats = {"started": 0, "used": 0, "discarded": 0, "abandoned": 0}
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @contextmanager
+    def run(self, topic: str, urls: List[str]):
+        """开始预取，该上下文中调用的搜索工具取用本次预取的结果，退出时丢弃未使用的预取"""
+        run_key = self.prefetch(topic, urls)
+        token = _current_prefetch.set(run_key)
+        try:
+            yield run_key
+        finally:
+            _current_prefetch.reset(token)
+            self.discard(run_key)
+
+    def prefetch(self, topic: str, urls: List[str]) -> str:
+        run_key = uuid.uuid4().hex
+        with self._pending_lock:
+            self._pending[run_key] = self._executor.submit(fetch_search_results, topic, list(urls))
+            self.stats["started"] += 1
+        return run_key
+
+    def take(self, run_key: str = "") -> Optional[Tuple[Optional[List[Dict]], str]]:
+        """
+        取出当前执行的预取结果，仍在进行中时等待其完成；
+        未预取、已被取用或预取失败返回 None
+        """
+        run_key = run_key or _current_prefetch.get()
+        if not run_key:
+            return None
+        with self._pending_lock:
+            future = self._pending.pop(run_key, None)
+        if future is None:
+            return None
+        try:
+            result = future.result()
+        except Exception as e:
+            log.print_log(f"预取搜索结果失败，将重新搜索: {str(e)}", "warning")
+            return None
+        with self._pending_lock:
+            self.stats["used"] += 1
+        return result
+
+    def peek(self, run_key: str = "") -> Optional[Tuple[Optional[List[Dict]], str]]:
+        """等待当前执行的预取结果但不取出，搜索工具仍可取用；未预取或预取失败返回 None"""
+        run_key = run_key or _current_prefetch.get()
+        if not run_key:
+            return None
+        with self._pending_lock:
+            future = self._pending.get(run_key)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def discard(self, run_key: str):
+        """丢弃未被使用的预取（如 Agent 未调用搜索工具）；已在执行的搜索无法取消，记录直至其结束"""
+        with self._pending_lock:
+            future = self._pending.pop(run_key, None)
+            if future is None:
+                return
+            self.stats["discarded"] += 1
+            if future.cancel() or future.done():
+                return
+            self.stats["abandoned"] += 1
+            self._abandoned.add(future)
+        log.print_log("预取的搜索未被使用且已在执行，将在后台执行完毕", "warning")
+        future.add_done_callback(self._forget)
+
+    def _forget(self, future: Future):
+        with self._pending_lock:
+            self._abandoned.discard(future)
+
+    def get_stats(self) -> Dict[str, int]:
+        with self._pending_lock:
+            return {
+                **self.stats,
+                "pending": len(self._pending),
+                "abandoned_running": len(self._abandoned),
+            }
+
+
 class AIForgeSearchToolInput(BaseModel):
     """输入参数模型"""
 
@@ -131,34 +281,23 @@ class AIForgeSearchTool(BaseTool):
 
     args_schema: type[BaseModel] = AIForgeSearchToolInput
 
-    def _run(self, topic: str, urls: List[str], reference_ratio: float) -> str:
-        """执行AIForge搜索"""
-        results = None
-        config = Config.get_instance()
-        original_cwd = os.getcwd()
-
-        if len(urls) == 0:
-            log.print_log("开始执行搜索，请耐心等待...")
-            results = self._excute_search(
-                topic,
-                config.aiforge_search_max_results,
-                config.aiforge_search_min_results,
-                config.aiforge_api_key,
-            )
+    @classmethod
+    def input_digest(cls) -> Optional[str]:
+        """本次执行预取的搜索结果摘要；未预取时搜索结果无法预知，返回 None"""
+        prefetched = SearchPrefetcher.get_instance().peek()
+        if prefetched is None:
+            return None
+        material = json.dumps(prefetched, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
 
-            source_type = "搜索"
+    def _run(self, topic: str, urls: List[str], reference_ratio: float) -> str:
+        """执行AIForge搜索，话题确定时已预取的结果直接使用"""
+        prefetched = SearchPrefetcher.get_instance().take()
+        if prefetched is not None:
+            log.print_log("使用预取的搜索结果")
+            results, source_type = prefetched
         else:
-            log.print_log("开始提取参考链接中的文章信息，请耐心等待...")
-            extract_results = search_template.extract_urls_content(urls, topic)
-            # 这里只要参考文章获取到一条有效结果，就认为通过， 当然也可以len(urls)条结果
-            if search_template.validate_search_result(
-                extract_results, min_results=1, search_type="reference_article"
-            ):
-                results = extract_results.get("results")
-
-            source_type = "参考文章"
-
-        os.chdir(original_cwd)
+            results, source_type = fetch_search_results(topic, urls)
 
         try:
             fmt_result = self._formatted_result(topic, urls, reference_ratio, source_type, results)
@@ -169,8 +308,8 @@ class AIForgeSearchTool(BaseTool):
 
     def _formatted_result(self, topic, urls, reference_ratio, source_type, results):
         if results:
-            # 根据模式过滤掉相应字段为空的条目
-            filtered_results = []
+            # 根据模式过滤掉相应字段为空的条目，并取出用于排序和打包的正文
+            items = []
             for result in results:
                 title = result.get("title", "").strip()
 
@@ -186,64 +325,61 @@ class AIForgeSearchTool(BaseTool):
 
                 # 如果标题和对应的内容字段都不为空，则保留该条目
                 if title and content_field:
-                    filtered_results.append(result)
+                    items.append((result, content_field))
 
-            if filtered_results:
+            if items:
                 if len(urls) > 0:
-                    formatted = (
+                    header = (
                         f"关于'{topic}'的{source_type}结果（参考比例：{reference_ratio}）：\n\n"
                     )
                 else:
-                    formatted = f"关于'{topic}'的{source_type}结果：\n\n"
-
-                for i, result in enumerate(filtered_results, 1):
-                    # 限制标题长度
-                    title = result.get("title", "无标题")
-                    if len(title) > 100:
-                        title = title[:100] + "..."
-
-                    # 限制摘要长度
-                    abstract = result.get("abstract", "无摘要")
-                    if len(abstract) > 300:
-                        abstract = abstract[:300] + "..."
-
-                    formatted += f"## 结果 {i}\n"
-                    formatted += f"**标题**: {title}\n"
-                    formatted += f"**发布时间**: {result.get('pub_time', '未知时间')}\n"
-                    formatted += f"**摘要**: {abstract}\n"
-
-                    # 如果是URL提取，添加更多内容信息
-                    if len(urls) > 0 and "content" in result:
-                        content = result.get("content", "")
-                        # 限制内容长度
-                        if len(content) > 500:
-                            content = content[:500] + "..."
-                        formatted += f"**内容**: {content}...\n"
-                    formatted += "\n"
-                return formatted
-            else:
-                return f"未能找到关于'{topic}'的有效{source_type}结果。"
+                    header = f"关于'{topic}'的{source_type}结果：\n\n"
+
+                # 按相关性与时效性排序、去重，并按 token 预算打包
+                context_config = Config.get_instance().search_context_config
+                builder = SearchContextBuilder(
+                    max_tokens=context_config["max_tokens"],
+                    relevance_weight=context_config["relevance_weight"],
+                    recency_half_life_days=context_config["recency_half_life_days"],
+                    dedup_threshold=context_config["dedup_threshold"],
+                    encoding_name=context_config["encoding"],
+                )
+                formatted = builder.build(topic, header, items, with_content=len(urls) > 0)
+                if formatted:
+                    return formatted
+
+            return f"未能找到关于'{topic}'的有效{source_type}结果。"
         else:
             return f"未能找到关于'{topic}'的{source_type}结果。"
 
-    def _excute_search(self, topic, max_results, min_results, aiforge_api_key):
+    @staticmethod
+    def _excute_search(topic, max_results, min_results, aiforge_api_key):
         try:
             # 启用AIForge并且配置了key才能使用aiforge搜索
             if not aiforge_api_key:
                 log.print_log("未配置AIForge API KEY，将不使用搜索结果生成文章")
                 return None
 
+            # 相同话题短时间内的重复搜索直接使用缓存结果
+            cache = WebContentCache.get_instance() if WebContentCache.is_enabled() else None
+            cache_key = cache.search_key(topic, min_results) if cache else ""
+            cached = cache.get(cache_key) if cache else None
+            if cached:
+                log.print_log("使用缓存的搜索结果")
+                return cached[:max_results]
+
             # 这里可以有两种形式的传参，第2种不指定要求，需要对输出进行映射
             # 1. f"搜索{min_results}条'{topic}'的新闻，搜索结果数据要求：title、abstract、url、pub_time字段"
             # 2. f"搜索{min_results}条'{topic}'的新闻"
-            results = AIForgeEngine(config_file=Config.get_instance().config_aiforge_path)(
-                f"搜索{min_results}条'{topic}'的新闻"
-            )
+            results = AIForgeEngineManager.get_instance().run(f"搜索{min_results}条'{topic}'的新闻")
             # 因为没输出格式要求，这里需要获取到后进行映射
             # 即使指定也不一定能保证，所以最好固定进行映射
-            return AIForgeEngine.map_result_to_format(
+            mapped = AIForgeEngine.map_result_to_format(
                 results.data, ["title", "abstract", "url", "pub_time"]  # type: ignore
-            )[:max_results]
+            )
+            if cache and mapped:
+                cache.set(cache_key, mapped, kind="search")
+            return mapped[:max_results]
         except Exception as e:
             log.print_traceback("搜索过程中发生错误：", e)
             return None
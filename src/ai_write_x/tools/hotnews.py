@@ -10,12 +10,33 @@
 # 本项目整体授权协议请见根目录下 LICENSE 和 NOTICE 文件。
 
 
+import importlib.util
+import json
+import os
 import requests
 import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeout
+from datetime import datetime
+from pathlib import Path
 from typing import Any, Optional, List, Dict
 from bs4 import BeautifulSoup
 
+from src.ai_write_x.config.config import Config
 from src.ai_write_x.utils import log
+from src.ai_write_x.utils.path_manager import PathManager
+from src.ai_write_x.utils.topic_history import HistoryWindow, TopicHistory
+from src.ai_write_x.utils.topic_index import TopicIndex
+
+# 可选的快速HTML解析器
+try:
+    from selectolax.parser import HTMLParser as SelectolaxParser
+except ImportError:
+    SelectolaxParser = None
+
+# 只需知道 lxml 是否可用，由 BeautifulSoup 自行导入
+HAS_LXML = importlib.util.find_spec("lxml") is not None
 
 # 平台名称映射
 PLATFORMS = [
@@ -38,6 +59,82 @@ ZHIWEI_PLATFORMS = [p["zhiwei_id"] for p in PLATFORMS if p["zhiwei_id"]]
 # tophub 支持的平台
 TOPHUB_PLATFORMS = [p["tophub_id"] for p in PLATFORMS if p["tophub_id"]]
 
+PLATFORM_NAMES = [p["name"] for p in PLATFORMS]
+
+# tophub 首页索引的复用时长（秒），同一轮选题内的多个平台共用一次下载
+TOPHUB_INDEX_TTL = 60
+_tophub_cache: Dict[str, Any] = {"fetched_at": 0, "index": {}}
+_tophub_lock = threading.Lock()
+
+# 热搜来源，按优先级排列
+SOURCES = ["zhiwei", "tophub", "vvhan"]
+# 并发请求时等待全部来源的最长时间（秒），略大于单个请求的超时
+RACE_TIMEOUT = 12
+
+_fetch_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="aiwritex-hotnews")
+_source_stats: Dict[str, Dict[str, Any]] = {
+    source: {
+        "requests": 0,
+        "successes": 0,
+        "failures": 0,
+        "total_latency": 0.0,
+        "last_latency": 0.0,
+        "last_error": "",
+        "last_success_at": 0.0,
+    }
+    for source in SOURCES
+}
+_stats_lock = threading.Lock()
+
+
+def _hotnews_config() -> Dict[str, Any]:
+    """热搜配置；未加载配置（如单独调用本模块）时使用默认值，且不启用快照缓存"""
+    config = Config.get_instance()
+    if config.config:
+        return config.hotnews_config
+    return {**config.default_config["hotnews"], "cache_enabled": False}
+
+
+def _topic_history_config() -> Dict[str, Any]:
+    """话题历史配置；未加载配置时不查询历史"""
+    config = Config.get_instance()
+    if config.config:
+        return config.topic_history_config
+    return {**config.default_config["topic_history"], "enabled": False}
+
+
+def _record_source(source: str, started: float, success: bool, error: str = ""):
+    """记录一次来源请求的耗时与结果"""
+    latency = time.time() - started
+    with _stats_lock:
+        stats = _source_stats[source]
+        stats["requests"] += 1
+        stats["total_latency"] += latency
+        stats["last_latency"] = latency
+        if success:
+            stats["successes"] += 1
+            stats["last_success_at"] = time.time()
+        else:
+            stats["failures"] += 1
+            stats["last_error"] = error
+
+
+def get_source_stats() -> Dict[str, Dict[str, Any]]:
+    """各热搜来源的请求次数、成功率、平均/最近耗时和最近错误"""
+    with _stats_lock:
+        return {
+            source: {
+                **stats,
+                "avg_latency": stats["total_latency"] / stats["requests"]
+                if stats["requests"]
+                else 0.0,
+                "success_rate": stats["successes"] / stats["requests"]
+                if stats["requests"]
+                else 0.0,
+            }
+            for source, stats in _source_stats.items()
+        }
+
 
 def get_zhiwei_hotnews(platform: str) -> Optional[List[Dict]]:
     """
@@ -46,6 +143,7 @@ def get_zhiwei_hotnews(platform: str) -> Optional[List[Dict]]:
     返回格式: 列表数据，每个元素为热点条目字典，仅包含 name, rank, lastCount, url
     """
     api_url = f"https://trends.zhiweidata.com/hotSearchTrend/search/longTimeInListSearch?type={platform}&sortType=realTime"  # noqa 501
+    started = time.time()
     try:
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",  # noqa 501
@@ -56,6 +154,7 @@ def get_zhiwei_hotnews(platform: str) -> Optional[List[Dict]]:
 
         data = response.json()
         if data.get("state") and isinstance(data.get("data"), list):
+            _record_source("zhiwei", started, True)
             return [
                 {
                     "name": item.get("name", ""),
@@ -65,75 +164,227 @@ def get_zhiwei_hotnews(platform: str) -> Optional[List[Dict]]:
                 }
                 for item in data["data"]
             ]
+        _record_source("zhiwei", started, False, "返回数据无效")
         return None
-    except Exception as e:  # noqa 841
+    except Exception as e:
+        _record_source("zhiwei", started, False, str(e))
         return None
 
 
-def get_tophub_hotnews(platform: str, cnt: int = 10) -> Optional[List[Dict]]:
-    """
-    获取 tophub.today 的热点数据
-    参数 platform: 平台名称（中文，如“微博”）
-    参数 tophub_id: tophub.today 的平台标识（如 s.weibo.com, zhihu.com）
-    参数 cnt: 返回的新闻数量
-    返回格式: 列表数据，每个元素为热点条目字典，包含 name, rank, lastCount
-    """
+def _download_tophub_page() -> Optional[str]:
+    """下载 tophub.today 首页，失败返回 None"""
     api_url = "https://tophub.today/"
+    started = time.time()
     try:
         headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",  # noqa 501
         }
         response = requests.get(api_url, headers=headers, timeout=10)
         response.raise_for_status()
-
-        soup = BeautifulSoup(response.text, "html.parser")
-        platform_divs = soup.find_all("div", class_="cc-cd")
-
-        for div in platform_divs:
-            platform_span = div.find("div", class_="cc-cd-lb").find("span")  # type: ignore
-            if platform_span and platform_span.text.strip() == platform:  # type: ignore
-                news_items = div.find_all("div", class_="cc-cd-cb-ll")[:cnt]  # type: ignore
-                hotnews = []
-                for item in news_items:
-                    rank = item.find("span", class_="s").text.strip()  # type: ignore
-                    title = item.find("span", class_="t").text.strip()  # type: ignore
-                    engagement = item.find("span", class_="e")  # type: ignore
-                    last_count = engagement.text.strip() if engagement else "0"
-                    hotnews.append(
-                        {
-                            "name": title,
-                            "rank": int(rank),
-                            "lastCount": last_count,
-                            "url": item.find("a")["href"] if item.find("a") else "",  # type: ignore
-                        }
-                    )
-                return hotnews
+        _record_source("tophub", started, True)
+        return response.text
+    except Exception as e:
+        _record_source("tophub", started, False, str(e))
         return None
-    except Exception as e:  # noqa 841
+
+
+def _parse_tophub_item(
+    rank: str, title: str, engagement: Optional[str], url: str
+) -> Optional[Dict]:
+    """构造热点条目，排名无法解析时返回 None"""
+    try:
+        return {"name": title, "rank": int(rank), "lastCount": engagement or "0", "url": url}
+    except ValueError:
         return None
 
 
+def _parse_tophub_index_selectolax(html: str) -> Dict[str, List[Dict]]:
+    tree = SelectolaxParser(html)
+    index: Dict[str, List[Dict]] = {}
+    for block in tree.css("div.cc-cd"):
+        label = block.css_first("div.cc-cd-lb span")
+        if label is None:
+            continue
+        name = label.text(strip=True)
+        if name in index:
+            continue
+
+        items = []
+        for item in block.css("div.cc-cd-cb-ll"):
+            rank = item.css_first("span.s")
+            title = item.css_first("span.t")
+            if rank is None or title is None:
+                continue
+            engagement = item.css_first("span.e")
+            link = item.css_first("a")
+            entry = _parse_tophub_item(
+                rank.text(strip=True),
+                title.text(strip=True),
+                engagement.text(strip=True) if engagement else None,
+                (link.attributes.get("href") or "") if link else "",
+            )
+            if entry:
+                items.append(entry)
+        index[name] = items
+    return index
+
+
+def _parse_tophub_index_bs4(html: str) -> Dict[str, List[Dict]]:
+    soup = BeautifulSoup(html, "lxml" if HAS_LXML else "html.parser")
+    index: Dict[str, List[Dict]] = {}
+    for block in soup.find_all("div", class_="cc-cd"):
+        label = block.find("div", class_="cc-cd-lb")
+        span = label.find("span") if label else None  # type: ignore
+        if span is None:
+            continue
+        name = span.text.strip()
+        if name in index:
+            continue
+
+        items = []
+        for item in block.find_all("div", class_="cc-cd-cb-ll"):  # type: ignore
+            rank = item.find("span", class_="s")  # type: ignore
+            title = item.find("span", class_="t")  # type: ignore
+            if rank is None or title is None:
+                continue
+            engagement = item.find("span", class_="e")  # type: ignore
+            link = item.find("a")  # type: ignore
+            entry = _parse_tophub_item(
+                rank.text.strip(),
+                title.text.strip(),
+                engagement.text.strip() if engagement else None,
+                link["href"] if link else "",  # type: ignore
+            )
+            if entry:
+                items.append(entry)
+        index[name] = items
+    return index
+
+
+def parse_tophub_index(html: str) -> Dict[str, List[Dict]]:
+    """
+    一次解析 tophub.today 首页，建立 平台名称 -> 按排名排列的热点条目 索引
+    优先使用 selectolax，其次 lxml，均未安装时使用 html.parser
+    条目格式: {"name", "rank", "lastCount", "url"}；同名平台以页面中第一个为准
+    """
+    try:
+        if SelectolaxParser is not None:
+            return _parse_tophub_index_selectolax(html)
+        return _parse_tophub_index_bs4(html)
+    except Exception:
+        return {}
+
+
+def get_tophub_index() -> Dict[str, List[Dict]]:
+    """获取 tophub.today 全部平台的热点索引，短时间内的重复调用复用同一次下载和解析"""
+    with _tophub_lock:
+        if time.time() - _tophub_cache["fetched_at"] < TOPHUB_INDEX_TTL:
+            return _tophub_cache["index"]
+
+        html = _download_tophub_page()
+        index = parse_tophub_index(html) if html else {}
+        if index:
+            _tophub_cache.update({"fetched_at": time.time(), "index": index})
+        return index
+
+
+def get_tophub_hotnews(platform: str, cnt: int = 10) -> Optional[List[Dict]]:
+    """
+    获取 tophub.today 的热点数据
+    参数 platform: 平台名称（中文，如“微博”）
+    参数 cnt: 返回的新闻数量
+    返回格式: 列表数据，每个元素为热点条目字典，包含 name, rank, lastCount
+    """
+    hotnews = get_tophub_index().get(platform)
+    return hotnews[:cnt] if hotnews else None
+
+
 def get_vvhan_hotnews() -> Optional[List[Dict]]:
     """
     获取 vvhan 的热点数据（作为备用）
     返回格式: [{"name": platform_name, "data": [...]}, ...]
     """
     api_url = "https://api.vvhan.com/api/hotlist/all"
+    started = time.time()
     try:
         response = requests.get(api_url, timeout=10)
         response.raise_for_status()
 
         data = response.json()
         if data.get("success") and isinstance(data.get("data"), list):
+            _record_source("vvhan", started, True)
             return data["data"]
+        _record_source("vvhan", started, False, "返回数据无效")
         return None
-    except Exception as e:  # noqa 841
+    except Exception as e:
+        _record_source("vvhan", started, False, str(e))
         return None
 
 
-def get_platform_news(platform: str, cnt: int = 10) -> List[str]:
+def _zhiwei_items(platform_info: Dict, cnt: int) -> List[Dict]:
+    hotnews = get_zhiwei_hotnews(platform_info["zhiwei_id"]) or []
+    return [item for item in hotnews[:cnt] if item.get("name")]
+
+
+def _zhiwei_titles(platform_info: Dict, cnt: int) -> List[str]:
+    return [item["name"] for item in _zhiwei_items(platform_info, cnt)]
+
+
+def _vvhan_items(platform_data: List[Dict], cnt: int) -> List[Dict]:
+    """将 vvhan 条目转换为统一的 {"name", "rank", "lastCount"} 格式"""
+    return [
+        {"name": item["title"], "rank": item.get("index") or i, "lastCount": item.get("hot", 0)}
+        for i, item in enumerate(platform_data[:cnt], 1)
+        if item.get("title")
+    ]
+
+
+def _tophub_titles(platform_info: Dict, cnt: int) -> List[str]:
+    hotnews = get_tophub_hotnews(platform_info["name"], cnt) or []
+    return [item.get("name", "") for item in hotnews[:cnt] if item.get("name")]
+
+
+def _vvhan_titles(platform_info: Dict, cnt: int) -> List[str]:
+    hotnews = get_vvhan_hotnews() or []
+    platform_data = next((pf["data"] for pf in hotnews if pf["name"] == platform_info["name"]), [])
+    return [item["title"] for item in platform_data[:cnt]]
+
+
+def _platform_sources(platform_info: Dict) -> List:
+    """平台可用的来源及对应的获取函数，按优先级排列"""
+    sources = []
+    if platform_info["zhiwei_id"] in ZHIWEI_PLATFORMS:
+        sources.append(("zhiwei", _zhiwei_titles))
+    if platform_info["tophub_id"] in TOPHUB_PLATFORMS:
+        sources.append(("tophub", _tophub_titles))
+    sources.append(("vvhan", _vvhan_titles))
+    return sources
+
+
+def _race_sources(sources: List, platform_info: Dict, cnt: int) -> List[str]:
+    """并发请求所有来源，返回最先得到的有效结果，其余未开始的请求取消"""
+    futures = [_fetch_executor.submit(func, platform_info, cnt) for _, func in sources]
+    try:
+        for future in as_completed(futures, timeout=RACE_TIMEOUT):
+            try:
+                titles = future.result()
+            except Exception:
+                continue
+            if titles:
+                return titles
+    except FutureTimeout:
+        pass
+    finally:
+        # 已在执行的请求无法中断，结果会被丢弃
+        for future in futures:
+            future.cancel()
+    return []
+
+
+def fetch_platform_news(platform: str, cnt: int = 10) -> List[str]:
     """
-    获取指定平台的新闻标题，优先从知微数据获取，失败则从 tophub.today 获取，最后从 vvhan 获取
+    实时获取指定平台的新闻标题，来源优先级：知微数据 > tophub.today > vvhan
+    开启 race_sources 时并发请求各来源并采用最先返回的有效结果，否则按优先级依次尝试
     参数 platform: 平台名称（中文，如“微博”）
     参数 cnt: 返回的新闻数量
     返回: 新闻标题列表（仅使用 name 字段）
@@ -143,26 +394,216 @@ def get_platform_news(platform: str, cnt: int = 10) -> List[str]:
     if not platform_info:
         return []
 
-    # 1. 优先尝试知微数据
+    sources = _platform_sources(platform_info)
+    if _hotnews_config()["race_sources"]:
+        return _race_sources(sources, platform_info, cnt)
 
-    if platform_info["zhiwei_id"] in ZHIWEI_PLATFORMS:
-        hotnews = get_zhiwei_hotnews(platform_info["zhiwei_id"])
-        if hotnews:
-            return [item.get("name", "") for item in hotnews[:cnt] if item.get("name")]
+    for _, func in sources:
+        titles = func(platform_info, cnt)
+        if titles:
+            return titles
+    return []
 
-    # 2. 回退到 tophub.today
-    if platform_info["tophub_id"] in TOPHUB_PLATFORMS:
-        hotnews = get_tophub_hotnews(platform, cnt)
-        if hotnews:
-            return [item.get("name", "") for item in hotnews[:cnt] if item.get("name")]
 
-    # 3. 回退到 vvhan API
-    hotnews = get_vvhan_hotnews()
-    if not hotnews:
-        return []
+def fetch_all_platform_news(cnt: int = 30) -> Dict[str, List[Dict]]:
+    """
+    一次性获取所有平台的热搜：知微数据逐个平台获取，tophub.today 与 vvhan 各请求一次，
+    按 知微数据 > tophub.today > vvhan 的优先级合并
+    开启 race_sources 时所有请求并发执行，总耗时约为最慢的一次请求
+    返回: {平台名称: [{"name", "rank", "lastCount"}, ...]}
+    """
+    zhiwei_platforms = [p for p in PLATFORMS if p["zhiwei_id"]]
 
-    platform_data = next((pf["data"] for pf in hotnews if pf["name"] == platform), [])
-    return [item["title"] for item in platform_data[:cnt]]
+    if _hotnews_config()["race_sources"]:
+        zhiwei_futures = {
+            p["name"]: _fetch_executor.submit(_zhiwei_items, p, cnt) for p in zhiwei_platforms
+        }
+        tophub_future = _fetch_executor.submit(get_tophub_index)
+        vvhan_future = _fetch_executor.submit(get_vvhan_hotnews)
+
+        def _result(future, default):
+            try:
+                return future.result(timeout=RACE_TIMEOUT) or default
+            except Exception:
+                return default
+
+        zhiwei = {name: _result(future, []) for name, future in zhiwei_futures.items()}
+        tophub_index = _result(tophub_future, {})
+        vvhan = _result(vvhan_future, [])
+    else:
+        zhiwei = {p["name"]: _zhiwei_items(p, cnt) for p in zhiwei_platforms}
+        missing = [p for p in PLATFORMS if not zhiwei.get(p["name"])]
+        tophub_index = get_tophub_index() if any(p["tophub_id"] for p in missing) else {}
+        missing = [p for p in missing if not tophub_index.get(p["name"])]
+        vvhan = (get_vvhan_hotnews() or []) if missing else []
+
+    vvhan_data = {pf.get("name"): pf.get("data", []) for pf in vvhan}
+
+    result: Dict[str, List[Dict]] = {}
+    for platform_info in PLATFORMS:
+        name = platform_info["name"]
+        items = zhiwei.get(name)
+        if not items and platform_info["tophub_id"]:
+            items = [item for item in tophub_index.get(name, [])[:cnt] if item["name"]]
+        if not items:
+            items = _vvhan_items(vvhan_data.get(name, []), cnt)
+        if items:
+            result[name] = [
+                {"name": item["name"], "rank": item.get("rank"), "lastCount": item.get("lastCount")}
+                for item in items
+            ]
+
+    return result
+
+
+class HotNewsCache:
+    """
+    热搜快照缓存：后台按间隔刷新全部平台，快照带时间戳保存在 data/hotnews/ 下，
+    get_platform_news 直接从内存读取；其他进程通过磁盘上的最新快照共享结果
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, snapshot_dir: str | None = None):
+        self.snapshot_dir = (
+            Path(snapshot_dir) if snapshot_dir else PathManager.get_data_dir() / "hotnews"
+        )
+        self.snapshot_dir.mkdir(parents=True, exist_ok=True)
+        self._snapshot: Dict[str, Any] = {"fetched_at": 0, "platforms": {}}
+        self._refresh_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._load_latest()
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return bool(_hotnews_config()["cache_enabled"])
+
+    @property
+    def age(self) -> float:
+        return time.time() - self._snapshot["fetched_at"]
+
+    def get(self, platform: str, cnt: int = 10) -> List[str]:
+        """从快照获取平台热搜标题"""
+        return [item["name"] for item in self.get_items(platform, cnt)]
+
+    def get_items(self, platform: str, cnt: int = 10) -> List[Dict]:
+        """
+        从快照获取平台热搜条目 {"name", "rank", "lastCount"}，
+        快照过期时先尝试读取其他进程写入的新快照，仍过期则同步刷新
+        """
+        max_age = _hotnews_config()["max_age"]
+        if self.age > max_age:
+            self._load_latest()
+        if self.age > max_age:
+            self.refresh()
+        return list(self._snapshot["platforms"].get(platform, [])[:cnt])
+
+    def refresh(self) -> bool:
+        """刷新全部平台；已有刷新进行中时等待其完成并复用结果"""
+        fetched_before = self._snapshot["fetched_at"]
+        with self._refresh_lock:
+            if self._snapshot["fetched_at"] != fetched_before:
+                return True
+
+            platforms = fetch_all_platform_news(
+                _hotnews_config()["snapshot_size"]
+            )
+            if not platforms:
+                log.print_log("热搜快照刷新失败，继续使用旧快照", "warning")
+                return False
+
+            self._snapshot = {"fetched_at": time.time(), "platforms": platforms}
+            self._save_snapshot()
+            return True
+
+    def _save_snapshot(self):
+        keep = _hotnews_config()["keep_snapshots"]
+        path = self.snapshot_dir / f"{datetime.now():%Y%m%d%H%M%S}.json"
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._snapshot, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log.print_log(f"保存热搜快照失败: {str(e)}", "warning")
+            return
+
+        # 只保留最近的快照
+        for old_path in sorted(self.snapshot_dir.glob("*.json"))[: -max(1, keep)]:
+            try:
+                old_path.unlink()
+            except OSError:
+                pass
+
+    def _load_latest(self):
+        snapshots = sorted(self.snapshot_dir.glob("*.json"))
+        if not snapshots:
+            return
+        try:
+            with open(snapshots[-1], "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return
+        if snapshot.get("fetched_at", 0) > self._snapshot["fetched_at"]:
+            # 兼容只保存标题的旧快照
+            snapshot["platforms"] = {
+                platform: [
+                    item if isinstance(item, dict) else {"name": item, "rank": i}
+                    for i, item in enumerate(items, 1)
+                ]
+                for platform, items in snapshot.get("platforms", {}).items()
+            }
+            self._snapshot = snapshot
+
+    def start(self):
+        """启动后台刷新线程"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._refresh_loop, name="aiwritex-hotnews", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+
+    def _refresh_loop(self):
+        while not self._stop_event.is_set():
+            interval = _hotnews_config()["refresh_interval"]
+            if self.age >= interval:
+                try:
+                    self.refresh()
+                except Exception as e:
+                    log.print_log(f"热搜快照刷新出错: {str(e)}", "warning")
+            self._stop_event.wait(min(interval, 60))
+
+
+def get_platform_news(platform: str, cnt: int = 10) -> List[str]:
+    """
+    获取指定平台的新闻标题，启用热搜缓存时从快照读取，否则实时获取
+    参数 platform: 平台名称（中文，如“微博”）
+    参数 cnt: 返回的新闻数量
+    返回: 新闻标题列表
+    """
+    if HotNewsCache.is_enabled():
+        topics = HotNewsCache.get_instance().get(platform, cnt)
+        if topics:
+            return topics
+    return fetch_platform_news(platform, cnt)
 
 
 def select_platform_topic(platform: Any, cnt: int = 10) -> str:
@@ -178,11 +619,109 @@ def select_platform_topic(platform: Any, cnt: int = 10) -> str:
         topics = ["历史上的今天"]
         log.print_log(f"平台 {platform} 无法获取到热榜，接口暂时不可用，将使用默认话题。")
 
-    # 加权随机选择：排名靠前的话题权重更高
+    # 加权随机选择：排名靠前的话题权重更高，近期已写过的话题跳过或降权
     weights = [1 / (i + 1) ** 2 for i in range(len(topics))]
+    window = _history_window()
+    history_weights = [w * _history_factor(topic, window) for w, topic in zip(weights, topics)]
+    if any(history_weights):
+        weights = history_weights
+    else:
+        log.print_log(f"平台 {platform} 的热门话题近期均已写过，将从中重新选择")
     selected_topic = random.choices(topics, weights=weights, k=1)[0]
 
     # 替换标题中的 | 为 ——
     selected_topic = selected_topic.replace("|", "——")
 
     return selected_topic
+
+
+def _history_window() -> Optional[HistoryWindow]:
+    """读取一次选题所需的话题历史，未启用或读取失败时返回 None"""
+    history_config = _topic_history_config()
+    if not history_config["enabled"]:
+        return None
+    try:
+        return TopicHistory.get_instance().window(history_config["window_days"])
+    except Exception as e:
+        log.print_log(f"查询话题历史失败: {str(e)}", "warning")
+        return None
+
+
+def _history_factor(topic: str, window: Optional[HistoryWindow]) -> float:
+    """话题的历史权重系数：近期未写过为 1，写过则为配置的降权系数（0 表示跳过）"""
+    if window is None:
+        return 1.0
+    history_config = _topic_history_config()
+    covered = window.is_covered(topic, history_config["threshold"])
+    return history_config["penalty"] if covered else 1.0
+
+
+def _apply_history(index: TopicIndex):
+    """按话题历史对索引中的话题降权或移除，任一变体标题写过即视为写过"""
+    window = _history_window()
+    if window is None:
+        return
+    index.penalize(
+        lambda cluster: any(_history_factor(title, window) < 1.0 for title in cluster.titles),
+        _topic_history_config()["penalty"],
+    )
+
+
+def get_platform_items(platform: str, cnt: int = 10) -> List[Dict]:
+    """获取平台热搜条目，启用热搜缓存时包含排名与热度，否则只有实时获取的标题"""
+    if HotNewsCache.is_enabled():
+        items = HotNewsCache.get_instance().get_items(platform, cnt)
+        if items:
+            return items
+    return [{"name": title} for title in fetch_platform_news(platform, cnt)]
+
+
+def build_topic_index(platforms: List, cnt: int = 10) -> TopicIndex:
+    """
+    合并多个平台的热搜建立话题索引，近似重复的标题聚为一簇并按跨平台排名与热度打分
+    参数 platforms: 平台名称列表，或 config.platforms 格式的 [{"name", "weight"}] 列表
+    参数 cnt: 每个平台获取的新闻数量
+    """
+    index = TopicIndex(threshold=_hotnews_config()["dedup_threshold"])
+    for platform in platforms:
+        name, weight = (
+            (platform["name"], platform.get("weight", 1.0))
+            if isinstance(platform, dict)
+            else (platform, 1.0)
+        )
+        items = get_platform_items(name, cnt)
+        if items:
+            index.add_platform(name, items, weight=weight or 1.0)
+        else:
+            log.print_log(f"平台 {name} 无法获取到热榜，已跳过。")
+    return index
+
+
+def select_indexed_topic(platforms: List, cnt: int = 10) -> Dict:
+    """
+    从多平台合并后的话题索引中按得分加权随机选择一个话题，近期已写过的话题跳过或降权
+    返回: {"platform": 话题排名最靠前的平台, "topic": 话题}
+    """
+    index = build_topic_index(platforms, cnt)
+    _apply_history(index)
+    cluster = index.sample(candidates=cnt)
+    if cluster is None:
+        log.print_log("所有平台都无法获取到热榜，接口暂时不可用，将使用默认话题。")
+        return {"platform": "", "topic": "历史上的今天"}
+    return {"platform": cluster.platform, "topic": cluster.title.replace("|", "——")}
+
+
+def select_top_topics(platforms: List[str], top_k: int = 5, cnt: int = 10) -> List[Dict]:
+    """
+    汇总多个平台的热搜，合并近似重复的话题并排除近期已写过的话题后，按得分选出前 top_k 个
+    参数 platforms: 平台名称列表（中文，如“微博”）
+    参数 top_k: 需要的话题数量
+    参数 cnt: 每个平台获取的新闻数量
+    返回: [{"platform": 平台名称, "topic": 话题}, ...]
+    """
+    index = build_topic_index(platforms, cnt)
+    _apply_history(index)
+    return [
+        {"platform": cluster.platform, "topic": cluster.title.replace("|", "——")}
+        for cluster in index.top(top_k)
+    ]
@@ -0,0 +1,191 @@
+"""
+搜索上下文构建：按相关性与时效性排序搜索结果，去除摘要近似重复的条目，
+再按 token 预算打包为提供给写作 Agent 的上下文
+"""
+
+import re
+import time
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from src.ai_write_x.utils import date_parser
+from src.ai_write_x.utils.topic_index import jaccard, shingles
+
+try:
+    import tiktoken
+except ImportError:  # tiktoken 随 crewai 安装，缺失时退化为按字符估算
+    tiktoken = None
+
+
+_CJK_RE = re.compile(r"[\u3000-\u9fff\uac00-\ud7af\uff00-\uffef]")
+
+# 标题较短且用于识别结果，仍按字符截断
+_MAX_TITLE_LENGTH = 100
+
+
+@lru_cache(maxsize=4)
+def _get_encoding(encoding_name: str):
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding(encoding_name)
+    except Exception:
+        return None
+
+
+def estimate_tokens(text: str, encoding_name: str = "cl100k_base") -> int:
+    """估算文本的 token 数：优先使用 tiktoken，不可用时中日韩字符按 1 个、其余按 4 字符 1 个估算"""
+    if not text:
+        return 0
+    encoding = _get_encoding(encoding_name)
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    cjk = len(_CJK_RE.findall(text))
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+def truncate_to_tokens(text: str, max_tokens: int, encoding_name: str = "cl100k_base") -> str:
+    """将文本截断到不超过 max_tokens 个 token"""
+    if max_tokens <= 0:
+        return ""
+    encoding = _get_encoding(encoding_name)
+    if encoding is not None:
+        tokens = encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        # 截断处可能落在多字节字符中间，解码时丢弃不完整的字符
+        return encoding.decode(tokens[:max_tokens], errors="ignore")
+
+    if estimate_tokens(text, encoding_name) <= max_tokens:
+        return text
+    # 二分查找满足预算的最长前缀
+    low, high = 0, len(text)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if estimate_tokens(text[:mid], encoding_name) <= max_tokens:
+            low = mid
+        else:
+            high = mid - 1
+    return text[:low]
+
+
+class SearchContextBuilder:
+    """
+    将搜索/参考文章结果打包为限定 token 数的上下文：
+    得分 = 相关性权重 × 话题相关性 + (1 - 相关性权重) × 时效性，时效性按半衰期衰减；
+    各条目按排名依次分配剩余预算的平均份额，未用完的份额留给后面的条目
+    """
+
+    def __init__(
+        self,
+        max_tokens: int = 3000,
+        relevance_weight: float = 0.6,
+        recency_half_life_days: float = 7,
+        dedup_threshold: float = 0.8,
+        min_body_tokens: int = 40,
+        encoding_name: str = "cl100k_base",
+        reference_ts: Optional[float] = None,
+    ):
+        self.max_tokens = max_tokens
+        self.relevance_weight = relevance_weight
+        self.recency_half_life_days = recency_half_life_days
+        self.dedup_threshold = dedup_threshold
+        self.min_body_tokens = min_body_tokens
+        self.encoding_name = encoding_name
+        self.reference_ts = reference_ts
+
+    def _tokens(self, text: str) -> int:
+        return estimate_tokens(text, self.encoding_name)
+
+    def _recency(self, pub_time: str, now: float) -> float:
+        """发布时间越近得分越高，无法识别的时间取中间值"""
+        if not pub_time or not date_parser.DATE_RE.match(pub_time):
+            return 0.5
+        try:
+            published = datetime.strptime(pub_time, "%Y-%m-%d").timestamp()
+        except ValueError:
+            return 0.5
+        age_days = max(0.0, (now - published) / 86400)
+        if self.recency_half_life_days <= 0:
+            return 1.0
+        return 0.5 ** (age_days / self.recency_half_life_days)
+
+    def _relevance(self, topic_shingles, result: Dict, body: str) -> float:
+        """话题字符 2-gram 在标题与正文开头中的覆盖率"""
+        if not topic_shingles:
+            return 0.0
+        text_shingles = shingles(f"{result.get('title', '')} {body[:500]}")
+        return len(topic_shingles & text_shingles) / len(topic_shingles)
+
+    def rank(self, topic: str, items: List[Tuple[Dict, str]]) -> List[Tuple[Dict, str]]:
+        """按得分从高到低排序，并去除正文近似重复的条目（保留得分较高者）"""
+        now = self.reference_ts or time.time()
+        topic_shingles = shingles(topic)
+        scored = []
+        for position, (result, body) in enumerate(items):
+            relevance = self._relevance(topic_shingles, result, body)
+            recency = self._recency(result.get("pub_time", ""), now)
+            score = self.relevance_weight * relevance + (1 - self.relevance_weight) * recency
+            scored.append((-score, position, result, body))
+        scored.sort(key=lambda x: (x[0], x[1]))
+
+        ranked: List[Tuple[Dict, str]] = []
+        kept_shingles = []
+        for _, _, result, body in scored:
+            body_shingles = shingles(body[:1000])
+            if any(jaccard(body_shingles, kept) >= self.dedup_threshold for kept in kept_shingles):
+                continue
+            kept_shingles.append(body_shingles)
+            ranked.append((result, body))
+        return ranked
+
+    def _format_item(self, index: int, result: Dict, body: str, with_content: bool) -> str:
+        title = result.get("title", "无标题")
+        if len(title) > _MAX_TITLE_LENGTH:
+            title = title[:_MAX_TITLE_LENGTH] + "..."
+
+        text = f"## 结果 {index}\n"
+        text += f"**标题**: {title}\n"
+        text += f"**发布时间**: {result.get('pub_time') or '未知时间'}\n"
+        if with_content:
+            if result.get("abstract"):
+                text += f"**摘要**: {result['abstract']}\n"
+            text += f"**内容**: {body}\n"
+        else:
+            text += f"**摘要**: {body}\n"
+        return text + "\n"
+
+    def build(
+        self, topic: str, header: str, items: List[Tuple[Dict, str]], with_content: bool = False
+    ) -> str:
+        """
+        items 为 (结果, 正文) 列表，正文在搜索模式下为摘要，参考文章模式下为文章内容；
+        返回以 header 开头、总 token 数不超过预算的上下文
+        """
+        ranked = self.rank(topic, items)
+        formatted = header
+        remaining = self.max_tokens - self._tokens(header)
+        index = 0
+
+        for position, (result, body) in enumerate(ranked):
+            share = remaining // (len(ranked) - position)
+            block = self._format_item(index + 1, result, body, with_content)
+            cost = self._tokens(block)
+            if cost > share:
+                # 超出份额时截断正文，截断后正文过短则跳过该条目
+                overhead = cost - self._tokens(body)
+                body_budget = share - overhead - 1
+                if body_budget < self.min_body_tokens:
+                    continue
+                body = truncate_to_tokens(body, body_budget, self.encoding_name) + "..."
+                block = self._format_item(index + 1, result, body, with_content)
+                cost = self._tokens(block)
+                if cost > remaining:
+                    continue
+
+            index += 1
+            formatted += block
+            remaining -= cost
+
+        return formatted if index else ""
@@ -10,16 +10,21 @@
 # 本项目整体授权协议请见根目录下 LICENSE 和 NOTICE 文件。
 
 
+import threading
 import time
 import re
 import requests
 from bs4 import BeautifulSoup
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
-import html
 from typing import List, Dict, Any
-from crewai_tools import SeleniumScrapingTool
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+
+from src.ai_write_x.tools.browser_pool import BrowserPool
+from src.ai_write_x.tools.web_cache import WebContentCache
+from src.ai_write_x.utils import date_parser
 
 
 def validate_search_result(result, min_results=1, search_type="local"):
@@ -39,14 +44,14 @@ def validate_search_result(result, min_results=1, search_type="local"):
 
         # 尝试从 pub_time 转换
         if pub_time:
-            if re.match(r"^\d{4}-\d{2}-\d{2}$", pub_time):
+            if date_parser.DATE_RE.match(pub_time):
                 try:
                     datetime.strptime(pub_time, "%Y-%m-%d")
                     continue
                 except ValueError:
                     pass
             # 处理带时分秒的格式
-            if re.match(r"^\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}(?::\d{2})?$", pub_time):
+            if date_parser.DATETIME_RE.match(pub_time):
                 try:
                     actual_date = datetime.strptime(pub_time, "%Y-%m-%d %H:%M:%S")
                     item["pub_time"] = actual_date.strftime("%Y-%m-%d")
@@ -70,20 +75,9 @@ def validate_search_result(result, min_results=1, search_type="local"):
 
         # 兜底：从 abstract 提取日期
         if not item["pub_time"] and abstract:
-            for pattern in [
-                r"\d{4}\s*[-/年\.]?\s*\d{1,2}\s*[-/月\.]?\s*\d{1,2}\s*(?:日)?(?:\s+\d{1,2}:\d{1,2}(?::\d{1,2})?)?",  # noqa 501
-                r"\d{1,2}\s*[月]\s*\d{1,2}\s*[日]?",
-                r"(?:\d+\s*(?:秒|一分钟|分钟|分|小时|个小时|天|日|周|星期|个月|月|年)前|刚刚|今天|昨天|前天|上周|上星期|上个月|上月|去年)",
-                r"\d{4}年\d{1,2}月\d{1,2}日",
-            ]:
-                match = re.search(pattern, abstract, re.IGNORECASE)
-                if match:
-                    pub_time = match.group(0)
-                    if is_valid_date(pub_time):
-                        pub_time_date = calculate_actual_date(pub_time, timestamp)
-                        if pub_time_date:
-                            item["pub_time"] = pub_time_date.strftime("%Y-%m-%d")
-                            break
+            pub_time_date = date_parser.search(abstract, timestamp, date_parser.ABSTRACT_PATTERNS)
+            if pub_time_date:
+                item["pub_time"] = pub_time_date.strftime("%Y-%m-%d")
 
     validation_rules = {
         "local": ["title", "url", "abstract", "pub_time"],
@@ -131,7 +125,7 @@ def validate_search_result(result, min_results=1, search_type="local"):
 
         if quality_req["require_valid_date"] and search_type != "ai_guided":
             pub_time = item.get("pub_time", "")
-            if not pub_time or not re.match(r"^\d{4}-\d{2}-\d{2}$", pub_time):
+            if not pub_time or not date_parser.DATE_RE.match(pub_time):
                 continue
             try:
                 datetime.strptime(pub_time, "%Y-%m-%d")
@@ -145,184 +139,17 @@ def validate_search_result(result, min_results=1, search_type="local"):
 
 def is_valid_date(date_str, timestamp=None):
     """验证日期字符串是否可转换为有效日期"""
-    if not date_str or date_str in [None, "", "None", "未知"]:
-        return False
-
-    date_str = clean_date_text(str(date_str))
-
-    if timestamp is None:
-        timestamp = time.time()
-
-    date_patterns = [
-        # 完整日期时间（支持带空格的中文格式）
-        r"\d{4}\s*[-/年\.]?\s*\d{1,2}\s*[-/月\.]?\s*\d{1,2}\s*(?:日)?(?:\s+\d{1,2}:\d{1,2}(?::\d{1,2})?)?",  # noqa 501
-        r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:Z|[+-]\d{2}:\d{2})?",
-        r"\d{1,2}[-/]\d{1,2}[-/]\d{4}\s+\d{1,2}:\d{1,2}(?::\d{1,2})?",
-        # 完整日期
-        r"\d{4}\s*[-/年\.]?\s*\d{1,2}\s*[-/月\.]?\s*\d{1,2}\s*(?:日)?",
-        r"\d{1,2}[-/]\d{1,2}[-/]\d{4}",
-        # 相对时间
-        r"(\d+)\s*(秒|分钟|分|小时|个小时|天|日|周|星期|个月|月|年)前",
-        r"(刚刚|今天|昨天|前天|上周|上星期|上个月|上月|去年)",
-        # 不完整日期
-        r"\d{1,2}\s*[-/\.月]?\s*\d{1,2}\s*(?:日)?",
-        # Unix 时间戳
-        r"^\d{10}$",
-        r"^\d{13}$",
-        # 英文格式
-        r"\d+\s*(second|seconds|minute|minutes|hour|hours|day|days|week|weeks|month|months|year|years)\s*ago",  # noqa 501
-        r"(yesterday|today|just\s*now|last\s*(week|month|year)|this\s*(week|month|year))",
-    ]
-
-    for pattern in date_patterns:
-        if re.search(pattern, date_str, re.IGNORECASE):
-            return True
-
-    return False
+    return date_parser.is_date_like(date_str)
 
 
 def calculate_actual_date(pub_time, timestamp):
     """将发布日期转换为 datetime 对象"""
-    if not pub_time or not timestamp:
-        return None
-
-    try:
-        pub_time_cleaned = clean_date_text(str(pub_time))
-        reference_date = datetime.fromtimestamp(timestamp)
-
-        # 优先处理 Unix 时间戳 (修正后的位置)
-        if re.match(r"^\d{10}$", pub_time_cleaned):
-            return datetime.fromtimestamp(int(pub_time_cleaned))
-        if re.match(r"^\d{13}$", pub_time_cleaned):
-            return datetime.fromtimestamp(int(pub_time_cleaned) / 1000)
-
-        # 1. 相对时间
-        relative_patterns = [
-            (r"(\d+)\s*秒前", lambda n: reference_date - timedelta(seconds=n)),
-            (r"(\d+)\s*(分钟|分)前", lambda n: reference_date - timedelta(minutes=n)),
-            (r"(\d+)\s*(小时|个小时)前", lambda n: reference_date - timedelta(hours=n)),
-            (r"(\d+)\s*(天|日)前", lambda n: reference_date - timedelta(days=n)),
-            (r"(\d+)\s*(周|星期)前", lambda n: reference_date - timedelta(weeks=n)),
-            (r"(\d+)\s*(个月|月)前", lambda n: reference_date - relativedelta(months=n)),
-            (r"(\d+)\s*年前", lambda n: reference_date - relativedelta(years=n)),
-        ]
-
-        for pattern, calc_func in relative_patterns:
-            match = re.search(pattern, pub_time_cleaned, re.IGNORECASE)
-            if match:
-                num = int(match.group(1))
-                return calc_func(num)
-
-        # 2. 特殊相对时间
-        special_relative = {
-            "刚刚": reference_date,
-            "今天": reference_date.replace(hour=0, minute=0, second=0, microsecond=0),
-            "昨天": reference_date - timedelta(days=1),
-            "前天": reference_date - timedelta(days=2),
-            "上周": reference_date - timedelta(weeks=1),
-            "上星期": reference_date - timedelta(weeks=1),
-            "上个月": reference_date - relativedelta(months=1),
-            "上月": reference_date - relativedelta(months=1),
-            "去年": reference_date - relativedelta(years=1),
-        }
-
-        for key, calc_date in special_relative.items():
-            if key in pub_time_cleaned:
-                return calc_date
-
-        # 3. 英文相对时间
-        english_relative = [
-            (r"(\d+)\s*seconds?\s*ago", lambda n: reference_date - timedelta(seconds=n)),
-            (r"(\d+)\s*minutes?\s*ago", lambda n: reference_date - timedelta(minutes=n)),
-            (r"(\d+)\s*hours?\s*ago", lambda n: reference_date - timedelta(hours=n)),
-            (r"(\d+)\s*days?\s*ago", lambda n: reference_date - timedelta(days=n)),
-            (r"(\d+)\s*weeks?\s*ago", lambda n: reference_date - timedelta(weeks=n)),
-            (r"(\d+)\s*months?\s*ago", lambda n: reference_date - relativedelta(months=n)),
-            (r"(\d+)\s*years?\s*ago", lambda n: reference_date - relativedelta(years=n)),
-            (r"yesterday", lambda: reference_date - timedelta(days=1)),
-            (r"just\s*now", lambda: reference_date),
-            (r"last\s*week", lambda: reference_date - timedelta(weeks=1)),
-            (r"last\s*month", lambda: reference_date - relativedelta(months=1)),
-            (r"last\s*year", lambda: reference_date - relativedelta(years=1)),
-        ]
-
-        for pattern, calc_func in english_relative:
-            match = re.search(pattern, pub_time_cleaned, re.IGNORECASE)
-            if match:
-                if match.groups():
-                    num = int(match.group(1))
-                    return calc_func(num)
-                return calc_func()
-
-        # 4. 不完整日期
-        incomplete_patterns = [
-            r"(\d{1,2})\s*[-/\.月]?\s*(\d{1,2})\s*(?:日)?",
-        ]
-
-        for pattern in incomplete_patterns:
-            match = re.search(pattern, pub_time_cleaned)
-            if match:
-                month, day = map(int, match.groups())
-                if 1 <= month <= 12 and 1 <= day <= 31:
-                    current_year = reference_date.year
-                    try_date = reference_date.replace(year=current_year, month=month, day=day)
-                    if try_date > reference_date:
-                        try_date = try_date.replace(year=current_year - 1)
-                    # 验证日期合理性
-                    if abs((try_date - reference_date).days) > 365:
-                        try_date_alt = try_date.replace(
-                            year=current_year - 1 if try_date > reference_date else current_year + 1
-                        )
-                        if abs((try_date_alt - reference_date).days) < abs(
-                            (try_date - reference_date).days
-                        ):
-                            try_date = try_date_alt
-                    return try_date
-
-        # 5. 完整日期
-        complete_patterns = [
-            (r"(\d{4})\s*[-/年\.]?\s*\d{1,2}\s*[-/月\.]?\s*\d{1,2}\s*(?:日)?", "%Y-%m-%d"),
-            (r"(\d{1,2})[-/](\d{1,2})[-/](\d{4})", "%m/%d/%Y"),
-        ]
-
-        for pattern, date_format in complete_patterns:
-            match = re.search(pattern, pub_time_cleaned)
-            if match:
-                date_str = match.group(0)
-                return datetime.strptime(date_str, date_format)
-
-    except Exception:
-        return None
-
-    return None
+    return date_parser.parse(pub_time, timestamp)
 
 
 def clean_date_text(text):
     """专为日期清理文本，保留日期格式关键字符"""
-    if not text:
-        return ""
-    try:
-        # 如果是纯数字字符串，直接返回，避免不必要的清理
-        if isinstance(text, (int, float)):
-            return str(text)
-        if isinstance(text, str) and text.isdigit():
-            return text
-
-        if isinstance(text, bytes):
-            text = text.decode("utf-8", errors="ignore")
-        text = html.unescape(text)
-        text = re.sub(
-            r"^(发表于|更新时间|发布时间|创建时间|Posted on|Published on|Date):\s*",
-            "",
-            text,
-            flags=re.IGNORECASE,
-        ).strip()
-        text = "".join(char for char in text if unicodedata.category(char)[0] != "C")
-        # 保留单个空格，避免破坏中文日期格式
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
-    except Exception:
-        return ""
+    return date_parser.clean(text)
 
 
 def clean_text(text):
@@ -379,134 +206,223 @@ def get_common_headers():
     }
 
 
+# 发布时间提取的候选来源，均按优先级排列
+# meta 标签：(属性名, 属性值)，对应 meta[属性名='属性值']
+_PUBLISH_META_ATTRS = [
+    ("property", "article:published_time"),
+    ("property", "sitemap:news:publication_date"),
+    ("itemprop", "datePublished"),
+    ("name", "publishdate"),
+    ("name", "pubdate"),
+    ("name", "original-publish-date"),
+    ("name", "weibo:article:create_at"),
+    ("name", "baidu_ssp:publishdate"),
+]
+
+# 页面元素：(标签名, class 包含的完整类名, class 子串, id 子串)，None 表示不限
+# 依次对应 textarea.article-time、[class*='date']、[class*='time']、[class*='publish']、
+# [class*='post-date']、[id*='date']、[id*='time']、.byline、.info、.article-meta、
+# .source、.entry-date、div.date、p.date、p.time
+_PUBLISH_ELEMENT_RULES = [
+    ("textarea", "article-time", None, None),
+    (None, None, "date", None),
+    (None, None, "time", None),
+    (None, None, "publish", None),
+    (None, None, "post-date", None),
+    (None, None, None, "date"),
+    (None, None, None, "time"),
+    (None, "byline", None, None),
+    (None, "info", None, None),
+    (None, "article-meta", None, None),
+    (None, "source", None, None),
+    (None, "entry-date", None, None),
+    ("div", "date", None, None),
+    ("p", "date", None, None),
+    ("p", "time", None, None),
+]
+
+
+def _format_iso_datetime(value):
+    """解析 meta content / time datetime 属性中的 ISO 时间，无法识别时返回 None"""
+    if not value:
+        return None
+    try:
+        # 处理 UTC 时间 (以Z结尾)
+        if value.endswith("Z"):
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            # 转换为东八区时间
+            dt_local = dt + timedelta(hours=8)
+            return dt_local.strftime("%Y-%m-%d")
+        # 处理带时区的 ISO 8601 格式
+        elif "T" in value and ("+" in value or "-" in value[-6:]):
+            dt = datetime.fromisoformat(value)
+            return dt.strftime("%Y-%m-%d")
+        # 处理简单的日期格式
+        elif "T" in value:
+            return value.split("T")[0]
+    except Exception:
+        pass
+    return None
+
+
+def _format_text_date(text, timestamp):
+    """清理元素文本并换算为日期，无法识别时返回 None"""
+    text = date_parser.clean(text)
+    if text and date_parser.is_date_like(text):
+        date = date_parser.parse(text, timestamp)
+        if date:
+            return date.strftime("%Y-%m-%d")
+    return None
+
+
+def _collect_publish_candidates(page_soup):
+    """
+    一次遍历文档，按来源收集发布时间候选元素：
+    每个 meta 规则的第一个匹配、全部 <time> 标签、每个元素规则的全部匹配（均保持文档顺序）
+    """
+    metas = [None] * len(_PUBLISH_META_ATTRS)
+    time_tags = []
+    elements = [[] for _ in _PUBLISH_ELEMENT_RULES]
+
+    for elem in page_soup.find_all(True):
+        name = elem.name
+        if name == "meta":
+            for i, (attr, value) in enumerate(_PUBLISH_META_ATTRS):
+                if metas[i] is None and elem.get(attr) == value:
+                    metas[i] = elem
+            continue
+        if name == "time":
+            time_tags.append(elem)
+
+        classes = elem.get("class")
+        elem_id = elem.get("id")
+        if classes is None and elem_id is None and name != "textarea":
+            continue
+        if isinstance(classes, str):
+            classes = classes.split()
+        class_text = " ".join(classes) if classes is not None else None
+
+        for i, (tag, class_name, class_part, id_part) in enumerate(_PUBLISH_ELEMENT_RULES):
+            if tag is not None and name != tag:
+                continue
+            if class_name is not None and (classes is None or class_name not in classes):
+                continue
+            if class_part is not None and (class_text is None or class_part not in class_text):
+                continue
+            if id_part is not None and (not isinstance(elem_id, str) or id_part not in elem_id):
+                continue
+            elements[i].append(elem)
+
+    return metas, time_tags, elements
+
+
 def _extract_publish_time(page_soup):
-    """统一的发布时间提取函数"""
-    # Meta 标签提取 - 优先处理标准的发布时间标签
-    meta_selectors = [
-        "meta[property='article:published_time']",
-        "meta[property='sitemap:news:publication_date']",
-        "meta[itemprop='datePublished']",
-        "meta[name='publishdate']",
-        "meta[name='pubdate']",
-        "meta[name='original-publish-date']",
-        "meta[name='weibo:article:create_at']",
-        "meta[name='baidu_ssp:publishdate']",
-    ]
+    """统一的发布时间提取函数：一次遍历收集候选元素，再按优先级解析，命中即返回"""
+    now = time.time()
+    metas, time_tags, elements = _collect_publish_candidates(page_soup)
 
-    for selector in meta_selectors:
-        meta_tag = page_soup.select_one(selector)
-        if meta_tag:
-            datetime_str = meta_tag.get("content")
-            if datetime_str:
-                try:
-                    # 处理 UTC 时间 (以Z结尾)
-                    if datetime_str.endswith("Z"):
-                        dt = datetime.fromisoformat(datetime_str.replace("Z", "+00:00"))
-                        # 转换为东八区时间
-                        dt_local = dt + timedelta(hours=8)
-                        return dt_local.strftime("%Y-%m-%d")
-                    # 处理带时区的 ISO 8601 格式
-                    elif "T" in datetime_str and ("+" in datetime_str or "-" in datetime_str[-6:]):
-                        dt = datetime.fromisoformat(datetime_str)
-                        return dt.strftime("%Y-%m-%d")
-                    # 处理简单的日期格式
-                    elif "T" in datetime_str:
-                        return datetime_str.split("T")[0]
-                except Exception:
-                    pass
+    # Meta 标签提取 - 优先处理标准的发布时间标签
+    for meta_tag in metas:
+        if meta_tag is not None:
+            pub_time = _format_iso_datetime(meta_tag.get("content"))
+            if pub_time is not None:
+                return pub_time
 
-    # Time 标签提取
-    time_tags = page_soup.select("time")
+    # Time 标签提取，datetime 属性解析失败时尝试文本内容
     for time_tag in time_tags:
-        datetime_attr = time_tag.get("datetime")
-        if datetime_attr:
-            try:
-                # 处理 UTC 时间 (以Z结尾)
-                if datetime_attr.endswith("Z"):
-                    dt = datetime.fromisoformat(datetime_attr.replace("Z", "+00:00"))
-                    # 转换为东八区时间
-                    dt_local = dt + timedelta(hours=8)
-                    return dt_local.strftime("%Y-%m-%d")
-                # 处理带时区的 ISO 8601 格式
-                elif "T" in datetime_attr and ("+" in datetime_attr or "-" in datetime_attr[-6:]):
-                    dt = datetime.fromisoformat(datetime_attr)
-                    return dt.strftime("%Y-%m-%d")
-                # 处理简单的日期格式
-                elif "T" in datetime_attr:
-                    return datetime_attr.split("T")[0]
-            except Exception:
-                pass
-
-        # 如果 datetime 属性解析失败，尝试文本内容
-        text_content = clean_date_text(time_tag.get_text())
-        if text_content and is_valid_date(text_content):
-            time_date = calculate_actual_date(text_content, time.time())
-            if time_date:
-                return time_date.strftime("%Y-%m-%d")
-
-    # HTML 元素提取
-    date_selectors = [
-        "textarea.article-time",
-        "[class*='date']",
-        "[class*='time']",
-        "[class*='publish']",
-        "[class*='post-date']",
-        "[id*='date']",
-        "[id*='time']",
-        ".byline",
-        ".info",
-        ".article-meta",
-        ".source",
-        ".entry-date",
-        "div.date",
-        "p.date",
-        "p.time",
-    ]
-
-    for selector in date_selectors:
-        elements = page_soup.select(selector)
-        for elem in elements:
-            text = clean_date_text(elem.get_text())
-            if text and is_valid_date(text):
-                elem_date = calculate_actual_date(text, time.time())
-                if elem_date:
-                    return elem_date.strftime("%Y-%m-%d")
+        pub_time = _format_iso_datetime(time_tag.get("datetime"))
+        if pub_time is None:
+            pub_time = _format_text_date(time_tag.get_text(), now)
+        if pub_time is not None:
+            return pub_time
+
+    # HTML 元素提取，同一元素命中多个规则时只解析一次
+    checked = set()
+    for matched in elements:
+        for elem in matched:
+            if id(elem) in checked:
+                continue
+            checked.add(id(elem))
+            pub_time = _format_text_date(elem.get_text(), now)
+            if pub_time is not None:
+                return pub_time
 
     # 兜底：全文搜索
-    text = clean_date_text(page_soup.get_text())
-    for pattern in [
-        r"\d{4}\s*[-/年\.]?\s*\d{1,2}\s*[-/月\.]?\s*\d{1,2}\s*(?:日)?(?:\s+\d{1,2}:\d{1,2}(?::\d{1,2})?)?",  # noqa 501
-        r"\d{1,2}[-/]\d{1,2}[-/]\d{4}",
-        r"\d{1,2}\s*[月]\s*\d{1,2}\s*[日]?",
-        r"(?:\d+\s*(?:秒|分钟|分|小时|个小时|天|日|周|星期|个月|月|年)前|刚刚|今天|昨天|前天|上周|上星期|上个月|上月|去年)",
-        r"\d{4}年\d{1,2}月\d{1,2}日",
-    ]:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            pub_time = match.group(0)
-            if is_valid_date(pub_time):
-                pub_time_date = calculate_actual_date(pub_time, time.time())
-                if pub_time_date:
-                    return pub_time_date.strftime("%Y-%m-%d")
+    text = date_parser.clean(page_soup.get_text())
+    pub_time_date = date_parser.search(text, now, date_parser.PAGE_TEXT_PATTERNS)
+    return pub_time_date.strftime("%Y-%m-%d") if pub_time_date else ""
 
-    return ""
 
+# 参考链接抓取：共享 Session 复用连接，同一站点限制并发与请求间隔，替代全局 sleep
+_URL_FETCH_WORKERS = 5
+_HOST_CONCURRENCY = 2
+_HOST_MIN_INTERVAL = 1.0
 
-def extract_page_content(url, headers=None):
-    """从 URL 提取页面内容和发布日期"""
+_session = requests.Session()
+_session.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+_session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+
+class _HostLimiter:
+    """按站点限流：每个站点最多 concurrency 个并发请求，相邻请求至少间隔 min_interval 秒"""
+
+    def __init__(self, concurrency: int, min_interval: float):
+        self.concurrency = concurrency
+        self.min_interval = min_interval
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.Semaphore] = {}
+        self._next_slot: Dict[str, float] = {}
+
+    def _reserve(self, host: str) -> float:
+        """预约该站点的下一个请求时间，返回需要等待的秒数"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + self.min_interval
+            return slot - now
+
+    def acquire(self, host: str):
+        with self._lock:
+            semaphore = self._semaphores.setdefault(host, threading.Semaphore(self.concurrency))
+        semaphore.acquire()
+        delay = self._reserve(host)
+        if delay > 0:
+            time.sleep(delay)
+
+    def release(self, host: str):
+        self._semaphores[host].release()
+
+
+_host_limiter = _HostLimiter(_HOST_CONCURRENCY, _HOST_MIN_INTERVAL)
+
+
+def _fetch_page(url, headers=None):
+    """经共享 Session 请求页面，遵守站点限流"""
+    host = urlparse(url).netloc
+    _host_limiter.acquire(host)
     try:
-        time.sleep(1)
-        response = requests.get(url, headers=headers or {}, timeout=30)
-        response.encoding = response.apparent_encoding or "utf-8"
-        content = response.text
+        return _session.get(url, headers=headers or {}, timeout=30)
+    finally:
+        _host_limiter.release(host)
+
 
-        page_soup = BeautifulSoup(content, "html.parser")
+def _parse_page(response):
+    """解析响应为 BeautifulSoup 并提取发布日期"""
+    response.encoding = response.apparent_encoding or "utf-8"
+    content = response.text
 
-        # 直接调用统一的时间提取函数
-        pub_time = _extract_publish_time(page_soup)
+    page_soup = BeautifulSoup(content, "html.parser")
 
-        return page_soup, pub_time
+    # 直接调用统一的时间提取函数
+    pub_time = _extract_publish_time(page_soup)
 
+    return page_soup, pub_time
+
+
+def extract_page_content(url, headers=None):
+    """从 URL 提取页面内容和发布日期"""
+    try:
+        return _parse_page(_fetch_page(url, headers))
     except Exception:
         return None, None
 
@@ -832,64 +748,102 @@ ENGINE_CONFIGS = {
 
 
 # ---------- 以下为通过链接提取文章信息----------------
+def _extract_url_content(url: str) -> Dict[str, Any]:
+    """
+    提取单个URL的内容，普通请求无法获取有效内容时使用共享浏览器兜底；
+    启用网页缓存时直接返回未过期的解析结果，过期条目通过 ETag/Last-Modified 条件请求校验
+    """
+    cache = WebContentCache.get_instance() if WebContentCache.is_enabled() else None
+    cache_key = cache.page_key(url) if cache else ""
+    cached = cache.lookup(cache_key) if cache else None
+    if cached and cached["fresh"]:
+        return {**cached["data"], "url": url}
+
+    # 首先尝试普通方法
+    headers = {**get_common_headers(), **WebContentCache.conditional_headers(cached)}
+    page_soup, pub_time, response = None, None, None
+    try:
+        response = _fetch_page(url, headers)
+        if cached and response.status_code == 304:
+            cache.revalidated(cache_key, cached)  # type: ignore
+            return {**cached["data"], "url": url}
+        page_soup, pub_time = _parse_page(response)
+    except Exception:
+        pass
+
+    # 如果普通方法无法获取有效内容，使用Selenium
+    if not page_soup or not _has_meaningful_content(page_soup):
+        try:
+            page_content = BrowserPool.get_instance().fetch_html(url)
+        except Exception:
+            # 浏览器不可用时保留普通请求的结果，两者都失败才视为提取错误
+            if not page_soup:
+                raise
+            page_content = ""
+        if page_content:
+            page_soup = BeautifulSoup(page_content, "html.parser")
+            pub_time = _extract_publish_time(page_soup)
+
+    if page_soup:
+        title = _extract_title_from_page(page_soup)
+        full_content = _extract_full_article_content(page_soup)
+        result = {
+            "title": title or "",
+            "pub_time": pub_time or "",
+            "abstract": "",
+            "content": full_content,
+            "url": url,
+        }
+        # 只缓存提取到正文的结果，失败的页面下次仍重新请求
+        if cache and title and full_content:
+            cache.set(
+                cache_key,
+                {k: v for k, v in result.items() if k != "url"},
+                kind="page",
+                etag=response.headers.get("ETag", "") if response is not None else "",
+                last_modified=(
+                    response.headers.get("Last-Modified", "") if response is not None else ""
+                ),
+            )
+        return result
+
+    # 页面加载失败，记录为提取失败，但不影响整体success
+    return {
+        "title": "",
+        "pub_time": "",
+        "abstract": "",
+        "content": "无法提取内容: 页面加载失败",
+        "url": url,
+    }
+
+
 def extract_urls_content(urls: List[str], topic="") -> Dict[str, Any]:
-    """提取URL内容，自动检测并处理动态网站，并返回标准格式"""
+    """提取URL内容，自动检测并处理动态网站，并返回标准格式；多个URL并发提取，结果保持原顺序"""
     extracted_results = []
     overall_success = True
     overall_error_message = None
 
-    for url in urls:
-        try:
-            # 首先尝试普通方法
-            page_soup, pub_time = extract_page_content(url, get_common_headers())
-
-            # 如果普通方法无法获取有效内容，使用Selenium
-            if not page_soup or not _has_meaningful_content(page_soup):
-                selenium_tool = SeleniumScrapingTool(
-                    website_url=url, wait_time=15, return_html=True
-                )
-                page_content = selenium_tool._run(website_url=url, css_element="body")
-                if page_content:
-                    page_soup = BeautifulSoup(page_content, "html.parser")
-                    pub_time = _extract_publish_time(page_soup)
-
-            if page_soup:
-                title = _extract_title_from_page(page_soup)
-                full_content = _extract_full_article_content(page_soup)
-                extracted_results.append(
-                    {
-                        "title": title or "",
-                        "pub_time": pub_time or "",
-                        "abstract": "",
-                        "content": full_content,
-                        "url": url,
-                    }
-                )
-            else:
-                # 页面加载失败，记录为提取失败，但不影响整体success
-                extracted_results.append(
-                    {
-                        "title": "",
-                        "pub_time": "",
-                        "abstract": "",
-                        "content": "无法提取内容: 页面加载失败",
-                        "url": url,
-                    }
-                )
+    if urls:
+        workers = min(len(urls), _URL_FETCH_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="aiwritex-url") as pool:
+            futures = [pool.submit(_extract_url_content, url) for url in urls]
 
-        except Exception as e:
-            # 捕获到异常，记录错误信息，但不影响整体success
-            overall_success = False
-            overall_error_message = f"提取过程中发生部分错误: {str(e)}"
-            extracted_results.append(
-                {
-                    "title": "",
-                    "pub_time": "",
-                    "abstract": "",
-                    "content": f"无法提取内容: {str(e)}",
-                    "url": url,
-                }
-            )
+            for url, future in zip(urls, futures):
+                try:
+                    extracted_results.append(future.result())
+                except Exception as e:
+                    # 捕获到异常，记录错误信息，但不影响整体success
+                    overall_success = False
+                    overall_error_message = f"提取过程中发生部分错误: {str(e)}"
+                    extracted_results.append(
+                        {
+                            "title": "",
+                            "pub_time": "",
+                            "abstract": "",
+                            "content": f"无法提取内容: {str(e)}",
+                            "url": url,
+                        }
+                    )
 
     # 构建标准返回格式
     # success只关注函数执行过程中是否发生未捕获的异常，这里已经通过try-except处理了单个URL的异常
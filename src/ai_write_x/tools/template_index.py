@@ -0,0 +1,192 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.ai_write_x.config.config import Config
+from src.ai_write_x.tools.search_context import estimate_tokens
+from src.ai_write_x.utils import log
+from src.ai_write_x.utils import utils
+from src.ai_write_x.utils.html_slim import slim_html
+from src.ai_write_x.utils.path_manager import PathManager
+
+
+@dataclass
+class TemplateEntry:
+    """内存中的模板：元数据、原始内容与压缩并瘦身后的内容"""
+
+    category: str
+    name: str  # 文件名（含 .html）
+    path: str
+    size: int
+    mtime_ns: int
+    content: str
+    slim: str
+    tokens: int  # 原始内容的 token 数
+    slim_tokens: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.category}/{self.name}"
+
+
+class TemplateIndex:
+    """
+    模板索引：启动时加载模板目录（分类/模板.html）下的全部模板及其压缩结果，
+    按分类建立索引；每隔 check_interval 秒最多按 mtime/大小校验一次，只重新加载变化的文件，
+    其余时间选择模板无需访问磁盘。压缩结果为压缩后再瘦身（见 html_slim）的模板
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(
+        self, template_dir: str, check_interval: float = 10, svg_precision: Optional[int] = 1
+    ):
+        self.template_dir = Path(template_dir)
+        self.check_interval = check_interval
+        self.svg_precision = svg_precision
+        self._entries: Dict[str, TemplateEntry] = {}
+        self._by_category: Dict[str, List[str]] = {}
+        self._last_scan = 0.0
+        self._index_lock = threading.RLock()
+        self.stats = {"scans": 0, "loads": 0}
+        self.refresh()
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    index_config = Config.get_instance().template_index_config
+                    cls._instance = cls(
+                        str(PathManager.get_template_dir()),
+                        index_config["check_interval"],
+                        index_config["svg_precision"],
+                    )
+        return cls._instance
+
+    def _load(self, path: Path, category: str, size: int, mtime_ns: int) -> TemplateEntry:
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+        slim = slim_html(utils.compress_html(content), self.svg_precision)
+        return TemplateEntry(
+            category=category,
+            name=path.name,
+            path=str(path),
+            size=size,
+            mtime_ns=mtime_ns,
+            content=content,
+            slim=slim,
+            tokens=estimate_tokens(content),
+            slim_tokens=estimate_tokens(slim),
+        )
+
+    def refresh(self):
+        """扫描模板目录，加载新增或修改过的模板，移除已删除的模板"""
+        with self._index_lock:
+            entries: Dict[str, TemplateEntry] = {}
+            for path in sorted(self.template_dir.glob("*/*.html")):
+                key = f"{path.parent.name}/{path.name}"
+                try:
+                    stat = path.stat()
+                    cached = self._entries.get(key)
+                    if (
+                        cached
+                        and cached.mtime_ns == stat.st_mtime_ns
+                        and cached.size == stat.st_size
+                    ):
+                        entries[key] = cached
+                        continue
+                    entries[key] = self._load(
+                        path, path.parent.name, stat.st_size, stat.st_mtime_ns
+                    )
+                    self.stats["loads"] += 1
+                except (OSError, UnicodeDecodeError) as e:
+                    log.print_log(f"加载模板失败: {path}, {str(e)}", "warning")
+
+            by_category: Dict[str, List[str]] = {}
+            for key, entry in entries.items():
+                by_category.setdefault(entry.category, []).append(key)
+
+            self._entries = entries
+            self._by_category = by_category
+            self._last_scan = time.monotonic()
+            self.stats["scans"] += 1
+
+    def _ensure_fresh(self):
+        if time.monotonic() - self._last_scan >= self.check_interval:
+            self.refresh()
+
+    def get(self, category: str, template: str) -> Optional[TemplateEntry]:
+        """按分类和模板名（可省略 .html）获取模板"""
+        self._ensure_fresh()
+        name = template if template.endswith(".html") else f"{template}.html"
+        return self._entries.get(f"{category}/{name}")
+
+    def choose(self, category: str = "") -> Optional[TemplateEntry]:
+        """随机选择模板：指定分类时在该分类中选择，否则在全部模板中选择"""
+        self._ensure_fresh()
+        with self._index_lock:
+            keys = self._by_category.get(category, []) if category else list(self._entries)
+            if not keys:
+                return None
+            return self._entries[random.choice(keys)]
+
+    def templates(self, category: str = "") -> List[TemplateEntry]:
+        """指定分类（为空时为全部）下的模板"""
+        self._ensure_fresh()
+        with self._index_lock:
+            keys = self._by_category.get(category, []) if category else list(self._entries)
+            return [self._entries[key] for key in keys]
+
+    def report(self, category: str = "") -> List[Dict[str, object]]:
+        """各模板原始与瘦身后的 token 数，按瘦身后 token 数从大到小排列"""
+        rows = []
+        for entry in self.templates(category):
+            rows.append(
+                {
+                    "template": entry.key,
+                    "tokens": entry.tokens,
+                    "slim_tokens": entry.slim_tokens,
+                    "saved": 1 - entry.slim_tokens / entry.tokens if entry.tokens else 0.0,
+                }
+            )
+        rows.sort(key=lambda row: row["slim_tokens"], reverse=True)  # type: ignore
+        return rows
+
+    def get_stats(self) -> Dict[str, object]:
+        with self._index_lock:
+            categories: Dict[str, Tuple[int, int, int]] = {}
+            for entry in self._entries.values():
+                count, tokens, slim_tokens = categories.get(entry.category, (0, 0, 0))
+                categories[entry.category] = (
+                    count + 1,
+                    tokens + entry.tokens,
+                    slim_tokens + entry.slim_tokens,
+                )
+            return {
+                **self.stats,
+                "templates": len(self._entries),
+                "categories": {
+                    name: {"templates": count, "tokens": tokens, "slim_tokens": slim_tokens}
+                    for name, (count, tokens, slim_tokens) in categories.items()
+                },
+            }
+
+
+if __name__ == "__main__":
+    # 输出各模板的 token 占用：python -m src.ai_write_x.tools.template_index [分类]
+    import sys
+
+    if not Config.get_instance().load_config():
+        sys.exit(1)
+
+    template_report = TemplateIndex.get_instance().report(sys.argv[1] if len(sys.argv) > 1 else "")
+    total_tokens = sum(row["tokens"] for row in template_report)  # type: ignore
+    total_slim = sum(row["slim_tokens"] for row in template_report)  # type: ignore
+    for row in template_report:
+        print(f"{row['slim_tokens']:>8} {row['tokens']:>8} {row['saved']:>7.1%}  {row['template']}")
+    print(f"{total_slim:>8} {total_tokens:>8}  共 {len(template_report)} 个模板（瘦身后 / 原始 / 节省）")
@@ -0,0 +1,125 @@
+import gzip
+import hashlib
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urldefrag
+
+from src.ai_write_x.config.config import Config
+from src.ai_write_x.utils.disk_cache import DiskCache
+from src.ai_write_x.utils.path_manager import PathManager
+
+
+class WebContentCache(DiskCache):
+    """
+    参考页面与搜索结果的磁盘缓存：保存解析后的标题/正文/发布时间而非原始 HTML，
+    gzip 压缩存储，支持TTL、按总大小淘汰，并保留 ETag/Last-Modified 用于条件请求
+    """
+
+    name = "网页缓存"
+    suffix = ".json.gz"
+
+    def __init__(self, cache_dir: str | None = None):
+        super().__init__(
+            Path(cache_dir) if cache_dir else PathManager.get_data_dir() / "web_cache"
+        )
+        self.stats["revalidated"] = 0
+
+    def settings(self) -> Dict[str, Any]:
+        return Config.get_instance().web_cache_config
+
+    def encode(self, entry: Dict[str, Any]) -> bytes:
+        return gzip.compress(super().encode(entry))
+
+    def decode(self, data: bytes) -> Dict[str, Any]:
+        return super().decode(gzip.decompress(data))
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return bool(Config.get_instance().web_cache_config["enabled"])
+
+    @staticmethod
+    def normalize_url(url: str) -> str:
+        """去掉锚点和首尾空白，锚点不影响页面内容"""
+        return urldefrag(url.strip())[0]
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """合并空白并转小写，措辞相同的搜索共享缓存"""
+        return re.sub(r"\s+", " ", query).strip().lower()
+
+    @staticmethod
+    def make_key(kind: str, value: str) -> str:
+        return hashlib.sha256(f"{kind}:{value}".encode("utf-8")).hexdigest()
+
+    def page_key(self, url: str) -> str:
+        return self.make_key("page", self.normalize_url(url))
+
+    def search_key(self, query: str, *params) -> str:
+        material = json.dumps([self.normalize_query(query), *params], ensure_ascii=False)
+        return self.make_key("search", material)
+
+    def _ttl(self, kind: str) -> float:
+        return self.settings()[f"{kind}_ttl"]
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        获取缓存条目（含 data、etag、last_modified），条目额外带 fresh 标记：
+        未过期为 True；已过期但带有校验信息时为 False，可用于条件请求
+        """
+        with self._io_lock:
+            entry = self._read(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+
+            ttl = self._ttl(entry.get("kind", "page"))
+            fresh = not ttl or time.time() - entry.get("created_at", 0) <= ttl
+            if not fresh and not (entry.get("etag") or entry.get("last_modified")):
+                self._remove(key)
+                self.stats["misses"] += 1
+                return None
+
+            self._touch(key)
+            self.stats["hits" if fresh else "misses"] += 1
+            return {**entry, "fresh": fresh}
+
+    def get(self, key: str) -> Any:
+        """获取未过期的缓存数据，不存在或已过期返回 None"""
+        entry = self.lookup(key)
+        return entry["data"] if entry and entry["fresh"] else None
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """根据缓存条目生成 If-None-Match / If-Modified-Since 请求头"""
+        headers = {}
+        if entry and entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def revalidated(self, key: str, entry: Dict[str, Any]):
+        """服务器返回 304 时刷新条目的创建时间，继续使用缓存内容"""
+        self.stats["revalidated"] += 1
+        self.set(
+            key,
+            entry["data"],
+            kind=entry.get("kind", "page"),
+            etag=entry.get("etag", ""),
+            last_modified=entry.get("last_modified", ""),
+        )
+
+    def set(self, key: str, data: Any, kind: str = "page", etag: str = "", last_modified: str = ""):
+        """写入缓存并按总大小淘汰最久未使用的条目"""
+        entry = {
+            "created_at": time.time(),
+            "kind": kind,
+            "etag": etag or "",
+            "last_modified": last_modified or "",
+            "data": data,
+        }
+        with self._io_lock:
+            self._write(key, entry)
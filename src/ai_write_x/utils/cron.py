@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta
+from typing import List, Set
+
+
+class CronExpression:
+    """
+    标准五段式 cron 表达式：分 时 日 月 周
+    支持 *、*/n、a-b、a-b/n、a,b,c；周取值 0-6（0 为周日，7 同样视为周日）
+    """
+
+    _FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 6)]
+
+    def __init__(self, expression: str):
+        self.expression = expression.strip()
+        fields = self.expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron表达式必须包含5个字段: {expression}")
+
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+        parsed: List[Set[int]] = []
+        for i, (text, (low, high)) in enumerate(zip(fields, self._FIELD_RANGES)):
+            # 周字段允许 7 表示周日
+            field_high = 7 if i == 4 else high
+            values = self._parse_field(text, low, field_high)
+            if i == 4:
+                values = {v % 7 for v in values}
+            parsed.append(values)
+
+        self.minutes, self.hours, self.days, self.months, self.weekdays = parsed
+
+    @staticmethod
+    def _parse_field(text: str, low: int, high: int) -> Set[int]:
+        values: Set[int] = set()
+        for part in text.split(","):
+            step = 1
+            if "/" in part:
+                part, step_text = part.split("/", 1)
+                step = int(step_text)
+                if step <= 0:
+                    raise ValueError(f"无效的步长: {step_text}")
+
+            if part == "*":
+                start, end = low, high
+            elif "-" in part:
+                start_text, end_text = part.split("-", 1)
+                start, end = int(start_text), int(end_text)
+            else:
+                start = int(part)
+                end = high if step > 1 else start
+
+            if start < low or end > high or start > end:
+                raise ValueError(f"字段取值超出范围 [{low}-{high}]: {text}")
+
+            values.update(range(start, end + 1, step))
+        return values
+
+    def _day_matches(self, dt: datetime) -> bool:
+        # 与 crontab 一致：日和周都被限定时，任一匹配即可
+        weekday = (dt.weekday() + 1) % 7
+        day_ok = dt.day in self.days
+        weekday_ok = weekday in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day_ok and weekday_ok
+        return day_ok or weekday_ok
+
+    def matches(self, dt: datetime) -> bool:
+        """判断给定时间（精确到分钟）是否命中表达式"""
+        return (
+            dt.minute in self.minutes
+            and dt.hour in self.hours
+            and dt.month in self.months
+            and self._day_matches(dt)
+        )
+
+    def next_after(self, dt: datetime) -> datetime:
+        """返回严格晚于 dt 的下一个命中时间"""
+        candidate = dt.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        # 最多向后查找约 5 年（覆盖 2 月 29 日之类的表达式）
+        limit = candidate + timedelta(days=366 * 5)
+
+        while candidate <= limit:
+            if candidate.month not in self.months:
+                # 跳到下个月 1 日 0 点
+                year = candidate.year + (1 if candidate.month == 12 else 0)
+                month = 1 if candidate.month == 12 else candidate.month + 1
+                candidate = candidate.replace(year=year, month=month, day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if candidate.hour not in self.hours:
+                candidate = candidate.replace(minute=0) + timedelta(hours=1)
+                continue
+            if candidate.minute not in self.minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+
+        raise ValueError(f"cron表达式没有可命中的时间: {self.expression}")
@@ -0,0 +1,307 @@
+"""
+日期解析：统一 search_template 中的日期清理、识别与换算
+
+正则全部预编译；识别用单个合并的交替模式一次搜索；换算先把文本归类为与参考时间无关的
+日期描述（绝对日期、相对偏移、月日等）并缓存，再结合参考时间得到具体日期，
+同一字符串在提取和校验中反复出现时只做一次正则匹配
+"""
+
+import html
+import re
+import unicodedata
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
+
+from dateutil.relativedelta import relativedelta
+
+
+# 只缓存较短的文本（日期片段、元素文本），整页文本等长文本不缓存，避免占用内存
+_CACHE_SIZE = 4096
+_MAX_CACHED_LENGTH = 256
+
+_PREFIX_RE = re.compile(r"^(发表于|更新时间|发布时间|创建时间|Posted on|Published on|Date):\s*", re.I)
+_SPACE_RE = re.compile(r"\s+")
+
+# 可识别为日期的文本模式，任一模式命中即视为日期
+_DATE_LIKE_PATTERNS = [
+    # 完整日期时间（支持带空格的中文格式）
+    r"\d{4}\s*[-/年\.]?\s*\d{1,2}\s*[-/月\.]?\s*\d{1,2}\s*(?:日)?(?:\s+\d{1,2}:\d{1,2}(?::\d{1,2})?)?",  # noqa 501
+    r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:Z|[+-]\d{2}:\d{2})?",
+    r"\d{1,2}[-/]\d{1,2}[-/]\d{4}\s+\d{1,2}:\d{1,2}(?::\d{1,2})?",
+    # 完整日期
+    r"\d{4}\s*[-/年\.]?\s*\d{1,2}\s*[-/月\.]?\s*\d{1,2}\s*(?:日)?",
+    r"\d{1,2}[-/]\d{1,2}[-/]\d{4}",
+    # 相对时间
+    r"(\d+)\s*(秒|分钟|分|小时|个小时|天|日|周|星期|个月|月|年)前",
+    r"(刚刚|今天|昨天|前天|上周|上星期|上个月|上月|去年)",
+    # 不完整日期
+    r"\d{1,2}\s*[-/\.月]?\s*\d{1,2}\s*(?:日)?",
+    # Unix 时间戳
+    r"^\d{10}$",
+    r"^\d{13}$",
+    # 英文格式
+    r"\d+\s*(second|seconds|minute|minutes|hour|hours|day|days|week|weeks|month|months|year|years)\s*ago",  # noqa 501
+    r"(yesterday|today|just\s*now|last\s*(week|month|year)|this\s*(week|month|year))",
+]
+_DATE_LIKE_RE = re.compile("|".join(f"(?:{p})" for p in _DATE_LIKE_PATTERNS), re.I)
+
+_TIMESTAMP_RE = re.compile(r"^\d{10}$")
+_TIMESTAMP_MS_RE = re.compile(r"^\d{13}$")
+
+# 相对时间：(模式, 偏移单位)，按顺序匹配
+_RELATIVE_PATTERNS = [
+    (re.compile(r"(\d+)\s*秒前", re.I), "seconds"),
+    (re.compile(r"(\d+)\s*(分钟|分)前", re.I), "minutes"),
+    (re.compile(r"(\d+)\s*(小时|个小时)前", re.I), "hours"),
+    (re.compile(r"(\d+)\s*(天|日)前", re.I), "days"),
+    (re.compile(r"(\d+)\s*(周|星期)前", re.I), "weeks"),
+    (re.compile(r"(\d+)\s*(个月|月)前", re.I), "months"),
+    (re.compile(r"(\d+)\s*年前", re.I), "years"),
+]
+
+# 特殊相对时间：(关键字, 偏移单位, 数量)，"今天" 取参考日期零点
+_SPECIAL_RELATIVE = [
+    ("刚刚", "seconds", 0),
+    ("今天", "today", 0),
+    ("昨天", "days", 1),
+    ("前天", "days", 2),
+    ("上周", "weeks", 1),
+    ("上星期", "weeks", 1),
+    ("上个月", "months", 1),
+    ("上月", "months", 1),
+    ("去年", "years", 1),
+]
+
+# 英文相对时间：(模式, 偏移单位, 固定数量)，固定数量为 None 时取第一个分组
+_ENGLISH_RELATIVE = [
+    (re.compile(r"(\d+)\s*seconds?\s*ago", re.I), "seconds", None),
+    (re.compile(r"(\d+)\s*minutes?\s*ago", re.I), "minutes", None),
+    (re.compile(r"(\d+)\s*hours?\s*ago", re.I), "hours", None),
+    (re.compile(r"(\d+)\s*days?\s*ago", re.I), "days", None),
+    (re.compile(r"(\d+)\s*weeks?\s*ago", re.I), "weeks", None),
+    (re.compile(r"(\d+)\s*months?\s*ago", re.I), "months", None),
+    (re.compile(r"(\d+)\s*years?\s*ago", re.I), "years", None),
+    (re.compile(r"yesterday", re.I), "days", 1),
+    (re.compile(r"just\s*now", re.I), "seconds", 0),
+    (re.compile(r"last\s*week", re.I), "weeks", 1),
+    (re.compile(r"last\s*month", re.I), "months", 1),
+    (re.compile(r"last\s*year", re.I), "years", 1),
+]
+_ENGLISH_HINTS = ("ago", "yesterday", "just", "last")
+
+_MONTH_DAY_RE = re.compile(r"(\d{1,2})\s*[-/\.月]?\s*(\d{1,2})\s*(?:日)?")
+_COMPLETE_PATTERNS = [
+    (re.compile(r"(\d{4})\s*[-/年\.]?\s*\d{1,2}\s*[-/月\.]?\s*\d{1,2}\s*(?:日)?"), "%Y-%m-%d"),
+    (re.compile(r"(\d{1,2})[-/](\d{1,2})[-/](\d{4})"), "%m/%d/%Y"),
+]
+
+# 标准日期格式，搜索结果的 pub_time 已是该格式时无需换算
+DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+DATETIME_RE = re.compile(r"^\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}(?::\d{2})?$")
+
+# 从网页全文中查找发布时间的模式，按优先级排列
+PAGE_TEXT_PATTERNS = [
+    re.compile(pattern, re.I)
+    for pattern in [
+        r"\d{4}\s*[-/年\.]?\s*\d{1,2}\s*[-/月\.]?\s*\d{1,2}\s*(?:日)?(?:\s+\d{1,2}:\d{1,2}(?::\d{1,2})?)?",  # noqa 501
+        r"\d{1,2}[-/]\d{1,2}[-/]\d{4}",
+        r"\d{1,2}\s*[月]\s*\d{1,2}\s*[日]?",
+        r"(?:\d+\s*(?:秒|分钟|分|小时|个小时|天|日|周|星期|个月|月|年)前|刚刚|今天|昨天|前天|上周|上星期|上个月|上月|去年)",
+        r"\d{4}年\d{1,2}月\d{1,2}日",
+    ]
+]
+
+# 从搜索结果摘要中查找发布时间的模式，按优先级排列
+ABSTRACT_PATTERNS = [
+    re.compile(pattern, re.I)
+    for pattern in [
+        r"\d{4}\s*[-/年\.]?\s*\d{1,2}\s*[-/月\.]?\s*\d{1,2}\s*(?:日)?(?:\s+\d{1,2}:\d{1,2}(?::\d{1,2})?)?",  # noqa 501
+        r"\d{1,2}\s*[月]\s*\d{1,2}\s*[日]?",
+        r"(?:\d+\s*(?:秒|一分钟|分钟|分|小时|个小时|天|日|周|星期|个月|月|年)前|刚刚|今天|昨天|前天|上周|上星期|上个月|上月|去年)",
+        r"\d{4}年\d{1,2}月\d{1,2}日",
+    ]
+]
+
+
+def _memoize(func):
+    """对较短的字符串参数做 LRU 缓存，长文本直接计算"""
+    cached = lru_cache(maxsize=_CACHE_SIZE)(func)
+
+    def wrapper(text: str):
+        if len(text) > _MAX_CACHED_LENGTH:
+            return func(text)
+        return cached(text)
+
+    wrapper.cache_info = cached.cache_info  # type: ignore
+    wrapper.cache_clear = cached.cache_clear  # type: ignore
+    wrapper.__doc__ = func.__doc__
+    return wrapper
+
+
+def clean(text) -> str:
+    """专为日期清理文本，去掉常见前缀与控制字符，保留日期格式关键字符"""
+    if not text:
+        return ""
+    if isinstance(text, str):
+        return _clean_str(text)
+    try:
+        if isinstance(text, (int, float)):
+            return str(text)
+        if isinstance(text, bytes):
+            return _clean_str(text.decode("utf-8", errors="ignore"))
+        return _clean_str(text)
+    except Exception:
+        return ""
+
+
+@_memoize
+def _clean_str(text: str) -> str:
+    # 如果是纯数字字符串，直接返回，避免不必要的清理
+    if text.isdigit():
+        return text
+    try:
+        text = html.unescape(text)
+        text = _PREFIX_RE.sub("", text).strip()
+        text = "".join(char for char in text if unicodedata.category(char)[0] != "C")
+        # 保留单个空格，避免破坏中文日期格式
+        return _SPACE_RE.sub(" ", text).strip()
+    except Exception:
+        return ""
+
+
+def is_date_like(text) -> bool:
+    """文本清理后是否包含可识别的日期或相对时间"""
+    if not text or text in ("None", "未知"):
+        return False
+    return _is_date_like(clean(str(text)))
+
+
+@_memoize
+def _is_date_like(cleaned: str) -> bool:
+    return _DATE_LIKE_RE.search(cleaned) is not None
+
+
+@_memoize
+def _classify(cleaned: str) -> Optional[Tuple]:
+    """
+    将清理后的文本归类为与参考时间无关的日期描述：
+    ("absolute", datetime) / ("relative", 单位, 数量) / ("month_day", 月, 日) / ("invalid",)
+    无法识别返回 None；"invalid" 表示识别到格式但日期本身不合法
+    """
+    try:
+        # 优先处理 Unix 时间戳
+        if _TIMESTAMP_RE.match(cleaned):
+            return ("absolute", datetime.fromtimestamp(int(cleaned)))
+        if _TIMESTAMP_MS_RE.match(cleaned):
+            return ("absolute", datetime.fromtimestamp(int(cleaned) / 1000))
+    except (ValueError, OverflowError, OSError):
+        return ("invalid",)
+
+    # 1. 相对时间（均以"前"结尾）
+    if "前" in cleaned:
+        for pattern, unit in _RELATIVE_PATTERNS:
+            match = pattern.search(cleaned)
+            if match:
+                return ("relative", unit, int(match.group(1)))
+
+    # 2. 特殊相对时间
+    for keyword, unit, amount in _SPECIAL_RELATIVE:
+        if keyword in cleaned:
+            return ("relative", unit, amount)
+
+    # 3. 英文相对时间
+    folded = cleaned.casefold()
+    if any(hint in folded for hint in _ENGLISH_HINTS):
+        for pattern, unit, amount in _ENGLISH_RELATIVE:
+            match = pattern.search(cleaned)
+            if match:
+                return ("relative", unit, int(match.group(1)) if amount is None else amount)
+
+    # 4. 不完整日期（只看第一个匹配）
+    match = _MONTH_DAY_RE.search(cleaned)
+    if match:
+        month, day = map(int, match.groups())
+        if 1 <= month <= 12 and 1 <= day <= 31:
+            return ("month_day", month, day)
+
+    # 5. 完整日期（第一个匹配的格式无法解析时视为不合法）
+    for pattern, date_format in _COMPLETE_PATTERNS:
+        match = pattern.search(cleaned)
+        if match:
+            try:
+                return ("absolute", datetime.strptime(match.group(0), date_format))
+            except ValueError:
+                return ("invalid",)
+
+    return None
+
+
+def _shift(reference_date: datetime, unit: str, amount: int) -> datetime:
+    if unit == "today":
+        return reference_date.replace(hour=0, minute=0, second=0, microsecond=0)
+    if unit in ("months", "years"):
+        return reference_date - relativedelta(**{unit: amount})
+    return reference_date - timedelta(**{unit: amount})
+
+
+def _resolve_month_day(reference_date: datetime, month: int, day: int) -> datetime:
+    """月日补全年份：取不晚于参考日期的最近一次，相差超过一年时取更近的年份"""
+    current_year = reference_date.year
+    try_date = reference_date.replace(year=current_year, month=month, day=day)
+    if try_date > reference_date:
+        try_date = try_date.replace(year=current_year - 1)
+    # 验证日期合理性
+    if abs((try_date - reference_date).days) > 365:
+        try_date_alt = try_date.replace(
+            year=current_year - 1 if try_date > reference_date else current_year + 1
+        )
+        if abs((try_date_alt - reference_date).days) < abs((try_date - reference_date).days):
+            try_date = try_date_alt
+    return try_date
+
+
+def parse(text, reference_ts: float) -> Optional[datetime]:
+    """将日期文本换算为具体日期，相对时间以 reference_ts 为参考；无法识别返回 None"""
+    if not text or not reference_ts:
+        return None
+
+    try:
+        spec = _classify(clean(str(text)))
+        if spec is None or spec[0] == "invalid":
+            return None
+        if spec[0] == "absolute":
+            return spec[1]
+
+        reference_date = datetime.fromtimestamp(reference_ts)
+        if spec[0] == "relative":
+            return _shift(reference_date, spec[1], spec[2])
+        return _resolve_month_day(reference_date, spec[1], spec[2])
+    except Exception:
+        return None
+
+
+def search(text: str, reference_ts: float, patterns: Sequence[re.Pattern]) -> Optional[datetime]:
+    """按优先级在文本中查找日期：每个模式只看第一个匹配，能换算为日期即返回"""
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match and is_date_like(match.group(0)):
+            date = parse(match.group(0), reference_ts)
+            if date:
+                return date
+    return None
+
+
+def cache_info():
+    """各级缓存的命中情况"""
+    return {
+        "clean": _clean_str.cache_info()._asdict(),  # type: ignore
+        "is_date_like": _is_date_like.cache_info()._asdict(),  # type: ignore
+        "classify": _classify.cache_info()._asdict(),  # type: ignore
+    }
+
+
+def cache_clear():
+    _clean_str.cache_clear()  # type: ignore
+    _is_date_like.cache_clear()  # type: ignore
+    _classify.cache_clear()  # type: ignore
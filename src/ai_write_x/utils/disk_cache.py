@@ -0,0 +1,146 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.ai_write_x.utils import log
+
+
+class DiskCache:
+    """
+    磁盘缓存基类：每个条目一个文件，原子写入，按总大小淘汰最久未使用的条目，并统计命中率。
+    各条目的大小在内存中增量维护，写入时无需扫描缓存目录；
+    子类提供缓存名称、文件后缀、编解码方式以及含 max_size_mb 的配置节
+    """
+
+    name = "缓存"
+    suffix = ".json"
+    # 多个进程共用缓存目录，每隔一段时间重新扫描目录，校正其他进程写入或删除造成的偏差
+    rescan_interval = 300.0
+
+    # 单例由各子类分别持有
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._io_lock = threading.Lock()
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        # 文件名 -> 大小，按最近使用排序（最久未使用的在前）
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()
+        self._total_size = 0
+        self._scanned_at = 0.0
+        self._scan()
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def settings(self) -> Dict[str, Any]:
+        """缓存的配置节"""
+        raise NotImplementedError
+
+    def encode(self, entry: Dict[str, Any]) -> bytes:
+        return json.dumps(entry, ensure_ascii=False).encode("utf-8")
+
+    def decode(self, data: bytes) -> Dict[str, Any]:
+        return json.loads(data.decode("utf-8"))
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{self.suffix}"
+
+    def _scan(self):
+        entries = []
+        for path in self.cache_dir.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, path.name, stat.st_size))
+        entries.sort()
+        self._sizes = OrderedDict((name, size) for _, name, size in entries)
+        self._total_size = sum(self._sizes.values())
+        self._scanned_at = time.time()
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key), "rb") as f:
+                return self.decode(f.read())
+        except (OSError, ValueError, EOFError):
+            return None
+
+    def _touch(self, key: str):
+        """更新访问时间，淘汰时按最近使用排序"""
+        path = self._path(key)
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        if path.name in self._sizes:
+            self._sizes.move_to_end(path.name)
+
+    def _write(self, key: str, entry: Dict[str, Any]) -> bool:
+        """原子写入条目，超出总大小时淘汰最久未使用的条目；调用方需持有 _io_lock"""
+        payload = self.encode(entry)
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log.print_log(f"写入{self.name}失败: {str(e)}", "warning")
+            return False
+
+        self._total_size += len(payload) - self._sizes.pop(path.name, 0)
+        self._sizes[path.name] = len(payload)
+        self.stats["stores"] += 1
+        self._evict()
+        return True
+
+    def _evict(self):
+        if time.time() - self._scanned_at > self.rescan_interval:
+            self._scan()
+        max_bytes = int(self.settings()["max_size_mb"] * 1024 * 1024)
+        while self._total_size > max_bytes and self._sizes:
+            name, size = self._sizes.popitem(last=False)
+            self._unlink(self.cache_dir / name)
+            self._total_size -= size
+            self.stats["evictions"] += 1
+
+    def _remove(self, key: str):
+        path = self._path(key)
+        self._total_size -= self._sizes.pop(path.name, 0)
+        self._unlink(path)
+
+    @staticmethod
+    def _unlink(path: Path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def clear(self):
+        """清空缓存"""
+        with self._io_lock:
+            for path in self.cache_dir.glob(f"*{self.suffix}"):
+                self._unlink(path)
+            self._sizes.clear()
+            self._total_size = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "entries": len(self._sizes),
+            "size_bytes": self._total_size,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+        }
@@ -0,0 +1,221 @@
+"""
+模板瘦身：在不改变渲染结果的前提下精简内联样式与 SVG 路径，降低模板在提示词中的 token 数。
+公众号会过滤 <style> 与 class，样式只能保留为内联，因此只在每个 style 属性内部去重和规范化
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+# 开始/结束标签，属性值中可能包含 >
+_TAG_RE = re.compile(r"<(/?)([a-zA-Z][\w:-]*)((?:[^>\"']|\"[^\"]*\"|'[^']*')*)>")
+# 逐个匹配属性，避免把其它属性值中的文本当作属性
+_ATTR_RE = re.compile(r"(\s+)([^\s=/>]+)(?:=(\"[^\"]*\"|'[^']*'|[^\s>]+))?")
+_NUMBER_RE = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_HEX_COLOR_RE = re.compile(r"#([0-9a-fA-F])\1([0-9a-fA-F])\2([0-9a-fA-F])\3\b")
+_ZERO_PX_RE = re.compile(r"(?<![\w.-])0px\b")
+# 相对单位的继承值按父元素计算，与子元素上相同的写法不等价
+_RELATIVE_UNIT_RE = re.compile(r"\d(?:%|em|ex|ch)\b")
+
+_VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+}  # fmt: skip
+_RAW_TEXT_TAGS = {"script", "style"}
+_SVG_NUMERIC_ATTRS = {("d", "path"), ("points", "polygon"), ("points", "polyline")}
+
+# 可继承且与父元素取值相同即可省略的属性
+_INHERITED_PROPERTIES = {
+    "color", "font-family", "line-height", "letter-spacing", "text-align", "word-spacing",
+}  # fmt: skip
+# 浏览器默认样式会覆盖上述属性的元素，其内部不省略任何声明
+_UA_STYLED_TAGS = {
+    "a", "button", "code", "input", "kbd", "pre", "samp", "select",
+    "table", "textarea", "th",
+}  # fmt: skip
+
+
+def _split_declarations(style: str) -> List[str]:
+    """按 ; 拆分声明，忽略引号和括号（如 url()、渐变）内的 ;"""
+    parts, depth, quote, start = [], 0, "", 0
+    for i, ch in enumerate(style):
+        if quote:
+            if ch == quote:
+                quote = ""
+        elif ch in "\"'":
+            quote = ch
+        elif ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth = max(0, depth - 1)
+        elif ch == ";" and depth == 0:
+            parts.append(style[start:i])
+            start = i + 1
+    parts.append(style[start:])
+    return [part.strip() for part in parts if part.strip()]
+
+
+def _normalize_value(value: str) -> str:
+    value = re.sub(r"\s+", " ", value).strip()
+    value = _ZERO_PX_RE.sub("0", value)
+    return _HEX_COLOR_RE.sub(lambda m: f"#{m.group(1)}{m.group(2)}{m.group(3)}", value)
+
+
+def parse_style(style: str) -> List[Tuple[str, str, bool]]:
+    """
+    解析内联样式为 (属性, 值, 是否 !important) 列表，同一属性只保留最终生效的声明：
+    后者覆盖前者，!important 优先；带浏览器前缀的值常作为兼容写法，不参与去重
+    """
+    declarations: List[Optional[Tuple[str, str, bool]]] = []
+    effective: Dict[str, int] = {}
+    for part in _split_declarations(style):
+        name, sep, value = part.partition(":")
+        name = name.strip().lower()
+        value = value.strip()
+        if not sep or not name or not value:
+            continue
+        important = bool(re.search(r"!\s*important\s*$", value, re.IGNORECASE))
+        if important:
+            value = re.sub(r"\s*!\s*important\s*$", "", value, flags=re.IGNORECASE)
+        declaration = (name, _normalize_value(value), important)
+
+        previous = effective.get(name)
+        if previous is not None:
+            _, previous_value, previous_important = declarations[previous]  # type: ignore
+            if value.startswith("-") or previous_value.startswith("-"):
+                declarations.append(declaration)
+                continue
+            if previous_important and not important:
+                continue
+            declarations[previous] = None
+
+        effective[name] = len(declarations)
+        declarations.append(declaration)
+    return [d for d in declarations if d is not None]
+
+
+def format_style(declarations: List[Tuple[str, str, bool]]) -> str:
+    return ";".join(
+        f"{name}:{value}{'!important' if important else ''}"
+        for name, value, important in declarations
+    )
+
+
+def _format_number(value: float, precision: int) -> str:
+    text = f"{round(value, precision):.{precision}f}"
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    if text in ("-0", ""):
+        text = "0"
+    # 省略整数部分的 0：0.5 -> .5
+    if text.startswith("0."):
+        text = text[1:]
+    elif text.startswith("-0."):
+        text = "-" + text[2:]
+    return text
+
+
+def round_path_numbers(data: str, precision: int = 1) -> str:
+    """降低 SVG 路径/坐标中数值的精度，必要时补充分隔符避免相邻数值粘连"""
+    # 圆弧指令的标志位可以紧凑书写（如 a1 1 0 01-1 1），按数值处理会改变含义
+    if re.search(r"[aA]", data):
+        return data
+
+    pieces = []
+    last_end = 0
+    previous = ""  # 上一个输出的数值（与当前数值之间无分隔时用于判断是否粘连）
+    for match in _NUMBER_RE.finditer(data):
+        gap = data[last_end : match.start()]
+        number = _format_number(float(match.group()), precision)
+        if not gap and previous:
+            glued = number[0].isdigit() or (
+                number.startswith(".") and "." not in previous and "e" not in previous.lower()
+            )
+            if glued:
+                gap = " "
+        pieces.append(gap)
+        pieces.append(number)
+        previous = number
+        last_end = match.end()
+    pieces.append(data[last_end:])
+    return "".join(pieces)
+
+
+def _slim_style(style: str, inherited: Dict[str, str]) -> Tuple[str, Dict[str, str]]:
+    """返回精简后的样式及该元素向子元素传递的继承样式"""
+    own = dict(inherited)
+    kept = []
+    for prop, value, important in parse_style(style):
+        if prop in _INHERITED_PROPERTIES:
+            if _RELATIVE_UNIT_RE.search(value):
+                own.pop(prop, None)
+            elif not important and inherited.get(prop) == value:
+                continue
+            else:
+                own[prop] = value
+        kept.append((prop, value, important))
+    return format_style(kept), own
+
+
+def slim_html(html: str, svg_precision: Optional[int] = 1) -> str:
+    """
+    精简 HTML：去除内联样式中被覆盖的重复声明和与父元素继承值相同的声明，
+    规范化样式写法（0px、#ffffff 等），并将 SVG 路径数值保留到 svg_precision 位小数（None 表示不处理）
+    """
+    stack: List[Tuple[str, Dict[str, str]]] = []
+    pieces = []
+    last_end = 0
+    raw_text_tag = ""
+
+    for match in _TAG_RE.finditer(html):
+        closing, tag, attrs = match.group(1), match.group(2), match.group(3)
+        name = tag.lower()
+        if raw_text_tag:
+            # script/style 内容原样保留
+            if closing and name == raw_text_tag:
+                raw_text_tag = ""
+            continue
+
+        pieces.append(html[last_end : match.start()])
+        last_end = match.end()
+
+        if closing:
+            # 弹出到匹配的开始标签，容忍未闭合的元素
+            for i in range(len(stack) - 1, -1, -1):
+                if stack[i][0] == name:
+                    del stack[i:]
+                    break
+            pieces.append(match.group())
+            continue
+
+        if name in _RAW_TEXT_TAGS:
+            raw_text_tag = name
+            last_end = match.start()
+            continue
+
+        # 浏览器默认样式会覆盖继承值的元素，其内部不省略继承声明
+        own = {} if name in _UA_STYLED_TAGS else (stack[-1][1] if stack else {})
+        attr_pieces = []
+        for attr in _ATTR_RE.finditer(attrs):
+            space, attr_name, quoted = attr.groups()
+            lowered = attr_name.lower()
+            if quoted and quoted[0] in "\"'" and lowered == "style":
+                value, own = _slim_style(quoted[1:-1], own)
+                if not value:
+                    continue
+                quoted = f"{quoted[0]}{value}{quoted[0]}"
+            elif (
+                quoted
+                and quoted[0] in "\"'"
+                and svg_precision is not None
+                and (lowered, name) in _SVG_NUMERIC_ATTRS
+            ):
+                quoted = f"{quoted[0]}{round_path_numbers(quoted[1:-1], svg_precision)}{quoted[0]}"
+            attr_pieces.append(f"{space}{attr_name}={quoted}" if quoted else attr.group())
+
+        self_closing = attrs.rstrip().endswith("/")
+        pieces.append(f"<{tag}{''.join(attr_pieces)}{'/' if self_closing else ''}>")
+        if name not in _VOID_TAGS and not self_closing:
+            stack.append((name, own))
+
+    pieces.append(html[last_end:])
+    return "".join(pieces)
@@ -428,6 +428,35 @@ def print_log(msg, msg_type="status"):
         print(utils.format_log_message(msg, msg_type))
 
 
+def print_stream(chunk, stage=""):
+    """
+    流式输出LLM生成的文本片段，消息类型为 stream，Web端据此逐步渲染正文
+
+    Args:
+        chunk: 文本片段
+        stage: 所属阶段（智能体名称），用于区分不同阶段的输出
+    """
+    ui_mode = _log_manager.get_ui_mode()
+    process_log_queue = _log_manager.get_process_log_queue()
+
+    if ui_mode and process_log_queue is not None:
+        try:
+            process_log_queue.put(
+                {"type": "stream", "message": chunk, "stage": stage, "timestamp": time.time()}
+            )
+        except Exception:
+            pass
+    elif ui_mode:
+        try:
+            comm.send_update("stream", chunk)
+        except Exception:
+            pass
+    else:
+        # 命令行模式：片段之间不换行
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
+
+
 def print_traceback(what, e):
     """统一错误追踪接口函数"""
     error_traceback = traceback.format_exc()
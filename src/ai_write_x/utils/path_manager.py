@@ -85,6 +85,13 @@ class PathManager:
         temp_dir.mkdir(parents=True, exist_ok=True)
         return temp_dir
 
+    @staticmethod
+    def get_data_dir():
+        """获取运行数据目录（任务队列、缓存等）"""
+        data_dir = PathManager.get_app_data_dir() / "data"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        return data_dir
+
     @staticmethod
     def get_config_path(file_name="config.yaml"):
         """获取配置文件的完整路径"""
@@ -0,0 +1,171 @@
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from src.ai_write_x.utils.topic_index import jaccard, normalize_title, shingles
+
+
+class HistoryWindow:
+    """
+    窗口期内已写话题的内存快照：签名只解码一次，并按 n-gram 建倒排索引，
+    一次选题中的多个候选标题只与共享 n-gram 的历史话题比较
+    """
+
+    def __init__(self, rows: Iterable, ngram: int = 2):
+        self.ngram = ngram
+        self._normalized: Set[str] = set()
+        self._signatures: List[Set[str]] = []
+        self._postings: Dict[str, List[int]] = {}
+        for normalized, signature in rows:
+            self._normalized.add(normalized)
+            grams = set(json.loads(signature))
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(len(self._signatures))
+            self._signatures.append(grams)
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def max_similarity(self, title: str) -> float:
+        """与快照中话题的最大相似度（字符 n-gram Jaccard），完全相同时为 1"""
+        normalized = normalize_title(title)
+        if not normalized:
+            return 0.0
+        if normalized in self._normalized:
+            return 1.0
+
+        target = shingles(title, self.ngram)
+        candidates = {i for gram in target for i in self._postings.get(gram, ())}
+        return max((jaccard(target, self._signatures[i]) for i in candidates), default=0.0)
+
+    def is_covered(self, title: str, threshold: float) -> bool:
+        return self.max_similarity(title) >= threshold
+
+
+class TopicHistory:
+    """
+    已写话题的持久化索引（SQLite），保存归一化标题和字符 n-gram 签名，
+    选题时据此跳过或降权近期已写过的话题
+    """
+
+    _instance = None
+    _lock = threading.Lock()
+
+    def __init__(self, db_path: str, ngram: int = 2):
+        self.db_path = db_path
+        self.ngram = ngram
+        self._write_lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS topics (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    title TEXT NOT NULL,
+                    normalized TEXT NOT NULL,
+                    signature TEXT NOT NULL,
+                    platform TEXT DEFAULT '',
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_topics_created ON topics(created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_topics_normalized ON topics(normalized)")
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    from src.ai_write_x.config.config import Config
+                    from src.ai_write_x.utils.path_manager import PathManager
+
+                    instance = cls(str(PathManager.get_data_dir() / "topic_history.db"))
+                    # 首次创建时导入已有文章，避免升级后重复写旧话题
+                    if instance.count() == 0:
+                        prefixes = [p["name"] for p in Config.get_instance().platforms]
+                        instance.import_article_dir(PathManager.get_article_dir(), prefixes)
+                    cls._instance = instance
+        return cls._instance
+
+    @contextmanager
+    def _connect(self):
+        """短连接，退出时提交并关闭，可在多线程和多进程中使用"""
+        conn = sqlite3.connect(self.db_path, timeout=5.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def record(self, title: str, platform: str = "", created_at: Optional[float] = None):
+        """记录一个已写话题"""
+        normalized = normalize_title(title)
+        if not normalized:
+            return
+        signature = json.dumps(sorted(shingles(title, self.ngram)), ensure_ascii=False)
+        with self._write_lock, self._connect() as conn:
+            conn.execute(
+                "INSERT INTO topics (title, normalized, signature, platform, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (title, normalized, signature, platform, created_at or time.time()),
+            )
+
+    def import_article_dir(self, article_dir: Path, prefixes: Iterable[str] = ()) -> int:
+        """
+        从文章目录导入历史话题，文件名形如 "平台_话题.html" 时去掉平台前缀，
+        以文件修改时间作为写作时间
+        """
+        count = 0
+        for path in Path(article_dir).glob("*.*"):
+            title = path.stem
+            for prefix in prefixes:
+                if title.startswith(f"{prefix}_"):
+                    title = title[len(prefix) + 1 :]
+                    break
+            try:
+                self.record(title, created_at=path.stat().st_mtime)
+                count += 1
+            except OSError:
+                continue
+        return count
+
+    def window(self, window_days: float) -> HistoryWindow:
+        """读取窗口期内的已写话题，一次选题只需查询一次"""
+        since = time.time() - window_days * 86400 if window_days > 0 else 0
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT normalized, signature FROM topics WHERE created_at >= ?", (since,)
+            ).fetchall()
+        return HistoryWindow(rows, self.ngram)
+
+    def max_similarity(self, title: str, window_days: float) -> float:
+        """与窗口期内已写话题的最大相似度，需比较多个标题时使用 window()"""
+        return self.window(window_days).max_similarity(title)
+
+    def is_covered(self, title: str, window_days: float, threshold: float) -> bool:
+        return self.max_similarity(title, window_days) >= threshold
+
+    def recent(self, limit: int = 50) -> List[Dict]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT title, platform, created_at FROM topics ORDER BY created_at DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return [{"title": t, "platform": p, "created_at": c} for t, p, c in rows]
+
+    def count(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM topics").fetchone()[0]
+
+    def prune(self, keep_days: float):
+        """删除超过保留天数的记录，keep_days 不大于 0 时不清理"""
+        if keep_days <= 0:
+            return
+        expire_before = time.time() - keep_days * 86400
+        with self._write_lock, self._connect() as conn:
+            conn.execute("DELETE FROM topics WHERE created_at < ?", (expire_before,))
@@ -0,0 +1,197 @@
+import math
+import random
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set
+
+_PUNCT_RE = re.compile(r"[\s\W_]+", re.UNICODE)
+_HEAT_RE = re.compile(r"([\d.]+)\s*(万|亿|w|k)?", re.IGNORECASE)
+_HEAT_UNITS = {"万": 1e4, "w": 1e4, "亿": 1e8, "k": 1e3}
+
+
+def normalize_title(title: str) -> str:
+    """去除空白和标点并转小写，用于相似度计算"""
+    return _PUNCT_RE.sub("", title).lower()
+
+
+def shingles(title: str, n: int = 2) -> Set[str]:
+    """字符 n-gram 集合，过短的标题整体作为一个元素"""
+    text = normalize_title(title)
+    if len(text) <= n:
+        return {text} if text else set()
+    return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def parse_heat(value) -> float:
+    """解析热度值，支持 123456、"12.3万"、"1.2亿" 等格式，无法解析时返回 0"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _HEAT_RE.search(str(value or ""))
+    if not match:
+        return 0.0
+    try:
+        number = float(match.group(1))
+    except ValueError:
+        return 0.0
+    unit = (match.group(2) or "").lower()
+    return number * _HEAT_UNITS.get(unit, 1)
+
+
+@dataclass
+class TopicCluster:
+    """一组跨平台的近似重复话题"""
+
+    title: str  # 代表标题（排名最靠前的一条）
+    platform: str  # 代表标题所属平台
+    best_rank: int
+    score: float = 0.0
+    platforms: Dict[str, int] = field(default_factory=dict)  # 平台 -> 最佳排名
+    titles: List[str] = field(default_factory=list)
+
+
+class TopicIndex:
+    """
+    跨平台话题索引：合并各平台热榜，按字符 n-gram Jaccard 相似度聚类近似重复标题，
+    并按跨平台排名与热度为每个话题簇打分
+    """
+
+    def __init__(self, threshold: float = 0.5, ngram: int = 2, heat_weight: float = 0.5):
+        self.threshold = threshold
+        self.ngram = ngram
+        self.heat_weight = heat_weight
+        self._entries: List[Dict] = []
+        self._clusters: Optional[List[TopicCluster]] = None
+
+    def add_platform(self, platform: str, items: List, weight: float = 1.0):
+        """
+        添加一个平台的热榜，items 为标题字符串或 {"name", "rank", "lastCount"} 字典，
+        未提供 rank 时按列表顺序计算；weight 为平台权重，作用于该平台贡献的得分
+        """
+        entries = []
+        for position, item in enumerate(items, 1):
+            if isinstance(item, str):
+                item = {"name": item}
+            title = (item.get("name") or "").strip()
+            if not title:
+                continue
+            entries.append(
+                {
+                    "platform": platform,
+                    "title": title,
+                    "rank": int(item.get("rank") or position),
+                    "heat": parse_heat(item.get("lastCount")),
+                    "weight": weight,
+                    "shingles": shingles(title, self.ngram),
+                }
+            )
+
+        # 热度按平台归一化，不同平台的热度量级不可直接比较
+        max_heat = max((e["heat"] for e in entries), default=0.0)
+        for entry in entries:
+            entry["heat"] = entry["heat"] / max_heat if max_heat > 0 else 0.0
+
+        self._entries.extend(entries)
+        self._clusters = None
+
+    def _cluster(self) -> List[List[int]]:
+        """
+        按 n-gram 倒排索引找出有共同片段的标题对，精确计算 Jaccard 后用并查集合并；
+        相似度大于 0 的标题必有共同片段，不会漏掉相似对，热榜规模下比较次数很少
+        """
+        parent = list(range(len(self._entries)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        postings: Dict[str, List[int]] = {}
+        for i, entry in enumerate(self._entries):
+            candidates = {j for gram in entry["shingles"] for j in postings.get(gram, ())}
+            for j in candidates:
+                if jaccard(entry["shingles"], self._entries[j]["shingles"]) >= self.threshold:
+                    parent[find(i)] = find(j)
+            for gram in entry["shingles"]:
+                postings.setdefault(gram, []).append(i)
+
+        groups: Dict[int, List[int]] = {}
+        for i in range(len(self._entries)):
+            groups.setdefault(find(i), []).append(i)
+        return list(groups.values())
+
+    def _score(self, members: List[Dict]) -> float:
+        """各平台取最佳排名，得分 = Σ 平台权重 × (1 + 热度权重 × 归一化热度) / √排名"""
+        best: Dict[str, Dict] = {}
+        for entry in members:
+            current = best.get(entry["platform"])
+            if current is None or entry["rank"] < current["rank"]:
+                best[entry["platform"]] = entry
+        return sum(
+            e["weight"] * (1 + self.heat_weight * e["heat"]) / math.sqrt(max(1, e["rank"]))
+            for e in best.values()
+        )
+
+    def build(self) -> List[TopicCluster]:
+        """聚类并打分，按得分从高到低返回"""
+        clusters = []
+        for group in self._cluster():
+            members = [self._entries[i] for i in group]
+            leader = min(members, key=lambda e: (e["rank"], -e["heat"]))
+            platforms: Dict[str, int] = {}
+            for entry in members:
+                platforms[entry["platform"]] = min(
+                    entry["rank"], platforms.get(entry["platform"], entry["rank"])
+                )
+            clusters.append(
+                TopicCluster(
+                    title=leader["title"],
+                    platform=leader["platform"],
+                    best_rank=leader["rank"],
+                    score=self._score(members),
+                    platforms=platforms,
+                    titles=list(dict.fromkeys(e["title"] for e in members)),
+                )
+            )
+
+        clusters.sort(key=lambda c: (-c.score, c.best_rank))
+        self._clusters = clusters
+        return clusters
+
+    @property
+    def clusters(self) -> List[TopicCluster]:
+        if self._clusters is None:
+            self.build()
+        return self._clusters  # type: ignore
+
+    def penalize(self, predicate: Callable[[TopicCluster], bool], factor: float):
+        """将满足条件的话题得分乘以 factor 并重新排序，factor 为 0 时直接移除"""
+        clusters = []
+        for cluster in self.clusters:
+            if predicate(cluster):
+                if factor <= 0:
+                    continue
+                cluster.score *= factor
+            clusters.append(cluster)
+        clusters.sort(key=lambda c: (-c.score, c.best_rank))
+        self._clusters = clusters
+
+    def top(self, k: int) -> List[TopicCluster]:
+        """得分最高的 k 个互不重复的话题"""
+        return self.clusters[:k]
+
+    def sample(
+        self, candidates: int = 10, exclude: Optional[Set[str]] = None
+    ) -> Optional[TopicCluster]:
+        """在得分最高的若干话题中按得分加权随机选择一个，exclude 中的标题不参与"""
+        exclude = exclude or set()
+        pool = [c for c in self.clusters if not exclude.intersection(c.titles)][:candidates]
+        if not pool:
+            return None
+        return random.choices(pool, weights=[c.score for c in pool], k=1)[0]
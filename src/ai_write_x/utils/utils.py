@@ -196,7 +196,8 @@ def download_and_save_image(image_url, local_image_folder):
 
 
 def compress_html(content, use_compress=True):
-    if use_compress:
+    """压缩 HTML（移除注释和多余空白），use_compress 为 False 时原样返回"""
+    if not use_compress:
         return content
 
     # 移除注释
@@ -6,7 +6,9 @@ from typing import List
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-from src.ai_write_x.crew_main import ai_write_x_main
+from src.ai_write_x.core.checkpoint import RunCheckpoint
+from src.ai_write_x.core.job_queue import JobKind
+from src.ai_write_x.tools.hotnews import get_source_stats
 from src.ai_write_x.utils import log
 from ..state import get_app_state
 
@@ -20,6 +22,18 @@ class ContentRequest(BaseModel):
     reference_ratio: float = 0.0
     custom_template_category: str = ""
     custom_template: str = ""
+    platforms: List[str] = []  # 多平台模式：同一篇内容适配到多个平台
+    priority: int = 0
+
+
+class BatchContentRequest(BaseModel):
+    topics: List[str] = []  # 为空时从热搜中选取前 top_k 个话题
+    top_k: int = 0
+    urls: List[str] = []
+    reference_ratio: float = 0.0
+    custom_template_category: str = ""
+    custom_template: str = ""
+    priority: int = 0
 
 
 class ContentResponse(BaseModel):
@@ -30,12 +44,9 @@ class ContentResponse(BaseModel):
 
 @router.post("/generate", response_model=ContentResponse)
 async def generate_content(request: ContentRequest):
-    """启动内容生成任务"""
+    """提交内容生成任务到队列"""
     app_state = get_app_state()
 
-    if app_state.is_running:
-        raise HTTPException(status_code=400, detail="任务正在运行中")
-
     try:
         # 准备配置数据
         config_data = {
@@ -44,66 +55,100 @@ async def generate_content(request: ContentRequest):
             "reference_ratio": request.reference_ratio,
             "custom_template_category": request.custom_template_category,
             "custom_template": request.custom_template,
+            "publish_platforms": request.platforms,
         }
 
-        # 启动AI写作任务
-        result = ai_write_x_main(config_data)
-        if result and result[0] and result[1]:
-            app_state.current_process, app_state.log_queue = result
-            app_state.is_running = True
+        job_id = app_state.job_queue.submit(
+            {"config_data": config_data}, kind=JobKind.SINGLE, priority=request.priority
+        )
 
-            # 启动进程
-            app_state.current_process.start()
+        return ContentResponse(status="success", message="任务已加入队列", task_id=job_id)
 
-            # 启动日志监控任务
-            from ..api.websocket import start_log_monitoring
+    except Exception as e:
+        log.print_log(f"启动错误: {str(e)}", "error")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/batch", response_model=ContentResponse)
+async def generate_batch_content(request: BatchContentRequest):
+    """提交批量内容生成任务到队列"""
+    app_state = get_app_state()
+
+    try:
+        config_data = {
+            "custom_topic": request.topics[0] if request.topics else "",
+            "urls": request.urls,
+            "reference_ratio": request.reference_ratio,
+            "custom_template_category": request.custom_template_category,
+            "custom_template": request.custom_template,
+        }
 
-            asyncio.create_task(start_log_monitoring())
+        job_id = app_state.job_queue.submit(
+            {"config_data": config_data, "topics": request.topics, "top_k": request.top_k},
+            kind=JobKind.BATCH,
+            priority=request.priority,
+        )
 
-            return ContentResponse(
-                status="success", message="任务启动成功", task_id=str(app_state.current_process.pid)
-            )
-        else:
-            raise HTTPException(status_code=500, detail="任务启动失败")
+        return ContentResponse(status="success", message="批量任务已加入队列", task_id=job_id)
 
     except Exception as e:
         log.print_log(f"启动错误: {str(e)}", "error")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.post("/stop")
-async def stop_generation():
-    """停止内容生成任务"""
-    app_state = get_app_state()
+@router.get("/checkpoints")
+async def list_checkpoints(status: str = ""):
+    """获取可恢复的执行检查点"""
+    return {"status": "success", "data": RunCheckpoint.list_runs(status or None)}
 
-    if not app_state.is_running or not app_state.current_process:
-        return {"status": "success", "message": "没有运行中的任务"}
+
+@router.post("/resume/{run_id}", response_model=ContentResponse)
+async def resume_content(run_id: str, priority: int = 0):
+    """从检查点恢复内容生成任务"""
+    app_state = get_app_state()
 
     try:
-        app_state.current_process.terminate()
-        app_state.current_process.join(timeout=5.0)
+        # 恢复时以检查点记录的话题、参考链接和模板为准
+        config_data = RunCheckpoint.load(run_id).task_config()
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
 
-        if app_state.current_process.is_alive():
-            app_state.current_process.kill()
+    job_id = app_state.job_queue.submit(
+        {"config_data": config_data, "run_id": run_id}, kind=JobKind.RESUME, priority=priority
+    )
+    return ContentResponse(status="success", message="恢复任务已加入队列", task_id=job_id)
 
-        app_state.is_running = False
-        app_state.current_process = None
-        app_state.log_queue = None
 
-        return {"status": "success", "message": "任务已停止"}
+@router.post("/stop")
+async def stop_generation():
+    """停止所有排队中和运行中的内容生成任务"""
+    app_state = get_app_state()
+
+    try:
+        cancelled = app_state.job_queue.cancel_all()
+        if not cancelled:
+            return {"status": "success", "message": "没有运行中的任务"}
+
+        return {"status": "success", "message": f"已停止 {cancelled} 个任务"}
 
     except Exception as e:
         log.print_log(f"停止任务时出错: {str(e)}", "error")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/hotnews/sources")
+async def get_hotnews_source_stats():
+    """获取各热搜来源的延迟与失败统计"""
+    return {"status": "success", "data": get_source_stats()}
+
+
 @router.get("/status")
 async def get_status():
     """获取任务状态"""
     app_state = get_app_state()
 
     return {
-        "is_running": app_state.is_running,
-        "process_id": app_state.current_process.pid if app_state.current_process else None,
+        "is_running": app_state.job_queue.has_active_jobs(),
+        "jobs": app_state.job_queue.get_stats(),
         "timestamp": asyncio.get_event_loop().time(),
     }
@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+
+from typing import Any, Dict, List
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+
+from src.ai_write_x.core.job_queue import JobKind
+from src.ai_write_x.utils import log
+from ..state import get_app_state
+
+router = APIRouter(prefix="/api/jobs", tags=["jobs"])
+
+
+class JobRequest(BaseModel):
+    kind: str = JobKind.SINGLE
+    config_data: Dict[str, Any] = {}
+    topics: List[str] = []  # 仅批量任务使用
+    top_k: int = 0  # 仅批量任务使用
+    priority: int = 0
+
+
+class ScheduleRequest(JobRequest):
+    cron: str  # 五段式 cron 表达式，如 "0 8 * * *"
+
+
+def _build_payload(request: JobRequest) -> Dict[str, Any]:
+    if request.kind not in (JobKind.SINGLE, JobKind.BATCH):
+        raise HTTPException(status_code=400, detail=f"不支持的任务类型: {request.kind}")
+
+    payload: Dict[str, Any] = {"config_data": request.config_data}
+    if request.kind == JobKind.BATCH:
+        payload.update({"topics": request.topics, "top_k": request.top_k})
+    return payload
+
+
+@router.post("/")
+async def submit_job(request: JobRequest):
+    """提交任务"""
+    job_queue = get_app_state().job_queue
+    job_id = job_queue.submit(_build_payload(request), kind=request.kind, priority=request.priority)
+    return {"status": "success", "job_id": job_id}
+
+
+@router.get("/")
+async def list_jobs(status: str = "", limit: int = 50):
+    """获取任务列表"""
+    job_queue = get_app_state().job_queue
+    return {
+        "status": "success",
+        "data": job_queue.list_jobs(status or None, limit),
+        "stats": job_queue.get_stats(),
+    }
+
+
+@router.get("/schedules")
+async def list_schedules():
+    """获取定时任务列表"""
+    return {"status": "success", "data": get_app_state().job_queue.list_schedules()}
+
+
+@router.post("/schedules")
+async def add_schedule(request: ScheduleRequest):
+    """添加定时任务"""
+    job_queue = get_app_state().job_queue
+    try:
+        schedule_id = job_queue.add_schedule(
+            request.cron, _build_payload(request), kind=request.kind, priority=request.priority
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    log.print_log(f"已添加定时任务：{request.cron}", "info")
+    return {"status": "success", "schedule_id": schedule_id}
+
+
+@router.post("/schedules/{schedule_id}/enable")
+async def enable_schedule(schedule_id: str, enabled: bool = True):
+    """启用或停用定时任务"""
+    if not get_app_state().job_queue.set_schedule_enabled(schedule_id, enabled):
+        raise HTTPException(status_code=404, detail="定时任务不存在")
+    return {"status": "success"}
+
+
+@router.delete("/schedules/{schedule_id}")
+async def remove_schedule(schedule_id: str):
+    """删除定时任务"""
+    if not get_app_state().job_queue.remove_schedule(schedule_id):
+        raise HTTPException(status_code=404, detail="定时任务不存在")
+    return {"status": "success"}
+
+
+@router.get("/{job_id}")
+async def get_job(job_id: str):
+    """获取任务状态和结果"""
+    job = get_app_state().job_queue.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="任务不存在")
+    return {"status": "success", "data": job}
+
+
+@router.delete("/{job_id}")
+async def cancel_job(job_id: str):
+    """取消任务"""
+    if not get_app_state().job_queue.cancel(job_id):
+        raise HTTPException(status_code=404, detail="任务不存在或已结束")
+    return {"status": "success", "message": "任务已取消"}
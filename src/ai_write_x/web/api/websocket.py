@@ -3,6 +3,7 @@
 
 import asyncio
 import json
+import queue
 import time
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 
@@ -36,17 +37,21 @@ async def websocket_logs(websocket: WebSocket):
             del app_state.active_connections[connection_id]
 
 
-async def broadcast_log(message: str, msg_type: str = "info"):
-    """广播日志消息到所有连接的WebSocket客户端"""
+async def broadcast_log(message: str, msg_type: str = "info", job_id: str = "", stage: str = ""):
+    """广播日志消息到所有连接的WebSocket客户端；stream 类型为正文片段，stage 标记所属阶段"""
     app_state = get_app_state()
 
     if not app_state.active_connections:
         return
 
     log_data = {"type": msg_type, "message": message, "timestamp": time.time()}
+    if job_id:
+        log_data["job_id"] = job_id
+    if stage:
+        log_data["stage"] = stage
 
     disconnected = []
-    for conn_id, websocket in app_state.active_connections.items():
+    for conn_id, websocket in list(app_state.active_connections.items()):
         try:
             await websocket.send_text(json.dumps(log_data))
         except Exception:
@@ -57,33 +62,30 @@ async def broadcast_log(message: str, msg_type: str = "info"):
         app_state.active_connections.pop(conn_id, None)
 
 
-async def start_log_monitoring():
-    """启动日志监控任务"""
+async def start_log_monitoring(stop_event: asyncio.Event):
+    """持续转发任务队列中各任务的日志，直到服务关闭"""
     app_state = get_app_state()
 
-    while app_state.is_running and app_state.log_queue:
+    while not stop_event.is_set():
         try:
             # 非阻塞获取日志消息
             try:
-                log_msg = app_state.log_queue.get_nowait()
-                message = log_msg.get("message", "")
-                msg_type = log_msg.get("type", "info")
-
-                await broadcast_log(message, msg_type)
-
-                # 检查任务完成
-                if msg_type == "internal" and "任务执行完成" in message:
-                    app_state.is_running = False
-                    app_state.current_process = None
-                    app_state.log_queue = None
-                    await broadcast_log("任务执行完成", "success")
-                    break
-
-            except Exception:
+                log_msg = app_state.job_queue.log_messages.get_nowait()
+            except queue.Empty:
                 # 队列为空，短暂等待
                 await asyncio.sleep(0.1)
                 continue
 
+            message = log_msg.get("message", "")
+            msg_type = log_msg.get("type", "info")
+            job_id = log_msg.get("job_id", "")
+
+            # 检查任务完成
+            if msg_type == "internal" and "任务执行完成" in message:
+                await broadcast_log("任务执行完成", "success", job_id)
+            else:
+                await broadcast_log(message, msg_type, job_id, log_msg.get("stage", ""))
+
         except Exception as e:
             await broadcast_log(f"日志监控错误: {str(e)}", "error")
-            break
+            await asyncio.sleep(1)
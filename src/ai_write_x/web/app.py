@@ -15,6 +15,9 @@ from fastapi.middleware.gzip import GZipMiddleware
 import uvicorn
 
 from src.ai_write_x.config.config import Config
+from src.ai_write_x.core.job_queue import JobQueue
+from src.ai_write_x.crew_main import start_worker_pool, shutdown_worker_pool
+from src.ai_write_x.tools.hotnews import HotNewsCache
 from src.ai_write_x.utils import log
 
 # 导入状态管理
@@ -27,6 +30,8 @@ from .api.websocket import router as websocket_router
 from .api.templates import router as templates_router
 from .api.articles import router as articles_router
 from .api.images import router as images_router
+from .api.jobs import router as jobs_router
+from .api.websocket import start_log_monitoring
 
 # 添加全局状态
 app_shutdown_event = asyncio.Event()
@@ -39,6 +44,18 @@ async def lifespan(app: FastAPI):
         app_state.config = Config.get_instance()
         if not app_state.config.load_config():
             log.print_log("配置加载失败，使用默认配置", "warning")
+
+        # 预先启动常驻工作进程，首个任务无需等待依赖导入
+        start_worker_pool()
+
+        # 后台刷新热搜快照，话题选择无需实时请求热搜站点
+        if HotNewsCache.is_enabled():
+            HotNewsCache.get_instance().start()
+
+        # 启动任务队列及日志转发
+        app_state.job_queue = JobQueue.get_instance()
+        app_state.job_queue.start()
+        asyncio.create_task(start_log_monitoring(app_shutdown_event))
     except Exception as e:
         log.print_log(f"Web服务启动失败: {str(e)}", "error")
 
@@ -47,6 +64,11 @@ async def lifespan(app: FastAPI):
     # 关闭时执行
     log.print_log("AIWriteX Web服务正在关闭", "info")
     app_shutdown_event.set()
+    if app_state.job_queue:
+        app_state.job_queue.stop()
+    shutdown_worker_pool()
+    if HotNewsCache._instance is not None:
+        HotNewsCache._instance.stop()
 
 
 # 创建FastAPI应用，使用lifespan
@@ -76,6 +98,7 @@ app.include_router(websocket_router)
 app.include_router(templates_router)
 app.include_router(articles_router)
 app.include_router(images_router)
+app.include_router(jobs_router)
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -7,9 +7,7 @@ from typing import Dict, Any
 class AppState:
     def __init__(self):
         self.active_connections: Dict[str, Any] = {}
-        self.current_process = None
-        self.log_queue = None
-        self.is_running = False
+        self.job_queue = None  # 持久化任务队列，服务启动时初始化
         self.config = None
 
 
@@ -3,6 +3,7 @@
 class AIWriteXApp {  
     constructor() {
         this.ws = null;
+        this.streamEntries = {};
         this.currentView = 'creative-workshop';
         this.isGenerating = false;
         this.creativeWorkshopInitialized = false;
@@ -293,6 +294,11 @@ class AIWriteXApp {
         const logPanel = document.getElementById('log-panel');
         if (!logPanel) return;
 
+        if (logData.type === 'stream') {
+            this.appendStreamChunk(logPanel, logData);
+            return;
+        }
+
         const emptyState = logPanel.querySelector('.log-empty');
         if (emptyState) {
             emptyState.remove();
@@ -321,6 +327,36 @@ class AIWriteXApp {
         }  
     }  
       
+    // 流式正文：同一任务同一阶段的片段追加到同一条日志中，逐步显示
+    appendStreamChunk(logPanel, logData) {
+        const key = `${logData.job_id || ''}:${logData.stage || ''}`;
+        let body = this.streamEntries[key];
+
+        if (!body || !body.isConnected) {
+            const emptyState = logPanel.querySelector('.log-empty');
+            if (emptyState) {
+                emptyState.remove();
+            }
+
+            const entry = document.createElement('div');
+            entry.className = 'log-entry stream';
+            const timestampValue = typeof logData.timestamp === 'number'
+                ? logData.timestamp
+                : Date.now() / 1000;
+            const timestamp = new Date(timestampValue * 1000).toLocaleTimeString();
+            entry.innerHTML = `
+                <span class="log-timestamp">[${timestamp}]</span>
+                <span class="log-message"></span>
+            `;
+            logPanel.appendChild(entry);
+            body = entry.querySelector('.log-message');
+            this.streamEntries[key] = body;
+        }
+
+        body.textContent += typeof logData.message === 'string' ? logData.message : '';
+        logPanel.scrollTop = logPanel.scrollHeight;
+    }
+
     escapeHtml(text) {
         const div = document.createElement('div');
         div.textContent = text;
@@ -0,0 +1,324 @@
+"""
+日期解析微基准：对比改写前逐次编译正则的实现与 utils.date_parser，
+校验两者结果一致并输出耗时
+
+用法：python tests/benchmark_date_parser.py [--repeat N]
+样本模拟提取与校验阶段：同一批字符串（元素文本、搜索结果日期、摘要片段）被反复解析
+"""
+
+import argparse
+import html
+import re
+import sys
+import os
+import time
+import unicodedata
+from datetime import datetime, timedelta
+
+from dateutil.relativedelta import relativedelta
+
+# 获取当前文件的绝对路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# 找到项目根目录
+project_root = os.path.dirname(current_dir)
+# 将根目录添加到 Python 搜索路径
+sys.path.append(project_root)
+
+from src.ai_write_x.utils import date_parser  # noqa 402
+
+# 2026-10-17 10:00:00（本地时间）
+REFERENCE_TS = datetime(2026, 10, 17, 10, 0, 0).timestamp()
+
+SAMPLES = [
+    "2025-06-03",
+    "2025-06-03 08:30",
+    "2025-06-03 08:30:15",
+    "2025/6/3",
+    "2025.06.03",
+    "2025年6月3日",
+    "2025年06月03日 10:20",
+    "发布时间: 2025-05-27 09:00",
+    "发表于：2025-05-27",
+    "Posted on: 05/27/2025",
+    "05/27/2025 10:00",
+    "6月3日",
+    "12-31",
+    "2月30日",
+    "13/45",
+    "3秒前",
+    "15分钟前",
+    "2 小时前",
+    "3天前",
+    "2周前",
+    "5个月前",
+    "1年前",
+    "刚刚",
+    "今天 08:00",
+    "昨天 21:13",
+    "前天",
+    "上周",
+    "上个月",
+    "去年",
+    "5 minutes ago",
+    "1 hour ago",
+    "3 days ago",
+    "2 weeks ago",
+    "yesterday",
+    "Just now",
+    "last month",
+    "this week",
+    "1717372800",
+    "1717372800000",
+    "9999999999999",
+    "2025-06-03T08:00:00+08:00",
+    "阅读 1.2万",
+    "作者：张三",
+    "来源：新华社",
+    "未知",
+    "None",
+    "",
+    "&nbsp;2025-06-03&nbsp;",
+    "第 3 页",
+    "共 12 条评论",
+    "大约 18 小时前 · 新浪财经",
+    "本文首发于2025年5月23日，转载请注明出处。",
+]
+
+
+def legacy_is_valid_date(date_str, timestamp=None):
+    """验证日期字符串是否可转换为有效日期"""
+    if not date_str or date_str in [None, "", "None", "未知"]:
+        return False
+
+    date_str = legacy_clean_date_text(str(date_str))
+
+    if timestamp is None:
+        timestamp = time.time()
+
+    date_patterns = [
+        # 完整日期时间（支持带空格的中文格式）
+        r"\d{4}\s*[-/年\.]?\s*\d{1,2}\s*[-/月\.]?\s*\d{1,2}\s*(?:日)?(?:\s+\d{1,2}:\d{1,2}(?::\d{1,2})?)?",  # noqa 501
+        r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:Z|[+-]\d{2}:\d{2})?",
+        r"\d{1,2}[-/]\d{1,2}[-/]\d{4}\s+\d{1,2}:\d{1,2}(?::\d{1,2})?",
+        # 完整日期
+        r"\d{4}\s*[-/年\.]?\s*\d{1,2}\s*[-/月\.]?\s*\d{1,2}\s*(?:日)?",
+        r"\d{1,2}[-/]\d{1,2}[-/]\d{4}",
+        # 相对时间
+        r"(\d+)\s*(秒|分钟|分|小时|个小时|天|日|周|星期|个月|月|年)前",
+        r"(刚刚|今天|昨天|前天|上周|上星期|上个月|上月|去年)",
+        # 不完整日期
+        r"\d{1,2}\s*[-/\.月]?\s*\d{1,2}\s*(?:日)?",
+        # Unix 时间戳
+        r"^\d{10}$",
+        r"^\d{13}$",
+        # 英文格式
+        r"\d+\s*(second|seconds|minute|minutes|hour|hours|day|days|week|weeks|month|months|year|years)\s*ago",  # noqa 501
+        r"(yesterday|today|just\s*now|last\s*(week|month|year)|this\s*(week|month|year))",
+    ]
+
+    for pattern in date_patterns:
+        if re.search(pattern, date_str, re.IGNORECASE):
+            return True
+
+    return False
+
+
+def legacy_calculate_actual_date(pub_time, timestamp):
+    """将发布日期转换为 datetime 对象"""
+    if not pub_time or not timestamp:
+        return None
+
+    try:
+        pub_time_cleaned = legacy_clean_date_text(str(pub_time))
+        reference_date = datetime.fromtimestamp(timestamp)
+
+        # 优先处理 Unix 时间戳 (修正后的位置)
+        if re.match(r"^\d{10}$", pub_time_cleaned):
+            return datetime.fromtimestamp(int(pub_time_cleaned))
+        if re.match(r"^\d{13}$", pub_time_cleaned):
+            return datetime.fromtimestamp(int(pub_time_cleaned) / 1000)
+
+        # 1. 相对时间
+        relative_patterns = [
+            (r"(\d+)\s*秒前", lambda n: reference_date - timedelta(seconds=n)),
+            (r"(\d+)\s*(分钟|分)前", lambda n: reference_date - timedelta(minutes=n)),
+            (r"(\d+)\s*(小时|个小时)前", lambda n: reference_date - timedelta(hours=n)),
+            (r"(\d+)\s*(天|日)前", lambda n: reference_date - timedelta(days=n)),
+            (r"(\d+)\s*(周|星期)前", lambda n: reference_date - timedelta(weeks=n)),
+            (r"(\d+)\s*(个月|月)前", lambda n: reference_date - relativedelta(months=n)),
+            (r"(\d+)\s*年前", lambda n: reference_date - relativedelta(years=n)),
+        ]
+
+        for pattern, calc_func in relative_patterns:
+            match = re.search(pattern, pub_time_cleaned, re.IGNORECASE)
+            if match:
+                num = int(match.group(1))
+                return calc_func(num)
+
+        # 2. 特殊相对时间
+        special_relative = {
+            "刚刚": reference_date,
+            "今天": reference_date.replace(hour=0, minute=0, second=0, microsecond=0),
+            "昨天": reference_date - timedelta(days=1),
+            "前天": reference_date - timedelta(days=2),
+            "上周": reference_date - timedelta(weeks=1),
+            "上星期": reference_date - timedelta(weeks=1),
+            "上个月": reference_date - relativedelta(months=1),
+            "上月": reference_date - relativedelta(months=1),
+            "去年": reference_date - relativedelta(years=1),
+        }
+
+        for key, calc_date in special_relative.items():
+            if key in pub_time_cleaned:
+                return calc_date
+
+        # 3. 英文相对时间
+        english_relative = [
+            (r"(\d+)\s*seconds?\s*ago", lambda n: reference_date - timedelta(seconds=n)),
+            (r"(\d+)\s*minutes?\s*ago", lambda n: reference_date - timedelta(minutes=n)),
+            (r"(\d+)\s*hours?\s*ago", lambda n: reference_date - timedelta(hours=n)),
+            (r"(\d+)\s*days?\s*ago", lambda n: reference_date - timedelta(days=n)),
+            (r"(\d+)\s*weeks?\s*ago", lambda n: reference_date - timedelta(weeks=n)),
+            (r"(\d+)\s*months?\s*ago", lambda n: reference_date - relativedelta(months=n)),
+            (r"(\d+)\s*years?\s*ago", lambda n: reference_date - relativedelta(years=n)),
+            (r"yesterday", lambda: reference_date - timedelta(days=1)),
+            (r"just\s*now", lambda: reference_date),
+            (r"last\s*week", lambda: reference_date - timedelta(weeks=1)),
+            (r"last\s*month", lambda: reference_date - relativedelta(months=1)),
+            (r"last\s*year", lambda: reference_date - relativedelta(years=1)),
+        ]
+
+        for pattern, calc_func in english_relative:
+            match = re.search(pattern, pub_time_cleaned, re.IGNORECASE)
+            if match:
+                if match.groups():
+                    num = int(match.group(1))
+                    return calc_func(num)
+                return calc_func()
+
+        # 4. 不完整日期
+        incomplete_patterns = [
+            r"(\d{1,2})\s*[-/\.月]?\s*(\d{1,2})\s*(?:日)?",
+        ]
+
+        for pattern in incomplete_patterns:
+            match = re.search(pattern, pub_time_cleaned)
+            if match:
+                month, day = map(int, match.groups())
+                if 1 <= month <= 12 and 1 <= day <= 31:
+                    current_year = reference_date.year
+                    try_date = reference_date.replace(year=current_year, month=month, day=day)
+                    if try_date > reference_date:
+                        try_date = try_date.replace(year=current_year - 1)
+                    # 验证日期合理性
+                    if abs((try_date - reference_date).days) > 365:
+                        try_date_alt = try_date.replace(
+                            year=current_year - 1 if try_date > reference_date else current_year + 1
+                        )
+                        if abs((try_date_alt - reference_date).days) < abs(
+                            (try_date - reference_date).days
+                        ):
+                            try_date = try_date_alt
+                    return try_date
+
+        # 5. 完整日期
+        complete_patterns = [
+            (r"(\d{4})\s*[-/年\.]?\s*\d{1,2}\s*[-/月\.]?\s*\d{1,2}\s*(?:日)?", "%Y-%m-%d"),
+            (r"(\d{1,2})[-/](\d{1,2})[-/](\d{4})", "%m/%d/%Y"),
+        ]
+
+        for pattern, date_format in complete_patterns:
+            match = re.search(pattern, pub_time_cleaned)
+            if match:
+                date_str = match.group(0)
+                return datetime.strptime(date_str, date_format)
+
+    except Exception:
+        return None
+
+    return None
+
+
+def legacy_clean_date_text(text):
+    """专为日期清理文本，保留日期格式关键字符"""
+    if not text:
+        return ""
+    try:
+        # 如果是纯数字字符串，直接返回，避免不必要的清理
+        if isinstance(text, (int, float)):
+            return str(text)
+        if isinstance(text, str) and text.isdigit():
+            return text
+
+        if isinstance(text, bytes):
+            text = text.decode("utf-8", errors="ignore")
+        text = html.unescape(text)
+        text = re.sub(
+            r"^(发表于|更新时间|发布时间|创建时间|Posted on|Published on|Date):\s*",
+            "",
+            text,
+            flags=re.IGNORECASE,
+        ).strip()
+        text = "".join(char for char in text if unicodedata.category(char)[0] != "C")
+        # 保留单个空格，避免破坏中文日期格式
+        text = re.sub(r"\s+", " ", text).strip()
+        return text
+    except Exception:
+        return ""
+
+
+def run_legacy(samples):
+    results = []
+    for text in samples:
+        cleaned = legacy_clean_date_text(text)
+        valid = legacy_is_valid_date(text)
+        parsed = legacy_calculate_actual_date(text, REFERENCE_TS)
+        results.append((cleaned, valid, parsed))
+    return results
+
+
+def run_new(samples):
+    results = []
+    for text in samples:
+        cleaned = date_parser.clean(text)
+        valid = date_parser.is_date_like(text)
+        parsed = date_parser.parse(text, REFERENCE_TS)
+        results.append((cleaned, valid, parsed))
+    return results
+
+
+def timed(func, samples, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = func(samples)
+    return results, (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="日期解析微基准")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    date_parser.cache_clear()
+    legacy_results, legacy_time = timed(run_legacy, SAMPLES, args.repeat)
+    new_results, new_time = timed(run_new, SAMPLES, args.repeat)
+
+    mismatches = [
+        (text, old, new)
+        for text, old, new in zip(SAMPLES, legacy_results, new_results)
+        if old != new
+    ]
+    for text, old, new in mismatches:
+        print(f"结果不一致: {text!r}: 旧={old!r} 新={new!r}")
+
+    print(f"样本数: {len(SAMPLES)}，重复 {args.repeat} 轮，不一致: {len(mismatches)}")
+    print(f"旧实现: {legacy_time * 1e6 / len(SAMPLES):.1f} us/条")
+    print(f"新实现: {new_time * 1e6 / len(SAMPLES):.1f} us/条")
+    if new_time:
+        print(f"加速比: {legacy_time / new_time:.2f}x")
+    print(f"缓存: {date_parser.cache_info()}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
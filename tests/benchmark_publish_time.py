@@ -0,0 +1,228 @@
+"""
+发布时间提取基准：对比逐个选择器的旧实现与一次遍历的新实现，
+校验两者结果一致并输出耗时
+
+用法：python tests/benchmark_publish_time.py [页面目录 ...] [--repeat N]
+未指定目录时使用 output/article 下保存的文章与内置的合成新闻页
+"""
+
+import argparse
+import re
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 获取当前文件的绝对路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# 找到项目根目录
+project_root = os.path.dirname(current_dir)
+# 将根目录添加到 Python 搜索路径
+sys.path.append(project_root)
+
+from bs4 import BeautifulSoup  # noqa 402
+
+from src.ai_write_x.tools.search_template import _extract_publish_time  # noqa 402
+
+# 旧实现依赖的日期辅助函数同样使用改写前的原样副本，避免新旧实现共用改写后的代码
+from benchmark_date_parser import (  # noqa 402
+    legacy_calculate_actual_date,
+    legacy_clean_date_text,
+    legacy_is_valid_date,
+)
+
+
+def legacy_extract_publish_time(page_soup):
+    """改写前的逐个选择器实现（原样副本，仅辅助函数改用 legacy_ 版本），作为结果一致性的基准"""
+    # Meta 标签提取 - 优先处理标准的发布时间标签
+    meta_selectors = [
+        "meta[property='article:published_time']",
+        "meta[property='sitemap:news:publication_date']",
+        "meta[itemprop='datePublished']",
+        "meta[name='publishdate']",
+        "meta[name='pubdate']",
+        "meta[name='original-publish-date']",
+        "meta[name='weibo:article:create_at']",
+        "meta[name='baidu_ssp:publishdate']",
+    ]
+
+    for selector in meta_selectors:
+        meta_tag = page_soup.select_one(selector)
+        if meta_tag:
+            datetime_str = meta_tag.get("content")
+            if datetime_str:
+                try:
+                    # 处理 UTC 时间 (以Z结尾)
+                    if datetime_str.endswith("Z"):
+                        dt = datetime.fromisoformat(datetime_str.replace("Z", "+00:00"))
+                        # 转换为东八区时间
+                        dt_local = dt + timedelta(hours=8)
+                        return dt_local.strftime("%Y-%m-%d")
+                    # 处理带时区的 ISO 8601 格式
+                    elif "T" in datetime_str and ("+" in datetime_str or "-" in datetime_str[-6:]):
+                        dt = datetime.fromisoformat(datetime_str)
+                        return dt.strftime("%Y-%m-%d")
+                    # 处理简单的日期格式
+                    elif "T" in datetime_str:
+                        return datetime_str.split("T")[0]
+                except Exception:
+                    pass
+
+    # Time 标签提取
+    time_tags = page_soup.select("time")
+    for time_tag in time_tags:
+        datetime_attr = time_tag.get("datetime")
+        if datetime_attr:
+            try:
+                # 处理 UTC 时间 (以Z结尾)
+                if datetime_attr.endswith("Z"):
+                    dt = datetime.fromisoformat(datetime_attr.replace("Z", "+00:00"))
+                    # 转换为东八区时间
+                    dt_local = dt + timedelta(hours=8)
+                    return dt_local.strftime("%Y-%m-%d")
+                # 处理带时区的 ISO 8601 格式
+                elif "T" in datetime_attr and ("+" in datetime_attr or "-" in datetime_attr[-6:]):
+                    dt = datetime.fromisoformat(datetime_attr)
+                    return dt.strftime("%Y-%m-%d")
+                # 处理简单的日期格式
+                elif "T" in datetime_attr:
+                    return datetime_attr.split("T")[0]
+            except Exception:
+                pass
+
+        # 如果 datetime 属性解析失败，尝试文本内容
+        text_content = legacy_clean_date_text(time_tag.get_text())
+        if text_content and legacy_is_valid_date(text_content):
+            time_date = legacy_calculate_actual_date(text_content, time.time())
+            if time_date:
+                return time_date.strftime("%Y-%m-%d")
+
+    # HTML 元素提取
+    date_selectors = [
+        "textarea.article-time",
+        "[class*='date']",
+        "[class*='time']",
+        "[class*='publish']",
+        "[class*='post-date']",
+        "[id*='date']",
+        "[id*='time']",
+        ".byline",
+        ".info",
+        ".article-meta",
+        ".source",
+        ".entry-date",
+        "div.date",
+        "p.date",
+        "p.time",
+    ]
+
+    for selector in date_selectors:
+        elements = page_soup.select(selector)
+        for elem in elements:
+            text = legacy_clean_date_text(elem.get_text())
+            if text and legacy_is_valid_date(text):
+                elem_date = legacy_calculate_actual_date(text, time.time())
+                if elem_date:
+                    return elem_date.strftime("%Y-%m-%d")
+
+    # 兜底：全文搜索
+    text = legacy_clean_date_text(page_soup.get_text())
+    for pattern in [
+        r"\d{4}\s*[-/年\.]?\s*\d{1,2}\s*[-/月\.]?\s*\d{1,2}\s*(?:日)?(?:\s+\d{1,2}:\d{1,2}(?::\d{1,2})?)?",  # noqa 501
+        r"\d{1,2}[-/]\d{1,2}[-/]\d{4}",
+        r"\d{1,2}\s*[月]\s*\d{1,2}\s*[日]?",
+        r"(?:\d+\s*(?:秒|分钟|分|小时|个小时|天|日|周|星期|个月|月|年)前|刚刚|今天|昨天|前天|上周|上星期|上个月|上月|去年)",
+        r"\d{4}年\d{1,2}月\d{1,2}日",
+    ]:
+        match = re.search(pattern, text, re.IGNORECASE)
+        if match:
+            pub_time = match.group(0)
+            if legacy_is_valid_date(pub_time):
+                pub_time_date = legacy_calculate_actual_date(pub_time, time.time())
+                if pub_time_date:
+                    return pub_time_date.strftime("%Y-%m-%d")
+
+    return ""
+
+
+def synthetic_pages():
+    """覆盖各候选来源的合成新闻页，每页带大量无关元素以模拟真实页面规模"""
+    filler = "".join(
+        f'<div class="item-{i} list"><p>第{i}段正文内容，与日期无关。</p>'
+        f'<span class="tag">标签{i}</span></div>'
+        for i in range(400)
+    )
+    heads = [
+        '<meta property="article:published_time" content="2025-06-03T08:00:00+08:00">',
+        '<meta name="pubdate" content="2025-06-03T23:30:00Z">',
+        '<meta itemprop="datePublished" content="2025-06-03">',
+        '<meta name="PubDate" content="2025-06-03T10:00:00">',
+        "",
+    ]
+    bodies = [
+        '<time datetime="2025-05-30T10:00:00Z">5月30日</time>',
+        "<time>2025年05月29日 10:20</time>",
+        '<textarea class="article-time">2025-05-28</textarea>',
+        '<div class="post-date-wrap">发布时间: 2025-05-27 09:00</div>',
+        '<span id="pubtime_baidu">2025/05/26</span>',
+        '<p class="byline">作者 张三 2025.05.25</p>',
+        '<div class="update-info">3小时前</div>',
+        '<span class="Date">2025-05-24</span>',
+        "<p>本文首发于2025年5月23日，转载请注明出处。</p>",
+        "",
+    ]
+    for h, head in enumerate(heads):
+        for b, body in enumerate(bodies):
+            html = f"<html><head>{head}</head><body>{filler}{body}{filler}</body></html>"
+            yield f"synthetic-{h}-{b}", html
+
+
+def load_corpus(dirs):
+    for directory in dirs:
+        for path in sorted(Path(directory).rglob("*.htm*")):
+            yield str(path), path.read_text(encoding="utf-8", errors="ignore")
+
+
+def timed(func, soups, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = [func(soup) for soup in soups]
+    return results, (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="发布时间提取基准")
+    parser.add_argument("dirs", nargs="*", help="保存的 HTML 页面目录")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    dirs = args.dirs or [os.path.join(project_root, "output", "article")]
+    pages = list(load_corpus(d for d in dirs if os.path.isdir(d)))
+    if not args.dirs:
+        pages.extend(synthetic_pages())
+
+    names = [name for name, _ in pages]
+    soups = [BeautifulSoup(html, "html.parser") for _, html in pages]
+
+    legacy_results, legacy_time = timed(legacy_extract_publish_time, soups, args.repeat)
+    new_results, new_time = timed(_extract_publish_time, soups, args.repeat)
+
+    mismatches = [
+        (name, old, new)
+        for name, old, new in zip(names, legacy_results, new_results)
+        if old != new
+    ]
+    for name, old, new in mismatches:
+        print(f"结果不一致: {name}: 旧={old!r} 新={new!r}")
+
+    print(f"页面数: {len(soups)}，不一致: {len(mismatches)}")
+    print(f"旧实现: {legacy_time * 1000:.1f} ms/轮")
+    print(f"新实现: {new_time * 1000:.1f} ms/轮")
+    if new_time:
+        print(f"加速比: {legacy_time / new_time:.2f}x")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
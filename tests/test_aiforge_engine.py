@@ -0,0 +1,74 @@
+import sys
+import os
+import threading
+import time
+
+# 获取当前文件的绝对路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# 找到项目根目录
+project_root = os.path.dirname(current_dir)
+# 将根目录添加到 Python 搜索路径
+sys.path.append(project_root)
+
+from src.ai_write_x.config.config import Config  # noqa 402
+from src.ai_write_x.tools import aiforge_engine  # noqa 402
+from src.ai_write_x.tools.aiforge_engine import AIForgeEngineManager  # noqa 402
+
+
+DELAY = 0.3
+
+
+class FakeEngine:
+    """记录并发调用的引擎：同一实例被并发使用时报错"""
+
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def __init__(self, config_file):
+        self.busy = False
+
+    def __call__(self, instruction):
+        assert not self.busy, "同一引擎被并发使用"
+        self.busy = True
+        with FakeEngine.lock:
+            FakeEngine.running += 1
+            FakeEngine.max_running = max(FakeEngine.max_running, FakeEngine.running)
+        time.sleep(DELAY)
+        with FakeEngine.lock:
+            FakeEngine.running -= 1
+        self.busy = False
+        return instruction
+
+
+def test_searches_run_concurrently_on_pooled_engines(tmp_path, monkeypatch):
+    config_file = tmp_path / "aiforge.toml"
+    config_file.write_text("a = 1", encoding="utf-8")
+    monkeypatch.setattr(Config.get_instance(), "config_aiforge_path", str(config_file))
+    monkeypatch.setattr(aiforge_engine, "AIForgeEngine", FakeEngine)
+    manager = AIForgeEngineManager()
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda i=i: results.append(manager.run(str(i))))
+        for i in range(3)
+    ]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == ["0", "1", "2"]
+    assert FakeEngine.max_running == 3
+    assert time.monotonic() - start < DELAY * 2
+    assert manager.get_stats() == {"builds": 3, "reuses": 0, "idle": 3, "in_use": 0}
+
+    # 配置未变化时复用空闲引擎
+    manager.run("again")
+    assert manager.get_stats()["reuses"] == 1
+
+    # 配置内容变化后丢弃旧引擎
+    config_file.write_text("a = 22", encoding="utf-8")
+    manager.run("changed")
+    assert manager.get_stats() == {"builds": 4, "reuses": 1, "idle": 1, "in_use": 0}
@@ -0,0 +1,215 @@
+import sys
+import os
+import asyncio
+import time
+
+# 获取当前文件的绝对路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# 找到项目根目录
+project_root = os.path.dirname(current_dir)
+# 将根目录添加到 Python 搜索路径
+sys.path.append(project_root)
+
+import pytest  # noqa 402
+
+from src.ai_write_x.adapters.platform_adapters import ZhihuAdapter  # noqa 402
+from src.ai_write_x.config.config import Config  # noqa 402
+from src.ai_write_x.core import batch_runner  # noqa 402
+from src.ai_write_x.core.base_framework import ContentResult  # noqa 402
+from src.ai_write_x.core.batch_runner import BatchContentRunner, BatchTask  # noqa 402
+from src.ai_write_x.core.checkpoint import RunCheckpoint  # noqa 402
+from src.ai_write_x.core.unified_workflow import UnifiedContentWorkflow  # noqa 402
+
+
+def _load_config(monkeypatch, tmp_path):
+    config = Config.get_instance()
+    config.load_config()
+    monkeypatch.setitem(config.config, "checkpoint", {**config.checkpoint_config, "enabled": True})
+    monkeypatch.setattr(RunCheckpoint, "get_base_dir", staticmethod(lambda: tmp_path))
+    return config
+
+
+def _stub_workflow(monkeypatch, calls, fail_transform=False):
+    workflow = UnifiedContentWorkflow()
+
+    async def base(topic, **kwargs):
+        calls.append("base_content")
+        return ContentResult(title=topic, content="正文", summary="", content_format="markdown")
+
+    def creative(content, **kwargs):
+        calls.append("final_content")
+        return content
+
+    async def transform(content, publish_platform, **kwargs):
+        calls.append("transform_content")
+        if fail_transform:
+            raise RuntimeError("转换失败")
+        return content
+
+    def save(content, title):
+        calls.append("save_result")
+        return {"success": True}
+
+    monkeypatch.setattr(workflow, "_generate_base_content_async", base)
+    monkeypatch.setattr(workflow, "_apply_dimensional_creative_transformation", creative)
+    monkeypatch.setattr(workflow, "_transform_content_async", transform)
+    monkeypatch.setattr(workflow, "_save_content", save)
+    monkeypatch.setattr(workflow, "_should_publish", lambda: False)
+    monkeypatch.setattr(
+        workflow, "_record_topic", lambda topic, platform="": calls.append("record_topic")
+    )
+    return workflow
+
+
+def test_execute_async_resumes_from_checkpoint(tmp_path, monkeypatch):
+    _load_config(monkeypatch, tmp_path)
+    calls = []
+    workflow = _stub_workflow(monkeypatch, calls, fail_transform=True)
+    with pytest.raises(RuntimeError):
+        asyncio.run(workflow.execute_async("话题"))
+
+    (run,) = RunCheckpoint.list_runs(status="failed")
+    assert run["next_stage"] == "transform_content"
+
+    calls.clear()
+    workflow = _stub_workflow(monkeypatch, calls)
+    result = asyncio.run(workflow.execute_async("话题", run_id=run["run_id"]))
+
+    assert result["success"] and result["run_id"] == run["run_id"]
+    # 已完成的阶段直接使用检查点结果
+    assert calls == ["transform_content", "save_result", "record_topic"]
+
+
+def test_resume_after_save_does_not_record_topic_again(tmp_path, monkeypatch):
+    config = _load_config(monkeypatch, tmp_path)
+    monkeypatch.setattr(config, "custom_topic", "话题")
+    monkeypatch.setattr(config, "custom_template_category", "科技")
+    monkeypatch.setattr(config, "custom_template", "极简")
+
+    calls = []
+    workflow = _stub_workflow(monkeypatch, calls)
+    monkeypatch.setattr(workflow, "_should_publish", lambda: True)
+    monkeypatch.setattr(
+        workflow, "_publish_content", lambda *args, **kwargs: {"success": False, "message": "失败"}
+    )
+    asyncio.run(workflow.execute_async("话题", urls=["https://example.com"]))
+
+    (run,) = RunCheckpoint.list_runs(status="failed")
+    assert run["next_stage"] == "publish_result"
+    assert RunCheckpoint.load(run["run_id"]).task_config() == {
+        "custom_topic": "话题",
+        "urls": ["https://example.com"],
+        "reference_ratio": 0.0,
+        "custom_template_category": "科技",
+        "custom_template": "极简",
+    }
+
+    calls.clear()
+    monkeypatch.setattr(
+        workflow, "_publish_content", lambda *args, **kwargs: {"success": True, "message": "成功"}
+    )
+    result = asyncio.run(workflow.execute_async("话题", run_id=run["run_id"]))
+
+    assert result["publish_result"]["success"]
+    # 文章已在首次执行时保存并记录话题，恢复发布时不再重复记录
+    assert calls == []
+
+
+class FakeWorkflow:
+    running = 0
+    max_running = 0
+
+    async def execute_async(self, topic, **kwargs):
+        FakeWorkflow.running += 1
+        FakeWorkflow.max_running = max(FakeWorkflow.max_running, FakeWorkflow.running)
+        await asyncio.sleep(0.2)
+        FakeWorkflow.running -= 1
+        if topic == "失败":
+            raise RuntimeError("生成失败")
+        return {"topic": topic}
+
+
+def test_batch_runner_runs_topics_on_one_event_loop(tmp_path, monkeypatch):
+    _load_config(monkeypatch, tmp_path)
+    monkeypatch.setattr(batch_runner, "setup_aiwritex", FakeWorkflow)
+    monkeypatch.setattr(FakeWorkflow, "max_running", 0)
+    runner = BatchContentRunner(max_workers=4, default_provider_limit=2)
+
+    start = time.monotonic()
+    results = runner.run([BatchTask(topic=t) for t in ("a", "失败", "c", "d")])
+
+    assert [r.topic for r in results] == ["a", "失败", "c", "d"]
+    assert [r.success for r in results] == [True, False, True, True]
+    # 当前提供商最多同时执行两个话题
+    assert FakeWorkflow.max_running == 2
+    assert time.monotonic() - start < 0.2 * 3
+
+
+def test_batch_runner_applies_configured_provider_limit(tmp_path, monkeypatch):
+    config = _load_config(monkeypatch, tmp_path)
+    monkeypatch.setattr(batch_runner, "setup_aiwritex", FakeWorkflow)
+    monkeypatch.setattr(FakeWorkflow, "max_running", 0)
+    runner = BatchContentRunner(max_workers=4, provider_limits={config.api_type: 1})
+
+    assert runner.get_concurrency(3) == 1
+    runner.run([BatchTask(topic=t) for t in ("a", "b")])
+    assert FakeWorkflow.max_running == 1
+
+
+def test_multi_platform_publishes_formatted_content(tmp_path, monkeypatch):
+    _load_config(monkeypatch, tmp_path)
+    calls = []
+    workflow = _stub_workflow(monkeypatch, calls)
+    published, saved = {}, {}
+    monkeypatch.setattr(
+        workflow,
+        "_generate_base_content",
+        lambda topic, **kwargs: ContentResult(
+            title=topic, content="第一段\n\n第二段", summary="摘要", content_format="markdown"
+        ),
+    )
+    monkeypatch.setattr(workflow, "_transform_content", lambda content, p, **kwargs: content)
+    monkeypatch.setattr(workflow, "_should_publish", lambda: True)
+
+    def save(content, title, article_format=None):
+        saved[title] = content
+        return {"success": True}
+
+    def publish(content, publish_platform, **kwargs):
+        published[publish_platform] = content
+        return {"success": True, "message": "成功"}
+
+    monkeypatch.setattr(workflow, "_save_content", save)
+    monkeypatch.setattr(workflow, "_publish_content", publish)
+
+    result = workflow.execute_multi_platform("话题", ["zhihu", "douban"])
+
+    for platform in ("zhihu", "douban"):
+        formatted = result["platforms"][platform]["formatted_content"]
+        assert formatted != "第一段\n\n第二段"
+        # 保存和发布的都是该平台适配器格式化后的内容
+        assert published[platform].content == formatted
+        assert saved[f"话题_{platform}"].content == formatted
+
+
+def test_template_formatting_uses_publish_platform(tmp_path, monkeypatch):
+    config = _load_config(monkeypatch, tmp_path)
+    monkeypatch.setattr(type(config), "article_format", property(lambda self: "HTML"))
+    monkeypatch.setattr(type(config), "use_template", property(lambda self: True))
+
+    class TemplateAdapter(ZhihuAdapter):
+        def supports_html(self):
+            return True
+
+        def supports_template(self):
+            return True
+
+    workflow = UnifiedContentWorkflow()
+    workflow.platform_adapters["zhihu"] = TemplateAdapter()
+    content = ContentResult(title="标题", content="正文", summary="", content_format="markdown")
+
+    wechat_engine, _ = workflow._prepare_transform(content, "wechat")
+    zhihu_engine, _ = workflow._prepare_transform(content, "zhihu")
+
+    assert "微信公众号" in wechat_engine.config.agents[0].backstory
+    assert "微信公众号" not in zhihu_engine.config.agents[0].backstory
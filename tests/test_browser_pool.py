@@ -0,0 +1,72 @@
+import sys
+import os
+
+# 获取当前文件的绝对路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# 找到项目根目录
+project_root = os.path.dirname(current_dir)
+# 将根目录添加到 Python 搜索路径
+sys.path.append(project_root)
+
+from src.ai_write_x.tools.browser_pool import BrowserPool  # noqa 402
+
+
+class FakeSwitch:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current_window_handle = handle
+
+
+class FakeDriver:
+    """只记录标签页与地址的 WebDriver 替身"""
+
+    def __init__(self, handles):
+        self.window_handles = list(handles)
+        self.current_window_handle = handles[0]
+        self.urls = {handle: "https://example.com/old" for handle in handles}
+        self.switch_to = FakeSwitch(self)
+        self.quit_called = False
+
+    def get(self, url):
+        self.urls[self.current_window_handle] = url
+
+    def execute_script(self, script, *args):
+        return None
+
+    def close(self):
+        self.window_handles.remove(self.current_window_handle)
+
+    def quit(self):
+        self.quit_called = True
+
+
+def _pool(driver):
+    pool = BrowserPool()
+    pool._driver = driver
+    pool._idle_tabs = []
+    return pool
+
+
+def test_discard_closes_extra_tab():
+    driver = FakeDriver(["a", "b"])
+    pool = _pool(driver)
+
+    pool._discard_tab("b")
+
+    assert driver.window_handles == ["a"]
+    assert pool._idle_tabs == []
+
+
+def test_discard_last_tab_resets_it_for_reuse():
+    driver = FakeDriver(["a"])
+    pool = _pool(driver)
+
+    pool._discard_tab("a")
+
+    # 最后一个标签页不能关闭，回到空白页后放回空闲列表
+    assert driver.window_handles == ["a"]
+    assert driver.urls["a"] == "about:blank"
+    assert pool._idle_tabs == ["a"]
+    assert not driver.quit_called
@@ -0,0 +1,48 @@
+import sys
+import os
+from datetime import datetime
+
+# 获取当前文件的绝对路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# 找到项目根目录
+project_root = os.path.dirname(current_dir)
+# 将根目录添加到 Python 搜索路径
+sys.path.append(project_root)
+
+from src.ai_write_x.utils.cron import CronExpression  # noqa 402
+
+
+# 2026-10-17 是周六
+BASE = datetime(2026, 10, 17, 10, 7, 30)
+
+
+def test_step_minutes():
+    assert CronExpression("*/15 * * * *").next_after(BASE) == datetime(2026, 10, 17, 10, 15)
+
+
+def test_weekday_range_skips_weekend():
+    assert CronExpression("0 9 * * 1-5").next_after(BASE) == datetime(2026, 10, 19, 9, 0)
+
+
+def test_sunday_as_seven():
+    expected = datetime(2026, 10, 18, 12, 0)
+    assert CronExpression("0 12 * * 7").next_after(BASE) == expected
+    assert CronExpression("0 12 * * 0").next_after(BASE) == expected
+
+
+def test_day_or_weekday_semantics():
+    # 日和周同时限定时任一匹配即可
+    assert CronExpression("5 4 13 * 5").next_after(BASE) == datetime(2026, 10, 23, 4, 5)
+
+
+def test_leap_day():
+    assert CronExpression("0 0 29 2 *").next_after(BASE) == datetime(2028, 2, 29, 0, 0)
+
+
+def test_invalid_expression():
+    for expression in ["* * * *", "60 * * * *", "*/0 * * * *"]:
+        try:
+            CronExpression(expression)
+        except ValueError:
+            continue
+        raise AssertionError(f"未拒绝无效表达式: {expression}")
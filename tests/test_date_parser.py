@@ -0,0 +1,64 @@
+import sys
+import os
+from datetime import datetime
+
+# 获取当前文件的绝对路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# 找到项目根目录
+project_root = os.path.dirname(current_dir)
+# 将根目录添加到 Python 搜索路径
+sys.path.append(project_root)
+
+from src.ai_write_x.utils import date_parser  # noqa 402
+
+
+# 2026-10-17 10:00:00（本地时间）
+REFERENCE_TS = datetime(2026, 10, 17, 10, 0, 0).timestamp()
+
+
+def test_clean_strips_prefix_and_entities():
+    assert date_parser.clean("发布时间: 2025-05-27&nbsp; 09:00") == "2025-05-27 09:00"
+    assert date_parser.clean(b"Date: 2025-06-03") == "2025-06-03"
+    assert date_parser.clean(1717372800) == "1717372800"
+    assert date_parser.clean("") == ""
+
+
+def test_is_date_like():
+    assert date_parser.is_date_like("2025年6月3日")
+    assert date_parser.is_date_like("3 days ago")
+    assert date_parser.is_date_like("昨天 21:13")
+    assert not date_parser.is_date_like("作者：张三")
+    assert not date_parser.is_date_like("未知")
+
+
+def test_parse_absolute_dates():
+    assert date_parser.parse("2025-06-03", REFERENCE_TS) == datetime(2025, 6, 3)
+    assert date_parser.parse("1717372800", REFERENCE_TS) == datetime.fromtimestamp(1717372800)
+
+
+def test_parse_relative_to_reference():
+    assert date_parser.parse("3天前", REFERENCE_TS) == datetime(2026, 10, 14, 10, 0, 0)
+    assert date_parser.parse("2 hours ago", REFERENCE_TS) == datetime(2026, 10, 17, 8, 0, 0)
+    assert date_parser.parse("上个月", REFERENCE_TS) == datetime(2026, 9, 17, 10, 0, 0)
+    assert date_parser.parse("今天 08:00", REFERENCE_TS) == datetime(2026, 10, 17)
+
+    # 相对时间的归类结果被缓存，参考时间不同时仍按各自的参考时间换算
+    other_ts = datetime(2026, 1, 1, 10, 0, 0).timestamp()
+    assert date_parser.parse("3天前", other_ts) == datetime(2025, 12, 29, 10, 0, 0)
+
+
+def test_parse_month_day_picks_most_recent_year():
+    assert date_parser.parse("6月3日", REFERENCE_TS) == datetime(2026, 6, 3, 10, 0, 0)
+    assert date_parser.parse("12月31日", REFERENCE_TS) == datetime(2025, 12, 31, 10, 0, 0)
+
+
+def test_parse_invalid():
+    assert date_parser.parse("2月30日", REFERENCE_TS) is None
+    assert date_parser.parse("第一页", REFERENCE_TS) is None
+    assert date_parser.parse("2025-06-03", 0) is None
+
+
+def test_search_uses_pattern_priority():
+    text = "更新于3小时前，原文发表于2025-06-01"
+    found = date_parser.search(text, REFERENCE_TS, date_parser.PAGE_TEXT_PATTERNS)
+    assert found == datetime(2025, 6, 1)
@@ -0,0 +1,62 @@
+import sys
+import os
+
+# 获取当前文件的绝对路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# 找到项目根目录
+project_root = os.path.dirname(current_dir)
+# 将根目录添加到 Python 搜索路径
+sys.path.append(project_root)
+
+from src.ai_write_x.utils.html_slim import parse_style, round_path_numbers, slim_html  # noqa 402
+
+
+def test_parse_style_keeps_effective_declarations():
+    style = "color: #FFFFFF; margin: 0px; color: red; padding: 0 !important; padding: 4px"
+    assert parse_style(style) == [
+        ("margin", "0", False),
+        ("color", "red", False),
+        ("padding", "0", True),
+    ]
+    # 带浏览器前缀的兼容写法全部保留
+    assert len(parse_style("display:-webkit-box;display:flex")) == 2
+
+
+def test_round_path_numbers():
+    assert round_path_numbers("M12 2C6.48 2 2 6.48 2 12", 1) == "M12 2C6.5 2 2 6.5 2 12"
+    # 相邻数值依靠小数点分隔时补充空格
+    assert round_path_numbers("M1.5.5L0.25-.75", 0) == "M2 0L0-1"
+    assert round_path_numbers("M0.123.456", 2) == "M.12.46"
+    # 圆弧标志位可能紧凑书写，不做处理
+    assert round_path_numbers("M1 1a1 1 0 01-1 1", 0) == "M1 1a1 1 0 01-1 1"
+
+
+def test_slim_html_drops_inherited_declarations():
+    html = (
+        '<section style="color:#333;line-height:1.6;">'
+        '<p style="color:#333;line-height:1.6;font-size:15px;">正文</p>'
+        '<p style="color:#333333;">同色</p>'
+        '<a href="#" style="color:#333;">链接</a>'
+        '<div style="line-height:1.6em;"><p style="line-height:1.6em;">相对单位</p></div>'
+        "</section>"
+    )
+    assert slim_html(html) == (
+        '<section style="color:#333;line-height:1.6">'
+        '<p style="font-size:15px">正文</p>'
+        "<p>同色</p>"
+        '<a href="#" style="color:#333">链接</a>'
+        '<div style="line-height:1.6em"><p style="line-height:1.6em">相对单位</p></div>'
+        "</section>"
+    )
+
+
+def test_slim_html_svg_and_raw_text():
+    html = (
+        '<svg viewBox="0 0 24 24"><path d="M12.345 2.5L6.75 8"/></svg>'
+        '<style>p{color:#333;}</style><p title="a style=x">t</p>'
+    )
+    assert slim_html(html) == (
+        '<svg viewBox="0 0 24 24"><path d="M12.3 2.5L6.8 8"/></svg>'
+        '<style>p{color:#333;}</style><p title="a style=x">t</p>'
+    )
+    assert '<path d="M12.345 2.5L6.75 8"/>' in slim_html(html, svg_precision=None)
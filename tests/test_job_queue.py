@@ -0,0 +1,130 @@
+import sys
+import os
+import queue
+import threading
+
+# 获取当前文件的绝对路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# 找到项目根目录
+project_root = os.path.dirname(current_dir)
+# 将根目录添加到 Python 搜索路径
+sys.path.append(project_root)
+
+from src.ai_write_x import crew_main  # noqa 402
+from src.ai_write_x.config.config import Config  # noqa 402
+from src.ai_write_x.core.job_queue import Job, JobQueue  # noqa 402
+
+
+class FakeProcess:
+    def __init__(self):
+        self.started = False
+        self.terminated = False
+
+    def start(self):
+        self.started = True
+
+    def is_alive(self):
+        return self.started and not self.terminated
+
+    def terminate(self):
+        self.terminated = True
+
+    def join(self, timeout=None):
+        pass
+
+
+class BlockingProcess(FakeProcess):
+    """模拟进程池繁忙：start() 一直阻塞到有空闲工作进程"""
+
+    def __init__(self, released):
+        super().__init__()
+        self.released = released
+        self.waiting = threading.Event()
+
+    def start(self):
+        self.waiting.set()
+        self.released.wait(timeout=5)
+        super().start()
+
+
+def _make_queue(tmp_path, monkeypatch):
+    launched = []
+
+    def fake_create_task_process(inputs, config_data):
+        launched.append((inputs, dict(config_data)))
+        return FakeProcess(), queue.Queue()
+
+    def fail_in_process(inputs):
+        raise AssertionError("任务不应在队列线程中同步执行")
+
+    monkeypatch.setattr(crew_main, "_create_task_process", fake_create_task_process)
+    monkeypatch.setattr(crew_main, "run", fail_in_process)
+    monkeypatch.setattr(crew_main, "run_batch", fail_in_process)
+    monkeypatch.setattr(
+        crew_main.hotnews,
+        "select_indexed_topic",
+        lambda platforms, top_n: {"platform": "微博", "topic": "热搜话题"},
+    )
+    monkeypatch.setattr(crew_main.hotnews, "select_platform_topic", lambda p, top_n: "热搜话题")
+
+    # 任务启动时会重新加载配置并写入 LLM 相关环境变量
+    monkeypatch.setattr(Config, "api_key", property(lambda self: "test-key"))
+    monkeypatch.setattr(os, "environ", dict(os.environ))
+    Config.get_instance().load_config()
+    return JobQueue(db_path=str(tmp_path / "jobs.db")), launched
+
+
+def test_job_without_config_data_runs_in_subprocess(tmp_path, monkeypatch):
+    job_queue, launched = _make_queue(tmp_path, monkeypatch)
+    job_id = job_queue.submit({"config_data": {}})
+
+    process, _ = job_queue._start_process(Job.get(Job.job_id == job_id))
+
+    assert isinstance(process, FakeProcess) and process.started
+    assert launched[0][0]["topic"] == "热搜话题"
+
+
+def test_job_does_not_inherit_previous_custom_topic(tmp_path, monkeypatch):
+    job_queue, launched = _make_queue(tmp_path, monkeypatch)
+    first = job_queue.submit(
+        {"config_data": {"custom_topic": "自定义话题", "publish_platforms": ["zhihu"]}}
+    )
+    second = job_queue.submit({"config_data": {}})
+
+    job_queue._start_process(Job.get(Job.job_id == first))
+    job_queue._start_process(Job.get(Job.job_id == second))
+
+    assert launched[0][0]["topic"] == "自定义话题"
+    assert launched[1][0]["topic"] == "热搜话题"
+    assert launched[1][1]["custom_topic"] == ""
+    assert Config.get_instance().publish_platforms == []
+
+
+def test_blocked_start_does_not_hold_launch_lock(tmp_path, monkeypatch):
+    job_queue, launched = _make_queue(tmp_path, monkeypatch)
+    released = threading.Event()
+    blocking = BlockingProcess(released)
+    processes = iter([blocking, FakeProcess()])
+    monkeypatch.setattr(
+        crew_main,
+        "_create_task_process",
+        lambda inputs, config_data: (next(processes), queue.Queue()),
+    )
+    first = job_queue.submit({"config_data": {}})
+    second = job_queue.submit({"config_data": {}})
+
+    thread = threading.Thread(
+        target=job_queue._start_process, args=(Job.get(Job.job_id == first),)
+    )
+    thread.start()
+    assert blocking.waiting.wait(timeout=5)
+
+    # 第一个任务等待工作进程期间，其他任务仍可启动，也可以取消等待中的任务
+    process, _ = job_queue._start_process(Job.get(Job.job_id == second))
+    assert process.started
+    assert job_queue.cancel(first)
+
+    released.set()
+    thread.join(timeout=5)
+    assert blocking.terminated
+    assert job_queue.get_job(first)["status"] == "cancelled"
@@ -0,0 +1,149 @@
+import sys
+import os
+import time
+
+# 获取当前文件的绝对路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# 找到项目根目录
+project_root = os.path.dirname(current_dir)
+# 将根目录添加到 Python 搜索路径
+sys.path.append(project_root)
+
+from src.ai_write_x.config.config import Config  # noqa 402
+from src.ai_write_x.core.base_framework import (  # noqa 402
+    AgentConfig,
+    ContentType,
+    TaskConfig,
+    WorkflowConfig,
+    WorkflowType,
+)
+from src.ai_write_x.core import llm_cache  # noqa 402
+from src.ai_write_x.core.llm_cache import LLMResponseCache  # noqa 402
+from src.ai_write_x.core.tool_registry import GlobalToolRegistry  # noqa 402
+
+
+def _workflow(llm_config=None):
+    return WorkflowConfig(
+        name="cache_test",
+        description="",
+        workflow_type=WorkflowType.SEQUENTIAL,
+        content_type=ContentType.ARTICLE,
+        agents=[
+            AgentConfig(
+                name="writer",
+                role="writer",
+                goal="write",
+                backstory="writer",
+                llm_config=llm_config or {},
+            )
+        ],
+        tasks=[
+            TaskConfig(
+                name="write",
+                description="写一篇关于{topic}的文章",
+                agent_name="writer",
+                expected_output="文章",
+            )
+        ],
+    )
+
+
+def _use_provider(monkeypatch, api_type, api_base):
+    monkeypatch.setattr(Config, "api_type", property(lambda self: api_type))
+    monkeypatch.setattr(Config, "api_apibase", property(lambda self: api_base))
+    monkeypatch.setattr(Config, "api_model", property(lambda self: "deepseek-chat"))
+
+
+def test_key_depends_on_provider_and_base_url(monkeypatch):
+    inputs = {"topic": "话题"}
+
+    _use_provider(monkeypatch, "DeepSeek", "https://api.deepseek.com")
+    key = LLMResponseCache.make_key(_workflow(), inputs)
+    assert key == LLMResponseCache.make_key(_workflow(), inputs)
+
+    _use_provider(monkeypatch, "OpenRouter", "https://api.deepseek.com")
+    assert LLMResponseCache.make_key(_workflow(), inputs) != key
+
+    _use_provider(monkeypatch, "DeepSeek", "http://localhost:8000/v1")
+    assert LLMResponseCache.make_key(_workflow(), inputs) != key
+
+    # 智能体单独配置的接口地址优先
+    _use_provider(monkeypatch, "DeepSeek", "https://api.deepseek.com")
+    custom = _workflow({"model": "deepseek-chat", "api_base": "http://localhost:8000/v1"})
+    assert LLMResponseCache.make_key(custom, inputs) != key
+
+
+class FakeTool:
+    digest = "v1"
+
+    @classmethod
+    def input_digest(cls):
+        return cls.digest
+
+
+def test_key_depends_on_tool_inputs(monkeypatch):
+    _use_provider(monkeypatch, "DeepSeek", "https://api.deepseek.com")
+    monkeypatch.setitem(GlobalToolRegistry.get_instance()._tools, "FakeTool", FakeTool)
+    workflow = _workflow()
+    workflow.agents[0].tools = ["FakeTool"]
+    inputs = {"topic": "话题"}
+
+    key = LLMResponseCache.make_key(workflow, inputs)
+    assert key != LLMResponseCache.make_key(_workflow(), inputs)
+
+    # 搜索结果或模板内容变化后不再命中旧结果
+    monkeypatch.setattr(FakeTool, "digest", "v2")
+    assert LLMResponseCache.make_key(workflow, inputs) != key
+
+    # 工具输入无法预知时不缓存
+    monkeypatch.setattr(FakeTool, "digest", None)
+    assert LLMResponseCache.make_key(workflow, inputs) is None
+
+
+def _cache(tmp_path, monkeypatch, ttl=3600, max_size_bytes=1024 * 1024):
+    cache = LLMResponseCache(str(tmp_path))
+    settings = {"enabled": True, "ttl": ttl, "max_size_mb": max_size_bytes / 1024 / 1024}
+    monkeypatch.setattr(cache, "settings", lambda: settings)
+    return cache
+
+
+def test_get_set_and_hit_rate(tmp_path, monkeypatch):
+    cache = _cache(tmp_path, monkeypatch)
+
+    assert cache.get("a") is None
+    cache.set("a", "文章A", "cache_test")
+    assert cache.get("a") == "文章A"
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["stores"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+    assert stats["entries"] == 1 and stats["size_bytes"] > 0
+
+
+def test_expired_entry_is_removed(tmp_path, monkeypatch):
+    cache = _cache(tmp_path, monkeypatch, ttl=60)
+    cache.set("a", "文章A")
+    now = time.time()
+    monkeypatch.setattr(llm_cache.time, "time", lambda: now + 120)
+
+    assert cache.get("a") is None
+    assert not (tmp_path / "a.json").exists()
+    assert cache.get_stats()["size_bytes"] == 0
+
+
+def test_evicts_least_recently_used(tmp_path, monkeypatch):
+    cache = _cache(tmp_path, monkeypatch)
+    cache.set("a", "x" * 100)
+    entry_size = cache.get_stats()["size_bytes"]
+    cache = _cache(tmp_path, monkeypatch, max_size_bytes=entry_size * 2)
+    # 新实例从缓存目录读取已有条目的大小
+    assert cache.get_stats()["size_bytes"] == entry_size
+
+    cache.set("b", "y" * 100)
+    assert cache.get("a") == "x" * 100
+    cache.set("c", "z" * 100)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "x" * 100 and cache.get("c") == "z" * 100
+    assert cache.get_stats()["evictions"] == 1
+    assert sorted(p.name for p in tmp_path.glob("*.json")) == ["a.json", "c.json"]
@@ -0,0 +1,99 @@
+import sys
+import os
+import threading
+import time
+
+# 获取当前文件的绝对路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# 找到项目根目录
+project_root = os.path.dirname(current_dir)
+# 将根目录添加到 Python 搜索路径
+sys.path.append(project_root)
+
+os.environ["OTEL_SDK_DISABLED"] = "true"
+os.environ["CREWAI_DISABLE_TELEMETRY"] = "true"
+
+from crewai import Agent, LLM  # noqa 402
+
+from src.ai_write_x.core.base_framework import (  # noqa 402
+    AgentConfig,
+    ContentType,
+    TaskConfig,
+    WorkflowConfig,
+    WorkflowType,
+)
+from src.ai_write_x.core.content_generation import ContentGenerationEngine  # noqa 402
+
+
+DELAY = 0.5
+
+
+class SleepyLLM(LLM):
+    """不访问网络的 LLM：每次调用等待 DELAY 秒，记录调用的起止时间"""
+
+    def call(self, messages, tools=None, callbacks=None, available_functions=None):
+        start = time.monotonic()
+        time.sleep(DELAY)
+        with CALLS_LOCK:
+            CALLS.append((start, time.monotonic()))
+        return "Thought: I now know the final answer\nFinal Answer: done"
+
+
+CALLS = []
+CALLS_LOCK = threading.Lock()
+
+
+class StubEngine(ContentGenerationEngine):
+    def setup_agents(self):
+        return {
+            agent_config.name: Agent(
+                role=agent_config.role,
+                goal=agent_config.goal,
+                backstory=agent_config.backstory,
+                llm=SleepyLLM(model="gpt-4o-mini"),
+                allow_delegation=False,
+                verbose=False,
+            )
+            for agent_config in self.config.agents
+        }
+
+
+def _workflow(tasks):
+    return WorkflowConfig(
+        name="parallel_test",
+        description="",
+        workflow_type=WorkflowType.PARALLEL,
+        content_type=ContentType.ARTICLE,
+        agents=[AgentConfig(name="writer", role="writer", goal="write", backstory="writer")],
+        tasks=tasks,
+    )
+
+
+def _task(name, context=None):
+    return TaskConfig(
+        name=name,
+        description=f"task {name} about {{topic}}",
+        agent_name="writer",
+        expected_output="text",
+        context=context or [],
+    )
+
+
+def test_tasks_in_same_level_overlap():
+    CALLS.clear()
+    engine = StubEngine(
+        _workflow([_task("a"), _task("b"), _task("c"), _task("merge", ["a", "b", "c"])])
+    )
+
+    start = time.monotonic()
+    result = engine._kickoff({"topic": "test"})
+    elapsed = time.monotonic() - start
+
+    assert result == "done"
+    assert [len(level) for level in engine.task_levels] == [3, 1]
+    # 第一层三个任务同时进行，总耗时约为两层各一次调用，而非四次
+    first_level = sorted(CALLS)[:3]
+    assert max(s for s, _ in first_level) < min(e for _, e in first_level)
+    assert elapsed < DELAY * 3.5
+    # 下一层任务通过 context 读取上一层的输出
+    assert engine.tasks["merge"].context == [engine.tasks[n] for n in ("a", "b", "c")]
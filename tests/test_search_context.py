@@ -0,0 +1,68 @@
+import sys
+import os
+from datetime import datetime
+
+# 获取当前文件的绝对路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# 找到项目根目录
+project_root = os.path.dirname(current_dir)
+# 将根目录添加到 Python 搜索路径
+sys.path.append(project_root)
+
+from src.ai_write_x.tools.search_context import (  # noqa 402
+    SearchContextBuilder,
+    estimate_tokens,
+    truncate_to_tokens,
+)
+
+
+REFERENCE_TS = datetime(2026, 10, 17, 12, 0, 0).timestamp()
+HEADER = "关于'台风登陆'的搜索结果：\n\n"
+
+
+def _item(title, body, pub_time="2026-10-16"):
+    return ({"title": title, "abstract": body, "pub_time": pub_time}, body)
+
+
+def test_truncate_to_tokens_respects_budget():
+    text = "台风摩羯今日登陆海南，" * 50
+    truncated = truncate_to_tokens(text, 30)
+    assert estimate_tokens(truncated) <= 30
+    assert text.startswith(truncated)
+    assert truncate_to_tokens("短文本", 30) == "短文本"
+
+
+def test_build_stays_within_budget():
+    items = [
+        _item(f"台风登陆第{i}报", f"第{i}条消息：" + "台风登陆沿海多地停课停运。" * 40)
+        for i in range(8)
+    ]
+    builder = SearchContextBuilder(max_tokens=600, reference_ts=REFERENCE_TS)
+    context = builder.build("台风登陆", HEADER, items)
+
+    assert context.startswith(HEADER)
+    assert estimate_tokens(context) <= 600
+    assert "## 结果 1" in context
+
+
+def test_duplicates_removed_and_relevant_recent_first():
+    body = "台风登陆海南，当地启动一级应急响应，多地停课停运。"
+    items = [
+        _item("股市收盘", "沪指收涨，成交额放大。", "2026-10-16"),
+        _item("台风登陆旧闻", "台风登陆广东，各地做好防御。", "2025-08-01"),
+        _item("台风登陆海南", body, "2026-10-16"),
+        _item("台风登陆海南（转载）", body, "2026-10-16"),
+    ]
+    builder = SearchContextBuilder(max_tokens=2000, reference_ts=REFERENCE_TS)
+    ranked = builder.rank("台风登陆", items)
+
+    titles = [result["title"] for result, _ in ranked]
+    assert titles[0] == "台风登陆海南"
+    assert "台风登陆海南（转载）" not in titles
+    assert titles.index("台风登陆旧闻") < titles.index("股市收盘")
+
+
+def test_build_returns_empty_when_nothing_fits():
+    items = [_item("台风登陆", "台风登陆沿海多地停课停运。" * 40)]
+    builder = SearchContextBuilder(max_tokens=estimate_tokens(HEADER) + 20)
+    assert builder.build("台风登陆", HEADER, items) == ""
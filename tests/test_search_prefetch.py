@@ -0,0 +1,75 @@
+import sys
+import os
+import threading
+import time
+
+# 获取当前文件的绝对路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# 找到项目根目录
+project_root = os.path.dirname(current_dir)
+# 将根目录添加到 Python 搜索路径
+sys.path.append(project_root)
+
+from src.ai_write_x.tools import custom_tool  # noqa 402
+from src.ai_write_x.tools.custom_tool import SearchPrefetcher  # noqa 402
+
+
+def _fake_fetch(delay=0.0, started=None):
+    def fetch(topic, urls):
+        if started is not None:
+            started.set()
+        time.sleep(delay)
+        return [{"title": topic}], "搜索"
+
+    return fetch
+
+
+def test_prefetch_is_keyed_by_run(monkeypatch):
+    monkeypatch.setattr(custom_tool, "fetch_search_results", _fake_fetch())
+    prefetcher = SearchPrefetcher()
+
+    results = {}
+
+    def workflow(topic):
+        with prefetcher.run(topic, []):
+            # Agent 传入的话题措辞与预取时不同，仍取用本次执行的预取
+            results[topic] = prefetcher.take()
+
+    threads = [threading.Thread(target=workflow, args=(t,)) for t in ("话题A", "话题B")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results["话题A"] == ([{"title": "话题A"}], "搜索")
+    assert results["话题B"] == ([{"title": "话题B"}], "搜索")
+    # 不在工作流执行中调用时没有预取
+    assert prefetcher.take() is None
+    assert prefetcher.get_stats()["used"] == 2
+
+
+def test_discard_reports_running_search(monkeypatch):
+    started = threading.Event()
+    monkeypatch.setattr(custom_tool, "fetch_search_results", _fake_fetch(0.3, started))
+    prefetcher = SearchPrefetcher()
+
+    with prefetcher.run("话题", []):
+        assert started.wait(1)
+
+    stats = prefetcher.get_stats()
+    assert stats["discarded"] == 1 and stats["abandoned"] == 1
+    assert stats["abandoned_running"] == 1 and stats["pending"] == 0
+
+    prefetcher._executor.shutdown(wait=True)
+    assert prefetcher.get_stats()["abandoned_running"] == 0
+
+
+def test_peek_leaves_prefetch_for_search_tool(monkeypatch):
+    monkeypatch.setattr(custom_tool, "fetch_search_results", _fake_fetch(0.1))
+    prefetcher = SearchPrefetcher()
+
+    with prefetcher.run("话题", []):
+        # 计算缓存键时等待预取结果，搜索工具随后仍可取用
+        assert prefetcher.peek() == ([{"title": "话题"}], "搜索")
+        assert prefetcher.take() == ([{"title": "话题"}], "搜索")
+        assert prefetcher.peek() is None
@@ -0,0 +1,89 @@
+import sys
+import os
+
+# 获取当前文件的绝对路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# 找到项目根目录
+project_root = os.path.dirname(current_dir)
+# 将根目录添加到 Python 搜索路径
+sys.path.append(project_root)
+
+from litellm import ModelResponse  # noqa 402
+from litellm.types.utils import Delta, StreamingChoices  # noqa 402
+
+from src.ai_write_x.core import streaming  # noqa 402
+from src.ai_write_x.core.streaming import StreamingLLM, StreamRelay  # noqa 402
+
+
+def _chunk(text, finish_reason=None):
+    return ModelResponse(
+        stream=True,
+        model="gpt-4o-mini",
+        choices=[
+            StreamingChoices(
+                delta=Delta(content=text, role="assistant"), finish_reason=finish_reason
+            )
+        ],
+    )
+
+
+class UsageCallback:
+    def __init__(self):
+        self.usage = []
+
+    def log_success_event(self, kwargs, response_obj, start_time, end_time):
+        self.usage.append(response_obj["usage"])
+
+
+def test_streaming_llm_relays_chunks(monkeypatch):
+    requests, relayed = [], []
+
+    def fake_completion(**params):
+        requests.append(params)
+        return iter([_chunk("你好"), _chunk(None), _chunk("，世界", "stop")])
+
+    monkeypatch.setattr(streaming.litellm, "completion", fake_completion)
+    monkeypatch.setattr(streaming.log, "print_stream", lambda c, s="": relayed.append((c, s)))
+
+    callback = UsageCallback()
+    llm = StreamingLLM(model="gpt-4o-mini", api_key="test-key", stream=True)
+    with StreamRelay.stage("writer"):
+        result = llm.call("写一篇文章", callbacks=[callback])
+
+    assert result == "你好，世界"
+    assert relayed == [("你好", "writer"), ("，世界", "writer")]
+    assert requests[0]["stream"] is True
+    # 由片段重建的响应带有 usage，token 统计回调照常生效
+    assert callback.usage and callback.usage[0].total_tokens > 0
+
+
+def test_plain_llm_calls_are_not_streamed(monkeypatch):
+    requests = []
+
+    def fake_completion(**params):
+        requests.append(params)
+        if params["stream"]:
+            return iter([_chunk("流式回复", "stop")])
+        message = {"role": "assistant", "content": "完整回复"}
+        return ModelResponse(model="gpt-4o-mini", choices=[{"message": message}])
+
+    monkeypatch.setattr(streaming.litellm, "completion", fake_completion)
+    monkeypatch.setattr(streaming.log, "print_stream", lambda c, s="": None)
+
+    assert StreamingLLM(model="gpt-4o-mini", api_key="test-key").call("预热") == "流式回复"
+    # 流式包装已安装，普通 LLM 的请求仍按原样发出
+    assert streaming.LLM(model="gpt-4o-mini", api_key="test-key").call("写") == "完整回复"
+    assert requests[-1]["stream"] is False
+
+
+def test_streaming_llm_keeps_tool_calls_unstreamed(monkeypatch):
+    monkeypatch.setattr(streaming.LLM, "call", lambda self, *args, **kwargs: "tool result")
+    llm = StreamingLLM(model="gpt-4o-mini", api_key="test-key")
+    assert llm.call("查询", tools=[{"name": "search"}]) == "tool result"
+
+
+def test_llm_class_matches_crewai_version():
+    if StreamRelay.has_stream_events():
+        assert StreamRelay.llm_class() is streaming.LLM
+    else:
+        assert StreamRelay.llm_class() is StreamingLLM
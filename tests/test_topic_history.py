@@ -0,0 +1,68 @@
+import sys
+import os
+import time
+
+# 获取当前文件的绝对路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# 找到项目根目录
+project_root = os.path.dirname(current_dir)
+# 将根目录添加到 Python 搜索路径
+sys.path.append(project_root)
+
+from src.ai_write_x.utils.topic_history import TopicHistory  # noqa 402
+
+
+def test_covered_within_window(tmp_path):
+    history = TopicHistory(str(tmp_path / "history.db"))
+    history.record("国产大飞机C919完成首次商业飞行", "微博")
+
+    assert history.is_covered("国产大飞机C919完成首次商业飞行！", 7, 0.6)
+    assert history.is_covered("C919国产大飞机完成首次商业飞行", 7, 0.6)
+    assert not history.is_covered("多地发布高温橙色预警", 7, 0.6)
+
+
+def test_window_excludes_old_topics(tmp_path):
+    history = TopicHistory(str(tmp_path / "history.db"))
+    history.record("多地发布高温橙色预警", created_at=time.time() - 10 * 86400)
+
+    assert not history.is_covered("多地发布高温橙色预警", 7, 0.6)
+    assert history.is_covered("多地发布高温橙色预警", 0, 0.6)
+
+    history.prune(7)
+    assert history.count() == 0
+
+
+def test_import_article_dir_strips_platform_prefix(tmp_path):
+    article_dir = tmp_path / "article"
+    article_dir.mkdir()
+    (article_dir / "微博_多地发布高温橙色预警.html").write_text("<p></p>", encoding="utf-8")
+    (article_dir / "国产大飞机完成首飞.md").write_text("", encoding="utf-8")
+
+    history = TopicHistory(str(tmp_path / "history.db"))
+    assert history.import_article_dir(article_dir, ["微博", "抖音"]) == 2
+    assert {item["title"] for item in history.recent()} == {
+        "多地发布高温橙色预警",
+        "国产大飞机完成首飞",
+    }
+
+
+def test_window_compares_many_titles_with_one_query(tmp_path):
+    history = TopicHistory(str(tmp_path / "history.db"))
+    history.record("国产大飞机C919完成首次商业飞行", "微博")
+    history.record("多地发布高温橙色预警", created_at=time.time() - 10 * 86400)
+
+    window = history.window(7)
+    assert len(window) == 1
+    assert window.is_covered("C919国产大飞机完成首次商业飞行", 0.6)
+    assert window.max_similarity("国产大飞机C919完成首次商业飞行！") == 1.0
+    assert window.max_similarity("多地发布高温橙色预警") == 0.0
+    # 与历史话题没有共同片段时无需比较
+    assert window.max_similarity("股市收盘") == 0.0
+
+
+def test_prune_keeps_everything_when_disabled(tmp_path):
+    history = TopicHistory(str(tmp_path / "history.db"))
+    history.record("多地发布高温橙色预警", created_at=time.time() - 400 * 86400)
+
+    history.prune(0)
+    assert history.count() == 1
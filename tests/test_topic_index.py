@@ -0,0 +1,89 @@
+import sys
+import os
+import random
+
+# 获取当前文件的绝对路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# 找到项目根目录
+project_root = os.path.dirname(current_dir)
+# 将根目录添加到 Python 搜索路径
+sys.path.append(project_root)
+
+from src.ai_write_x.utils.topic_index import (  # noqa 402
+    TopicIndex,
+    jaccard,
+    parse_heat,
+    shingles,
+)
+
+
+def _build_index():
+    index = TopicIndex()
+    index.add_platform(
+        "微博",
+        [
+            {"name": "台风摩羯登陆海南", "rank": 1, "lastCount": "120万"},
+            {"name": "某明星官宣结婚", "rank": 2, "lastCount": "80万"},
+        ],
+    )
+    index.add_platform("抖音", ["某明星官宣结婚了", "台风摩羯今日登陆海南", "新款手机发布"])
+    index.add_platform("百度热点", ["台风“摩羯”登陆海南"])
+    return index
+
+
+def test_near_duplicates_are_merged():
+    clusters = _build_index().build()
+    assert len(clusters) == 3
+
+    typhoon = clusters[0]
+    assert typhoon.title == "台风摩羯登陆海南"
+    assert typhoon.platforms == {"微博": 1, "抖音": 2, "百度热点": 1}
+    assert len(typhoon.titles) == 3
+
+
+def test_cross_platform_topics_rank_higher():
+    titles = [c.title for c in _build_index().top(3)]
+    assert titles[-1] == "新款手机发布"
+
+
+def test_pairs_above_threshold_are_always_merged():
+    # 构造大量相似度刚超过阈值的标题对，模拟约 330 条热搜的规模
+    rng = random.Random(7)
+    chars = [chr(c) for c in range(0x4E00, 0x4E00 + 3000)]
+    pairs = []
+    while len(pairs) < 165:
+        title = "".join(rng.choices(chars, k=12))
+        variant = list(title)
+        variant[rng.randrange(2, 10)] = rng.choice(chars)
+        variant = "".join(variant)
+        if 0.5 <= jaccard(shingles(title), shingles(variant)) < 0.7:
+            pairs.append((title, variant))
+
+    index = TopicIndex(threshold=0.5)
+    index.add_platform("微博", [a for a, _ in pairs])
+    index.add_platform("抖音", [b for _, b in pairs])
+    cluster_of = {title: i for i, c in enumerate(index.build()) for title in c.titles}
+
+    assert all(cluster_of[a] == cluster_of[b] for a, b in pairs)
+    assert len(index.clusters) == len(pairs)
+
+
+def test_platform_weight_affects_score():
+    index = TopicIndex()
+    index.add_platform("微博", ["话题甲"], weight=0.1)
+    index.add_platform("抖音", ["完全不同的话题乙"], weight=1.0)
+    assert index.top(1)[0].title == "完全不同的话题乙"
+
+
+def test_sample_excludes_titles():
+    index = _build_index()
+    for _ in range(20):
+        cluster = index.sample(exclude={"台风摩羯今日登陆海南", "某明星官宣结婚"})
+        assert cluster is not None and cluster.title == "新款手机发布"
+
+
+def test_parse_heat():
+    assert parse_heat("12.5万") == 125000
+    assert parse_heat("1.2亿") == 120000000
+    assert parse_heat(300) == 300
+    assert parse_heat(None) == 0
@@ -0,0 +1,43 @@
+import sys
+import os
+import time
+
+# 获取当前文件的绝对路径
+current_dir = os.path.dirname(os.path.abspath(__file__))
+# 找到项目根目录
+project_root = os.path.dirname(current_dir)
+# 将根目录添加到 Python 搜索路径
+sys.path.append(project_root)
+
+from src.ai_write_x.tools import web_cache  # noqa 402
+from src.ai_write_x.tools.web_cache import WebContentCache  # noqa 402
+
+
+def _cache(tmp_path, monkeypatch):
+    cache = WebContentCache(str(tmp_path))
+    settings = {"enabled": True, "page_ttl": 60, "search_ttl": 60, "max_size_mb": 1}
+    monkeypatch.setattr(cache, "settings", lambda: settings)
+    return cache
+
+
+def test_stale_entry_with_validator_is_kept_for_revalidation(tmp_path, monkeypatch):
+    cache = _cache(tmp_path, monkeypatch)
+    with_etag = cache.page_key("https://example.com/a#comments")
+    without_etag = cache.page_key("https://example.com/b")
+    cache.set(with_etag, {"title": "A"}, etag='"v1"')
+    cache.set(without_etag, {"title": "B"})
+    assert cache.get(cache.page_key("https://example.com/a")) == {"title": "A"}
+
+    now = time.time()
+    monkeypatch.setattr(web_cache.time, "time", lambda: now + 120)
+
+    # 过期但带 ETag 的条目保留用于条件请求，不带校验信息的直接删除
+    entry = cache.lookup(with_etag)
+    assert not entry["fresh"]
+    assert WebContentCache.conditional_headers(entry) == {"If-None-Match": '"v1"'}
+    assert cache.lookup(without_etag) is None
+    assert cache.get_stats()["entries"] == 1
+
+    cache.revalidated(with_etag, entry)
+    assert cache.get(with_etag) == {"title": "A"}
+    assert cache.get_stats()["revalidated"] == 1